@@ -1,5 +1,8 @@
+import asyncio
 import shutil
 import subprocess
+import threading
+import time
 from typing import Any, Dict, List, Literal, Optional, Sequence, Type, Union
 
 from pydantic import Field, InstanceOf, PrivateAttr, model_validator
@@ -40,6 +43,11 @@ from crewai.utilities.events.knowledge_events import (
     KnowledgeRetrievalStartedEvent,
     KnowledgeSearchQueryFailedEvent,
 )
+from crewai.utilities.execution_service import (
+    CancellationToken,
+    ExecutionCancelledError,
+    execution_service,
+)
 from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
@@ -62,6 +70,9 @@ class Agent(BaseAgent):
             function_calling_llm: The language model that will handle the tool calling for this agent, it overrides the crew function_calling_llm.
             max_iter: Maximum number of iterations for an agent to execute a task.
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
+            max_tpm: Maximum number of LLM tokens per minute for the agent execution to be respected.
+            rate_limit_storage_path: Path of a SQLite database sharing the max_rpm/max_tpm budget across processes.
+            rate_limit_key: Name of the budget shared through rate_limit_storage_path.
             verbose: Whether the agent execution should be in verbose mode.
             allow_delegation: Whether the agent is allowed to delegate tasks to other agents.
             tools: Tools at agents disposal
@@ -199,6 +210,16 @@ class Agent(BaseAgent):
                         embedder=self.embedder,
                         collection_name=self.role,
                         storage=self.knowledge_storage or None,
+                        vector_store=(
+                            self.knowledge_config.vector_store
+                            if self.knowledge_config
+                            else "chroma"
+                        ),
+                        purge_removed_files=(
+                            self.knowledge_config.purge_removed_files
+                            if self.knowledge_config
+                            else False
+                        ),
                     )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid Knowledge Configuration: {str(e)}")
@@ -241,6 +262,140 @@ class Agent(BaseAgent):
             ValueError: If the max execution time is not a positive integer.
             RuntimeError: If the agent execution fails for other reasons.
         """
+        task_prompt = self._prepare_task_execution(task, context, tools)
+
+        try:
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionStartedEvent(
+                    agent=self,
+                    tools=self.tools,
+                    task_prompt=task_prompt,
+                    task=task,
+                ),
+            )
+
+            # Determine execution method based on timeout setting
+            if self.max_execution_time is not None:
+                if (
+                    not isinstance(self.max_execution_time, int)
+                    or self.max_execution_time <= 0
+                ):
+                    raise ValueError(
+                        "Max Execution time must be a positive integer greater than zero"
+                    )
+                result = self._execute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = self._execute_without_timeout(task_prompt, task)
+
+        except TimeoutError as e:
+            # Propagate TimeoutError without retry
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionErrorEvent(
+                    agent=self,
+                    task=task,
+                    error=str(e),
+                ),
+            )
+            raise e
+        except Exception as e:
+            if not self._should_retry_execution(task, e):
+                raise e
+            result = self.execute_task(task, context, tools)
+
+        return self._complete_task_execution(task, result)
+
+    async def aexecute_task(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Asynchronously execute a task with the agent.
+
+        The prompt preparation (reasoning, memory and knowledge retrieval) runs
+        in a worker thread, while the agent loop awaits the LLM natively so many
+        executions can share a single event loop.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+
+        Raises:
+            TimeoutError: If execution exceeds the maximum execution time.
+            ValueError: If the max execution time is not a positive integer.
+            RuntimeError: If the agent execution fails for other reasons.
+        """
+        task_prompt = await asyncio.to_thread(
+            self._prepare_task_execution, task, context, tools
+        )
+
+        try:
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionStartedEvent(
+                    agent=self,
+                    tools=self.tools,
+                    task_prompt=task_prompt,
+                    task=task,
+                ),
+            )
+
+            if self.max_execution_time is not None:
+                if (
+                    not isinstance(self.max_execution_time, int)
+                    or self.max_execution_time <= 0
+                ):
+                    raise ValueError(
+                        "Max Execution time must be a positive integer greater than zero"
+                    )
+                result = await self._aexecute_with_timeout(
+                    task_prompt, task, self.max_execution_time
+                )
+            else:
+                result = await self._aexecute_without_timeout(task_prompt, task)
+
+        except TimeoutError as e:
+            # Propagate TimeoutError without retry
+            crewai_event_bus.emit(
+                self,
+                event=AgentExecutionErrorEvent(
+                    agent=self,
+                    task=task,
+                    error=str(e),
+                ),
+            )
+            raise e
+        except Exception as e:
+            if not self._should_retry_execution(task, e):
+                raise e
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._complete_task_execution(task, result)
+
+    def _prepare_task_execution(
+        self,
+        task: Task,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Build the task prompt and create the agent executor for the task.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            The prompt to send to the agent.
+        """
         if self.reasoning:
             try:
                 from crewai.utilities.reasoning_handler import AgentReasoning, AgentReasoningOutput
@@ -299,7 +454,9 @@ class Agent(BaseAgent):
             if memory.strip() != "":
                 task_prompt += self.i18n.slice("memory").format(memory=memory)
         knowledge_config = (
-            self.knowledge_config.model_dump() if self.knowledge_config else {}
+            self.knowledge_config.model_dump(exclude={"vector_store"})
+            if self.knowledge_config
+            else {}
         )
 
         if self.knowledge:
@@ -369,69 +526,40 @@ class Agent(BaseAgent):
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
-        try:
+        return task_prompt
+
+    def _should_retry_execution(self, task: Task, error: Exception) -> bool:
+        """Check whether a failed execution should be retried.
+
+        Emits an AgentExecutionErrorEvent when the error is not retried.
+        """
+        if error.__class__.__module__.startswith("litellm"):
+            # Do not retry on litellm errors
             crewai_event_bus.emit(
                 self,
-                event=AgentExecutionStartedEvent(
+                event=AgentExecutionErrorEvent(
                     agent=self,
-                    tools=self.tools,
-                    task_prompt=task_prompt,
                     task=task,
+                    error=str(error),
                 ),
             )
-
-            # Determine execution method based on timeout setting
-            if self.max_execution_time is not None:
-                if (
-                    not isinstance(self.max_execution_time, int)
-                    or self.max_execution_time <= 0
-                ):
-                    raise ValueError(
-                        "Max Execution time must be a positive integer greater than zero"
-                    )
-                result = self._execute_with_timeout(
-                    task_prompt, task, self.max_execution_time
-                )
-            else:
-                result = self._execute_without_timeout(task_prompt, task)
-
-        except TimeoutError as e:
-            # Propagate TimeoutError without retry
+            return False
+        self._times_executed += 1
+        if self._times_executed > self.max_retry_limit:
             crewai_event_bus.emit(
                 self,
                 event=AgentExecutionErrorEvent(
                     agent=self,
                     task=task,
-                    error=str(e),
+                    error=str(error),
                 ),
             )
-            raise e
-        except Exception as e:
-            if e.__class__.__module__.startswith("litellm"):
-                # Do not retry on litellm errors
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                crewai_event_bus.emit(
-                    self,
-                    event=AgentExecutionErrorEvent(
-                        agent=self,
-                        task=task,
-                        error=str(e),
-                    ),
-                )
-                raise e
-            result = self.execute_task(task, context, tools)
+            return False
+        return True
 
-        if self.max_rpm and self._rpm_controller:
+    def _complete_task_execution(self, task: Task, result: str) -> str:
+        """Finish the task execution and emit the completion event."""
+        if (self.max_rpm or self.max_tpm) and self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
         # If there was any tool in self.tools_results that had result_as_answer
@@ -463,21 +591,35 @@ class Agent(BaseAgent):
         """
         import concurrent.futures
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                self._execute_without_timeout, task_prompt=task_prompt, task=task
-            )
+        cancellation_token = CancellationToken()
+        self.agent_executor.cancellation_token = cancellation_token
+        started = threading.Event()
 
-            try:
-                return future.result(timeout=timeout)
-            except concurrent.futures.TimeoutError:
-                future.cancel()
-                raise TimeoutError(
-                    f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
-                )
-            except Exception as e:
-                future.cancel()
-                raise RuntimeError(f"Task execution failed: {str(e)}")
+        def run() -> str:
+            # The time spent waiting for a free worker doesn't count.
+            cancellation_token.deadline = time.monotonic() + timeout
+            started.set()
+            return self._execute_without_timeout(task_prompt, task)
+
+        future = execution_service.submit(run)
+
+        try:
+            # A job still queued once the timeout has passed is dropped.
+            if not started.wait(timeout=timeout) and future.cancel():
+                raise concurrent.futures.TimeoutError()
+            return future.result(timeout=timeout)
+        except (concurrent.futures.TimeoutError, ExecutionCancelledError):
+            # The running thread can't be killed, the agent loop stops at its
+            # next iteration once it sees the cancelled token.
+            cancellation_token.cancel()
+            future.cancel()
+            raise TimeoutError(
+                f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
+            )
+        except Exception as e:
+            cancellation_token.cancel()
+            future.cancel()
+            raise RuntimeError(f"Task execution failed: {str(e)}")
 
     def _execute_without_timeout(self, task_prompt: str, task: Task) -> str:
         """Execute a task without a timeout.
@@ -498,6 +640,59 @@ class Agent(BaseAgent):
             }
         )["output"]
 
+    async def _aexecute_with_timeout(
+        self, task_prompt: str, task: Task, timeout: int
+    ) -> str:
+        """Asynchronously execute a task with a timeout.
+
+        Unlike the threaded version, the agent loop is cancelled once the
+        timeout expires.
+
+        Args:
+            task_prompt: The prompt to send to the agent.
+            task: The task being executed.
+            timeout: Maximum execution time in seconds.
+
+        Returns:
+            The output of the agent.
+
+        Raises:
+            TimeoutError: If execution exceeds the timeout.
+            RuntimeError: If execution fails for other reasons.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._aexecute_without_timeout(task_prompt=task_prompt, task=task),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Task '{task.description}' execution timed out after {timeout} seconds. Consider increasing max_execution_time or optimizing the task."
+            )
+        except Exception as e:
+            raise RuntimeError(f"Task execution failed: {str(e)}")
+
+    async def _aexecute_without_timeout(self, task_prompt: str, task: Task) -> str:
+        """Asynchronously execute a task without a timeout.
+
+        Args:
+            task_prompt: The prompt to send to the agent.
+            task: The task being executed.
+
+        Returns:
+            The output of the agent.
+        """
+        return (
+            await self.agent_executor.ainvoke(
+                {
+                    "input": task_prompt,
+                    "tool_names": self.agent_executor.tools_names,
+                    "tools": self.agent_executor.tools_description,
+                    "ask_for_human_input": task.human_input,
+                }
+            )
+        )["output"]
+
     def create_agent_executor(
         self, tools: Optional[List[BaseTool]] = None, task=None
     ) -> None:
@@ -545,7 +740,10 @@ class Agent(BaseAgent):
             request_within_rpm_limit=(
                 self._rpm_controller.check_or_wait if self._rpm_controller else None
             ),
-            callbacks=[TokenCalcHandler(self._token_process)],
+            arequest_within_rpm_limit=(
+                self._rpm_controller.acheck_or_wait if self._rpm_controller else None
+            ),
+            callbacks=[TokenCalcHandler(self._token_process, self._rpm_controller)],
         )
 
     def get_delegation_tools(self, agents: List[BaseAgent]):
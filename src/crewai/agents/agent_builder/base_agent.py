@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -43,6 +44,9 @@ class BaseAgent(ABC, BaseModel):
         config (Optional[Dict[str, Any]]): Configuration for the agent.
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (Optional[int]): Maximum number of requests per minute for the agent execution.
+        max_tpm (Optional[int]): Maximum number of LLM tokens per minute for the agent execution.
+        rate_limit_storage_path (Optional[str]): Path of a SQLite database sharing the max_rpm/max_tpm budget across processes.
+        rate_limit_key (str): Name of the budget shared through rate_limit_storage_path.
         allow_delegation (bool): Allow delegation of tasks to agents.
         tools (Optional[List[Any]]): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
@@ -104,6 +108,18 @@ class BaseAgent(ABC, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the agent execution to be respected.",
+    )
+    rate_limit_storage_path: Optional[str] = Field(
+        default=None,
+        description="Path of a SQLite database sharing the max_rpm/max_tpm budget across processes.",
+    )
+    rate_limit_key: str = Field(
+        default="default",
+        description="Name of the budget shared through rate_limit_storage_path.",
+    )
     allow_delegation: bool = Field(
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
@@ -206,9 +222,13 @@ class BaseAgent(ABC, BaseModel):
 
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm,
+                max_tpm=self.max_tpm,
+                storage_path=self.rate_limit_storage_path,
+                key=self.rate_limit_key,
+                logger=self._logger,
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -231,9 +251,13 @@ class BaseAgent(ABC, BaseModel):
     def set_private_attrs(self):
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm,
+                max_tpm=self.max_tpm,
+                storage_path=self.rate_limit_storage_path,
+                key=self.rate_limit_key,
+                logger=self._logger,
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -257,6 +281,15 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> str:
+        """Asynchronously execute a task, running execute_task in a worker thread by default."""
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -1,8 +1,9 @@
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.memory_writer import MemoryWriter
 from crewai.utilities import I18N
 from crewai.utilities.converter import ConverterError
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -30,22 +31,26 @@ class CrewAgentExecutorMixin:
             and self.agent
             and self.task
             and "Action: Delegate work to coworker" not in output.text
+            and hasattr(self.crew, "_short_term_memory")
+            and self.crew._short_term_memory
         ):
-            try:
-                if (
-                    hasattr(self.crew, "_short_term_memory")
-                    and self.crew._short_term_memory
-                ):
-                    self.crew._short_term_memory.save(
-                        value=output.text,
+            short_term_memory = self.crew._short_term_memory
+            text, description = output.text, self.task.description
+            role = self.agent.role
+
+            def write() -> None:
+                try:
+                    short_term_memory.save(
+                        value=text,
                         metadata={
-                            "observation": self.task.description,
+                            "observation": description,
                         },
-                        agent=self.agent.role,
+                        agent=role,
                     )
-            except Exception as e:
-                print(f"Failed to add to short term memory: {e}")
-                pass
+                except Exception as e:
+                    print(f"Failed to add to short term memory: {e}")
+
+            self._write_memory(write)
 
     def _create_external_memory(self, output) -> None:
         """Create and save a external-term memory item if conditions are met."""
@@ -56,17 +61,23 @@ class CrewAgentExecutorMixin:
             and hasattr(self.crew, "_external_memory")
             and self.crew._external_memory
         ):
-            try:
-                self.crew._external_memory.save(
-                    value=output.text,
-                    metadata={
-                        "description": self.task.description,
-                    },
-                    agent=self.agent.role,
-                )
-            except Exception as e:
-                print(f"Failed to add to external memory: {e}")
-                pass
+            external_memory = self.crew._external_memory
+            text, description = output.text, self.task.description
+            role = self.agent.role
+
+            def write() -> None:
+                try:
+                    external_memory.save(
+                        value=text,
+                        metadata={
+                            "description": description,
+                        },
+                        agent=role,
+                    )
+                except Exception as e:
+                    print(f"Failed to add to external memory: {e}")
+
+            self._write_memory(write)
 
     def _create_long_term_memory(self, output) -> None:
         """Create and save long-term and entity memory items based on evaluation."""
@@ -77,42 +88,51 @@ class CrewAgentExecutorMixin:
             and self.task
             and self.agent
         ):
-            try:
-                ltm_agent = TaskEvaluator(self.agent)
-                evaluation = ltm_agent.evaluate(self.task, output.text)
-
-                if isinstance(evaluation, ConverterError):
-                    return
-
-                long_term_memory = LongTermMemoryItem(
-                    task=self.task.description,
-                    agent=self.agent.role,
-                    quality=evaluation.quality,
-                    datetime=str(time.time()),
-                    expected_output=self.task.expected_output,
-                    metadata={
-                        "suggestions": evaluation.suggestions,
-                        "quality": evaluation.quality,
-                    },
-                )
-                self.crew._long_term_memory.save(long_term_memory)
-
-                for entity in evaluation.entities:
-                    entity_memory = EntityMemoryItem(
-                        name=entity.name,
-                        type=entity.type,
-                        description=entity.description,
-                        relationships="\n".join(
-                            [f"- {r}" for r in entity.relationships]
-                        ),
+            long_term_memory = self.crew._long_term_memory
+            entity_memory = self.crew._entity_memory
+            agent, task, text = self.agent, self.task, output.text
+
+            def write() -> None:
+                try:
+                    ltm_agent = TaskEvaluator(agent)
+                    evaluation = ltm_agent.evaluate(task, text)
+
+                    if isinstance(evaluation, ConverterError):
+                        return
+
+                    long_term_memory.save(
+                        LongTermMemoryItem(
+                            task=task.description,
+                            agent=agent.role,
+                            quality=evaluation.quality,
+                            datetime=str(time.time()),
+                            expected_output=task.expected_output,
+                            metadata={
+                                "suggestions": evaluation.suggestions,
+                                "quality": evaluation.quality,
+                            },
+                        )
+                    )
+
+                    entity_memory.save_many(
+                        [
+                            EntityMemoryItem(
+                                name=entity.name,
+                                type=entity.type,
+                                description=entity.description,
+                                relationships="\n".join(
+                                    [f"- {r}" for r in entity.relationships]
+                                ),
+                            )
+                            for entity in evaluation.entities
+                        ]
                     )
-                    self.crew._entity_memory.save(entity_memory)
-            except AttributeError as e:
-                print(f"Missing attributes for long term memory: {e}")
-                pass
-            except Exception as e:
-                print(f"Failed to add to long term memory: {e}")
-                pass
+                except AttributeError as e:
+                    print(f"Missing attributes for long term memory: {e}")
+                except Exception as e:
+                    print(f"Failed to add to long term memory: {e}")
+
+            self._write_memory(write)
         elif (
             self.crew
             and self.crew._long_term_memory
@@ -123,6 +143,14 @@ class CrewAgentExecutorMixin:
                 color="bold_yellow",
             )
 
+    def _write_memory(self, write: Callable[[], None]) -> None:
+        """Run ``write`` now, or queue it when the crew writes memories behind."""
+        memory_writer = getattr(self.crew, "_memory_writer", None)
+        if isinstance(memory_writer, MemoryWriter):
+            memory_writer.submit(write)
+        else:
+            write()
+
     def _ask_human_input(self, final_answer: str) -> str:
         """Prompt human input with mode-appropriate messaging."""
         self._printer.print(
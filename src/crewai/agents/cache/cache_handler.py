@@ -1,15 +1,154 @@
-from typing import Any, Dict, Optional
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import SQLitePool, sqlite_pool
+
+MIGRATIONS = [
+    # Earlier versions pickled the outputs, which aren't loaded anymore.
+    "DROP TABLE IF EXISTS tool_cache",
+    """
+    CREATE TABLE tool_cache (
+        key TEXT PRIMARY KEY,
+        output TEXT NOT NULL,
+        expires_at REAL
+    )
+    """,
+]
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """Bounded LRU cache for tool results.
+
+    Entries are keyed by a hash of the tool name and its canonicalised input,
+    so argument dicts that only differ in key order share an entry. When
+    ``storage_path`` is set, results are also written to a SQLite database
+    and survive across kickoffs. Only JSON-serializable results are written
+    there, as JSON, so reading the database never runs code from it.
+    """
+
+    max_size: int = Field(
+        default=1024, description="Maximum number of entries kept in memory."
+    )
+    ttl: Optional[float] = Field(
+        default=None,
+        description="Default time to live in seconds for an entry, None keeps it until evicted.",
+    )
+    tool_ttls: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Time to live in seconds per tool name, overriding ttl.",
+    )
+    storage_path: Optional[str] = Field(
+        default=None,
+        description="Path of a SQLite database used as an on-disk tier. Set to an empty string to use the default location.",
+    )
+    hits: int = Field(default=0, description="Number of reads served by the cache.")
+    misses: int = Field(default=0, description="Number of reads not in the cache.")
+    evictions: int = Field(
+        default=0, description="Number of entries dropped to respect max_size."
+    )
+
+    _cache: "OrderedDict[str, Tuple[Any, Optional[float]]]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _pool: Optional[SQLitePool] = PrivateAttr(default=None)
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    @model_validator(mode="after")
+    def initialize_storage(self):
+        if self.storage_path is not None:
+            db_path = self.storage_path or str(
+                Path(db_storage_path()) / "tool_cache.db"
+            )
+            self._pool = sqlite_pool(db_path)
+            self._pool.migrate("tool_cache", MIGRATIONS)
+        return self
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        key = self._key(tool, input)
+        ttl = self.tool_ttls.get(tool, self.ttl)
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._store(key, output, expires_at)
+        if self._pool is None:
+            return
+        try:
+            output_json = json.dumps(output)
+        except (TypeError, ValueError):
+            # Kept in memory only
+            return
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tool_cache (key, output, expires_at) VALUES (?, ?, ?)",
+                (key, output_json, expires_at),
+            )
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self._key(tool, input)
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                output, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return output
+                del self._cache[key]
+
+        entry = self._read_from_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self._store(key, *entry)
+            self.hits += 1
+            return entry[0]
+
+    def clear(self) -> None:
+        """Drop every entry, including the on-disk tier."""
+        with self._lock:
+            self._cache.clear()
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                conn.execute("DELETE FROM tool_cache")
+
+    def _store(self, key: str, output: Any, expires_at: Optional[float]) -> None:
+        self._cache[key] = (output, expires_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def _read_from_disk(
+        self, key: str, now: float
+    ) -> Optional[Tuple[Any, Optional[float]]]:
+        if self._pool is None:
+            return None
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT output, expires_at FROM tool_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                return None
+        return json.loads(row[0]), row[1]
+
+    @staticmethod
+    def _key(tool: str, input: Any) -> str:
+        if isinstance(input, str):
+            try:
+                input = json.loads(input)
+            except json.JSONDecodeError:
+                pass
+        canonical = json.dumps(input, sort_keys=True, default=str)
+        return hashlib.sha256(f"{tool}\x00{canonical}".encode()).hexdigest()
@@ -1,13 +1,17 @@
+import asyncio
 import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
 from crewai.agents.parser import (
     AgentAction,
     AgentFinish,
+    CrewAgentParser,
     OutputParserException,
+    StreamingAgentParser,
 )
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.llm import BaseLLM
@@ -16,6 +20,7 @@ from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
 from crewai.utilities.agent_utils import (
+    aget_llm_response,
     enforce_rpm_limit,
     format_message_for_llm,
     get_llm_response,
@@ -29,7 +34,16 @@ from crewai.utilities.agent_utils import (
     process_llm_response,
     show_agent_logs,
 )
-from crewai.utilities.constants import MAX_LLM_RETRY, TRAINING_DATA_FILE
+from crewai.utilities.constants import (
+    MAX_LLM_RETRY,
+    MAX_PARALLEL_TOOL_CALLS,
+    TRAINING_DATA_FILE,
+)
+from crewai.utilities.context_window_manager import ContextWindowManager
+from crewai.utilities.execution_service import (
+    CancellationToken,
+    ExecutionCancelledError,
+)
 from crewai.utilities.logger import Logger
 from crewai.utilities.tool_utils import execute_tool_and_check_finality
 from crewai.utilities.training_handler import CrewTrainingHandler
@@ -56,6 +70,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         function_calling_llm: Any = None,
         respect_context_window: bool = False,
         request_within_rpm_limit: Optional[Callable[[], bool]] = None,
+        arequest_within_rpm_limit: Optional[Callable[[], Awaitable[bool]]] = None,
         callbacks: List[Any] = [],
     ):
         self._i18n: I18N = I18N()
@@ -78,8 +93,13 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.function_calling_llm = function_calling_llm
         self.respect_context_window = respect_context_window
         self.request_within_rpm_limit = request_within_rpm_limit
+        self.arequest_within_rpm_limit = arequest_within_rpm_limit
         self.ask_for_human_input = False
+        self.cancellation_token: Optional[CancellationToken] = None
         self.messages: List[Dict[str, str]] = []
+        self.context_window_manager = ContextWindowManager(self.llm, self._i18n)
+        # Created on the first batch of tool calls and reused by the next ones.
+        self._tool_pool: Optional[ThreadPoolExecutor] = None
         self.iterations = 0
         self.log_error_after = 3
         self.tool_name_to_tool_map: Dict[str, Union[CrewStructuredTool, BaseTool]] = {
@@ -95,21 +115,12 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         )
 
     def invoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
-        if "system" in self.prompt:
-            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
-            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
-            self.messages.append(format_message_for_llm(system_prompt, role="system"))
-            self.messages.append(format_message_for_llm(user_prompt))
-        else:
-            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
-            self.messages.append(format_message_for_llm(user_prompt))
-
-        self._show_start_logs()
-
-        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+        self._setup_messages(inputs)
 
         try:
             formatted_answer = self._invoke_loop()
+        except ExecutionCancelledError:
+            raise
         except AssertionError:
             self._printer.print(
                 content="Agent failed to reach a final answer. This is likely a bug - please report it.",
@@ -124,13 +135,60 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             else:
                 raise e
 
+        formatted_answer = self._complete_invoke(formatted_answer)
+        return {"output": formatted_answer.output}
+
+    async def ainvoke(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Asynchronous counterpart of :meth:`invoke`.
+
+        LLM calls are awaited on the running event loop, while tool executions,
+        summarization and memory writes run in worker threads.
+        """
+        self._setup_messages(inputs)
+
+        try:
+            formatted_answer = await self._ainvoke_loop()
+        except ExecutionCancelledError:
+            raise
+        except AssertionError:
+            self._printer.print(
+                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+                color="red",
+            )
+            raise
+        except Exception as e:
+            handle_unknown_error(self._printer, e)
+            raise e
+
+        formatted_answer = await asyncio.to_thread(
+            self._complete_invoke, formatted_answer
+        )
+        return {"output": formatted_answer.output}
+
+    def _setup_messages(self, inputs: Dict[str, str]) -> None:
+        """Format the prompt into the initial messages and show the start logs."""
+        if "system" in self.prompt:
+            system_prompt = self._format_prompt(self.prompt.get("system", ""), inputs)
+            user_prompt = self._format_prompt(self.prompt.get("user", ""), inputs)
+            self.messages.append(format_message_for_llm(system_prompt, role="system"))
+            self.messages.append(format_message_for_llm(user_prompt))
+        else:
+            user_prompt = self._format_prompt(self.prompt.get("prompt", ""), inputs)
+            self.messages.append(format_message_for_llm(user_prompt))
+
+        self._show_start_logs()
+
+        self.ask_for_human_input = bool(inputs.get("ask_for_human_input", False))
+
+    def _complete_invoke(self, formatted_answer: AgentFinish) -> AgentFinish:
+        """Handle human feedback and store the memories of the final answer."""
         if self.ask_for_human_input:
             formatted_answer = self._handle_human_feedback(formatted_answer)
 
         self._create_short_term_memory(formatted_answer)
         self._create_long_term_memory(formatted_answer)
         self._create_external_memory(formatted_answer)
-        return {"output": formatted_answer.output}
+        return formatted_answer
 
     def _invoke_loop(self) -> AgentFinish:
         """
@@ -139,6 +197,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         """
         formatted_answer = None
         while not isinstance(formatted_answer, AgentFinish):
+            self._raise_if_cancelled()
             try:
                 if has_reached_max_iterations(self.iterations, self.max_iter):
                     formatted_answer = handle_max_iterations_exceeded(
@@ -157,38 +216,19 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     messages=self.messages,
                     callbacks=self.callbacks,
                     printer=self._printer,
+                    stream_parser=StreamingAgentParser(),
                 )
                 formatted_answer = process_llm_response(answer, self.use_stop_words)
 
                 if isinstance(formatted_answer, AgentAction):
-                    # Extract agent fingerprint if available
-                    fingerprint_context = {}
-                    if (
-                        self.agent
-                        and hasattr(self.agent, "security_config")
-                        and hasattr(self.agent.security_config, "fingerprint")
-                    ):
-                        fingerprint_context = {
-                            "agent_fingerprint": str(
-                                self.agent.security_config.fingerprint
-                            )
-                        }
-
-                    tool_result = execute_tool_and_check_finality(
-                        agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
-                    )
-                    formatted_answer = self._handle_agent_action(
-                        formatted_answer, tool_result
-                    )
+                    self._raise_if_cancelled()
+                    actions = CrewAgentParser().parse_actions(formatted_answer.text)
+                    if len(actions) > 1:
+                        formatted_answer = self._execute_agent_actions(
+                            formatted_answer, actions
+                        )
+                    else:
+                        formatted_answer = self._execute_agent_action(formatted_answer)
 
                 self._invoke_step_callback(formatted_answer)
                 self._append_message(formatted_answer.text, role="assistant")
@@ -202,6 +242,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     printer=self._printer,
                 )
 
+            except ExecutionCancelledError:
+                raise
+
             except Exception as e:
                 if e.__class__.__module__.startswith("litellm"):
                     # Do not retry on litellm errors
@@ -214,6 +257,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                         llm=self.llm,
                         callbacks=self.callbacks,
                         i18n=self._i18n,
+                        context_window_manager=self.context_window_manager,
                     )
                     continue
                 else:
@@ -230,6 +274,187 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self._show_logs(formatted_answer)
         return formatted_answer
 
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Asynchronous counterpart of :meth:`_invoke_loop`, awaiting the LLM on the
+        event loop and running blocking steps in worker threads.
+        """
+        formatted_answer = None
+        while not isinstance(formatted_answer, AgentFinish):
+            self._raise_if_cancelled()
+            try:
+                if has_reached_max_iterations(self.iterations, self.max_iter):
+                    formatted_answer = await asyncio.to_thread(
+                        handle_max_iterations_exceeded,
+                        formatted_answer,
+                        printer=self._printer,
+                        i18n=self._i18n,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                    )
+
+                if self.arequest_within_rpm_limit:
+                    await self.arequest_within_rpm_limit()
+                elif self.request_within_rpm_limit:
+                    await asyncio.to_thread(
+                        enforce_rpm_limit, self.request_within_rpm_limit
+                    )
+
+                answer = await aget_llm_response(
+                    llm=self.llm,
+                    messages=self.messages,
+                    callbacks=self.callbacks,
+                    printer=self._printer,
+                    stream_parser=StreamingAgentParser(),
+                )
+                formatted_answer = process_llm_response(answer, self.use_stop_words)
+
+                if isinstance(formatted_answer, AgentAction):
+                    self._raise_if_cancelled()
+                    actions = CrewAgentParser().parse_actions(formatted_answer.text)
+                    if len(actions) > 1:
+                        formatted_answer = await self._aexecute_agent_actions(
+                            formatted_answer, actions
+                        )
+                    else:
+                        formatted_answer = await asyncio.to_thread(
+                            self._execute_agent_action, formatted_answer
+                        )
+
+                self._invoke_step_callback(formatted_answer)
+                self._append_message(formatted_answer.text, role="assistant")
+
+            except OutputParserException as e:
+                formatted_answer = handle_output_parser_exception(
+                    e=e,
+                    messages=self.messages,
+                    iterations=self.iterations,
+                    log_error_after=self.log_error_after,
+                    printer=self._printer,
+                )
+
+            except ExecutionCancelledError:
+                raise
+
+            except Exception as e:
+                if e.__class__.__module__.startswith("litellm"):
+                    # Do not retry on litellm errors
+                    raise e
+                if is_context_length_exceeded(e):
+                    await asyncio.to_thread(
+                        handle_context_length,
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                        context_window_manager=self.context_window_manager,
+                    )
+                    continue
+                else:
+                    handle_unknown_error(self._printer, e)
+                    raise e
+            finally:
+                self.iterations += 1
+
+        assert isinstance(formatted_answer, AgentFinish)
+        self._show_logs(formatted_answer)
+        return formatted_answer
+
+    def _raise_if_cancelled(self) -> None:
+        """Stop the agent loop once the execution has been cancelled or timed out."""
+        if self.cancellation_token:
+            self.cancellation_token.raise_if_cancelled()
+
+    def _execute_agent_action(
+        self, formatted_answer: AgentAction
+    ) -> Union[AgentAction, AgentFinish]:
+        """Execute the tool requested by the AgentAction and process its result."""
+        tool_result = self._execute_tool(formatted_answer)
+        return self._handle_agent_action(formatted_answer, tool_result)
+
+    def _execute_agent_actions(
+        self, formatted_answer: AgentAction, actions: List[AgentAction]
+    ) -> Union[AgentAction, AgentFinish]:
+        """Execute several tools requested in one response concurrently."""
+        # A pool of this executor rather than the shared execution pool, as
+        # these calls can run inside an execution already holding one of its
+        # workers. Its threads exit once the executor is garbage collected.
+        if self._tool_pool is None:
+            self._tool_pool = ThreadPoolExecutor(
+                max_workers=MAX_PARALLEL_TOOL_CALLS, thread_name_prefix="crewai-tool"
+            )
+        tool_results = list(self._tool_pool.map(self._execute_tool, actions))
+        return self._handle_agent_actions(formatted_answer, actions, tool_results)
+
+    async def _aexecute_agent_actions(
+        self, formatted_answer: AgentAction, actions: List[AgentAction]
+    ) -> Union[AgentAction, AgentFinish]:
+        """Asynchronous counterpart of :meth:`_execute_agent_actions`."""
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+
+        async def _run(action: AgentAction) -> ToolResult:
+            async with semaphore:
+                return await asyncio.to_thread(self._execute_tool, action)
+
+        tool_results = await asyncio.gather(*(_run(action) for action in actions))
+        return await asyncio.to_thread(
+            self._handle_agent_actions, formatted_answer, actions, list(tool_results)
+        )
+
+    def _handle_agent_actions(
+        self,
+        formatted_answer: AgentAction,
+        actions: List[AgentAction],
+        tool_results: List[ToolResult],
+    ) -> Union[AgentAction, AgentFinish]:
+        """Merge the results of a batch of tools into a single observation.
+
+        The first tool whose result should be used as the answer ends the
+        execution, otherwise every result is appended before the next LLM call.
+        """
+        for tool_result in tool_results:
+            if tool_result.result_as_answer:
+                return self._handle_agent_action(formatted_answer, tool_result)
+
+        observation = "\n\n".join(
+            f"Action {index} ({action.tool}) result: {tool_result.result}"
+            for index, (action, tool_result) in enumerate(
+                zip(actions, tool_results), start=1
+            )
+        )
+        return self._handle_agent_action(
+            formatted_answer, ToolResult(observation, False)
+        )
+
+    def _execute_tool(self, agent_action: AgentAction) -> ToolResult:
+        """Execute the tool requested by the AgentAction."""
+        # Extract agent fingerprint if available
+        fingerprint_context = {}
+        if (
+            self.agent
+            and hasattr(self.agent, "security_config")
+            and hasattr(self.agent.security_config, "fingerprint")
+        ):
+            fingerprint_context = {
+                "agent_fingerprint": str(self.agent.security_config.fingerprint)
+            }
+
+        return execute_tool_and_check_finality(
+            agent_action=agent_action,
+            fingerprint_context=fingerprint_context,
+            tools=self.tools,
+            i18n=self._i18n,
+            agent_key=self.agent.key if self.agent else None,
+            agent_role=self.agent.role if self.agent else None,
+            tools_handler=self.tools_handler,
+            task=self.task,
+            agent=self.agent,
+            function_calling_llm=self.function_calling_llm,
+        )
+
     def _handle_agent_action(
         self, formatted_answer: AgentAction, tool_result: ToolResult
     ) -> Union[AgentAction, AgentFinish]:
@@ -288,37 +513,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         )
 
     def _summarize_messages(self) -> None:
-        messages_groups = []
-        for message in self.messages:
-            content = message["content"]
-            cut_size = self.llm.get_context_window_size()
-            for i in range(0, len(content), cut_size):
-                messages_groups.append({"content": content[i : i + cut_size]})
-
-        summarized_contents = []
-        for group in messages_groups:
-            summary = self.llm.call(
-                [
-                    format_message_for_llm(
-                        self._i18n.slice("summarizer_system_message"), role="system"
-                    ),
-                    format_message_for_llm(
-                        self._i18n.slice("summarize_instruction").format(
-                            group=group["content"]
-                        ),
-                    ),
-                ],
-                callbacks=self.callbacks,
-            )
-            summarized_contents.append({"content": str(summary)})
-
-        merged_summary = " ".join(content["content"] for content in summarized_contents)
-
-        self.messages = [
-            format_message_for_llm(
-                self._i18n.slice("summary").format(merged_summary=merged_summary)
-            )
-        ]
+        self.context_window_manager.summarize(self.messages, self.callbacks)
 
     def _handle_crew_training_output(
         self, result: AgentFinish, human_feedback: Optional[str] = None
@@ -1,5 +1,6 @@
+import json
 import re
-from typing import Any, Optional, Union
+from typing import Any, List, Optional, Union
 
 from json_repair import repair_json
 
@@ -9,6 +10,18 @@ FINAL_ANSWER_ACTION = "Final Answer:"
 MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action:' after 'Thought:'. I will do right next, and don't use a tool I have already used.\n"
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action Input:' after 'Action:'. I will do right next, and don't use a tool I have already used.\n"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = "I did it wrong. Tried to both perform Action and give a Final Answer at the same time, I must do one or the other"
+ACTION_REGEX = re.compile(
+    r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", re.DOTALL
+)
+ACTION_ONLY_REGEX = re.compile(r"Action\s*\d*\s*:")
+ACTION_INPUT_ONLY_REGEX = re.compile(r"Action\s*\d*\s*Input\s*\d*\s*:")
+# Matches every numbered "Action N" / "Action Input N" pair, each input ending
+# where the next Thought or Action starts.
+ACTIONS_REGEX = re.compile(
+    r"Action\s+(\d+)\s*:[\s]*(.*?)[\s]*Action\s+Input\s+\1\s*:[\s]*(.*?)"
+    r"(?=\n\s*(?:Thought\s*\d*\s*:|Action\s*\d*\s*:)|\Z)",
+    re.DOTALL,
+)
 
 
 class AgentAction:
@@ -81,17 +94,11 @@ class CrewAgentParser:
         Returns:
             Either an AgentAction or AgentFinish based on the parsed content.
         """
-        parser = CrewAgentParser()
-        return parser.parse(text)
+        return _default_parser.parse(text)
 
     def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
         thought = self._extract_thought(text)
-        includes_answer = FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        action_match = re.search(regex, text, re.DOTALL)
-        if includes_answer:
+        if FINAL_ANSWER_ACTION in text:
             final_answer = text.split(FINAL_ANSWER_ACTION)[-1].strip()
             # Check whether the final answer ends with triple backticks.
             if final_answer.endswith("```"):
@@ -102,7 +109,8 @@ class CrewAgentParser:
                     final_answer = final_answer[:-3].rstrip()
             return AgentFinish(thought, final_answer, text)
 
-        elif action_match:
+        action_match = ACTION_REGEX.search(text)
+        if action_match:
             action = action_match.group(1)
             clean_action = self._clean_action(action)
 
@@ -113,13 +121,11 @@ class CrewAgentParser:
 
             return AgentAction(thought, clean_action, safe_tool_input, text)
 
-        if not re.search(r"Action\s*\d*\s*:[\s]*(.*?)", text, re.DOTALL):
+        if not ACTION_ONLY_REGEX.search(text):
             raise OutputParserException(
                 f"{MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE}\n{self._i18n.slice('final_answer_format')}",
             )
-        elif not re.search(
-            r"[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", text, re.DOTALL
-        ):
+        elif not ACTION_INPUT_ONLY_REGEX.search(text):
             raise OutputParserException(
                 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE,
             )
@@ -130,6 +136,32 @@ class CrewAgentParser:
                 error,
             )
 
+    def parse_actions(self, text: str) -> List[AgentAction]:
+        """Parse the numbered Action / Action Input pairs of a response.
+
+        Lets the agent request several independent tools in one response,
+        e.g. ``Action 1: ...``, ``Action Input 1: ...``, ``Action 2: ...``, as
+        the tools prompt teaches. Unnumbered actions, like one made up after
+        the first, are never taken as a batch.
+
+        Returns:
+            One AgentAction per pair, sharing the response thought and text, or
+            an empty list unless the pairs are numbered 1, 2, ... in order.
+        """
+        pairs = ACTIONS_REGEX.findall(text)
+        if [int(number) for number, _, _ in pairs] != list(range(1, len(pairs) + 1)):
+            return []
+        thought = self._extract_thought(text)
+        return [
+            AgentAction(
+                thought,
+                self._clean_action(action),
+                self._safe_repair_json(action_input.strip().strip(" ").strip('"')),
+                text,
+            )
+            for _, action, action_input in pairs
+        ]
+
     def _extract_thought(self, text: str) -> str:
         thought_index = text.find("\nAction")
         if thought_index == -1:
@@ -157,6 +189,16 @@ class CrewAgentParser:
         if tool_input.startswith("[") and tool_input.endswith("]"):
             return tool_input
 
+        # Valid JSON objects don't need repairing, only normalizing.
+        if tool_input.startswith("{"):
+            try:
+                parsed = json.loads(tool_input)
+            except ValueError:
+                pass
+            else:
+                if isinstance(parsed, dict):
+                    return json.dumps(parsed)
+
         # Before repair, handle common LLM issues:
         # 1. Replace """ with " to avoid JSON parser errors
 
@@ -167,3 +209,111 @@ class CrewAgentParser:
             return tool_input
 
         return str(result)
+
+
+_default_parser = CrewAgentParser()
+
+
+class StreamingAgentParser:
+    """Scans a streamed ReAct response and tells when an action is complete.
+
+    An action is complete once its ``Action Input`` has ended, meaning its JSON
+    braces are balanced and it is followed by a line that does not start
+    another action. The rest of the generation, usually a made-up
+    ``Observation``, is not needed, so the stream can be stopped and the tool
+    dispatched right away. A ``Final Answer`` runs until the stream ends.
+
+    The buffer is scanned once, each chunk continuing where the previous one
+    stopped.
+    """
+
+    _NEXT_LINE_PROBE = len("Action")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.is_final_answer = False
+        self.is_complete = False
+        self._position = 0
+        self._input_start: Optional[int] = None
+        self._input_end: Optional[int] = None
+        self._has_input = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def action_text(self) -> str:
+        """The response up to the end of the last complete Action Input."""
+        if self._input_end is None:
+            return self.text
+        return self.text[: self._input_end].rstrip()
+
+    def feed(self, chunk: str) -> bool:
+        """Add a streamed chunk and return whether the action is complete."""
+        if self.is_complete or self.is_final_answer:
+            return self.is_complete
+        self.text += chunk
+        while not self.is_complete and self._position < len(self.text):
+            if self._input_end is not None:
+                if not self._check_next_line():
+                    break
+            elif self._input_start is None:
+                if not self._find_input_start():
+                    break
+            else:
+                self._scan_input()
+        return self.is_complete
+
+    def _find_input_start(self) -> bool:
+        if FINAL_ANSWER_ACTION in self.text:
+            self.is_final_answer = True
+            return False
+        match = ACTION_INPUT_ONLY_REGEX.search(self.text, self._position)
+        if match is None:
+            # Keep enough of the tail to match a marker split across chunks.
+            self._position = max(self._position, len(self.text) - 32)
+            return False
+        self._input_start = self._position = match.end()
+        return True
+
+    def _scan_input(self) -> None:
+        while self._position < len(self.text):
+            char = self.text[self._position]
+            self._position += 1
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+                self._has_input = True
+            elif char in "{[":
+                self._depth += 1
+                self._has_input = True
+            elif char in "}]":
+                self._depth -= 1
+            elif char == "\n":
+                if self._has_input and self._depth <= 0:
+                    self._input_end = self._position
+                    return
+            elif not char.isspace():
+                self._has_input = True
+
+    def _check_next_line(self) -> bool:
+        assert self._input_end is not None
+        next_line = self.text[self._input_end :].lstrip()
+        if len(next_line) < self._NEXT_LINE_PROBE and "\n" not in next_line:
+            self._position = len(self.text)
+            return False
+        if ACTION_ONLY_REGEX.match(next_line) or next_line.startswith("Action"):
+            # Another action of the same batch follows.
+            self._position = self._input_end
+            self._input_start = self._input_end = None
+            self._has_input = False
+            self._depth = 0
+            return True
+        self.is_complete = True
+        return True
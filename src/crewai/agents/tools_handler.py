@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Optional, Union
 
 from ..tools.cache_tools.cache_tools import CacheTools
@@ -6,7 +7,11 @@ from .cache.cache_handler import CacheHandler
 
 
 class ToolsHandler:
-    """Callback handler for tool usage."""
+    """Callback handler for tool usage.
+
+    Tools requested together run concurrently, so the last used tool is
+    read and updated under a lock.
+    """
 
     last_used_tool: ToolCalling = {}  # type: ignore # BUG?: Incompatible types in assignment (expression has type "Dict[...]", variable has type "ToolCalling")
     cache: Optional[CacheHandler]
@@ -15,6 +20,7 @@ class ToolsHandler:
         """Initialize the callback handler."""
         self.cache = cache
         self.last_used_tool = {}  # type: ignore # BUG?: same as above
+        self._lock = threading.Lock()
 
     def on_tool_use(
         self,
@@ -23,10 +29,22 @@ class ToolsHandler:
         should_cache: bool = True,
     ) -> Any:
         """Run when tool ends running."""
-        self.last_used_tool = calling  # type: ignore # BUG?: Incompatible types in assignment (expression has type "Union[ToolCalling, InstructorToolCalling]", variable has type "ToolCalling")
+        with self._lock:
+            self.last_used_tool = calling  # type: ignore # BUG?: Incompatible types in assignment (expression has type "Union[ToolCalling, InstructorToolCalling]", variable has type "ToolCalling")
+        # The cache is thread-safe on its own.
         if self.cache and should_cache and calling.tool_name != CacheTools().name:
             self.cache.add(
                 tool=calling.tool_name,
                 input=calling.arguments,
                 output=output,
             )
+
+    def is_last_used(self, calling: Union[ToolCalling, InstructorToolCalling]) -> bool:
+        """Whether ``calling`` repeats the last tool use, name and arguments."""
+        with self._lock:
+            last_tool_usage = self.last_used_tool
+        if not last_tool_usage:
+            return False
+        return (calling.tool_name == last_tool_usage.tool_name) and (
+            calling.arguments == last_tool_usage.arguments
+        )
@@ -3,7 +3,7 @@ import json
 import re
 import uuid
 import warnings
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import copy as shallow_copy
 from hashlib import md5
 from typing import (
@@ -36,11 +36,13 @@ from crewai.agents.cache import CacheHandler
 from crewai.crews.crew_output import CrewOutput
 from crewai.flow.flow_trackable import FlowTrackable
 from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.knowledge_config import KnowledgeConfig
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.llm import LLM, BaseLLM
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.external.external_memory import ExternalMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
+from crewai.memory.memory_writer import MemoryWriter
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.memory.user.user_memory import UserMemory
 from crewai.process import Process
@@ -92,11 +94,16 @@ class Crew(FlowTrackable, BaseModel):
         memory: Whether the crew should use memory to store memories of it's execution.
         memory_config: Configuration for the memory to be used for the crew.
         cache: Whether the crew should use a cache to store the results of the tools execution.
+        cache_handler: Cache used for the results of the tools execution, e.g. a bounded or disk-backed CacheHandler.
         function_calling_llm: The language model that will run the tool calling for all the agents.
-        process: The process flow that the crew will follow (e.g., sequential, hierarchical).
+        process: The process flow that the crew will follow (e.g., sequential, hierarchical, dag).
+        max_concurrent_tasks: Maximum number of tasks running at the same time when using the dag process.
         verbose: Indicates the verbosity level for logging during execution.
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to be respected.
+        max_tpm: Maximum number of LLM tokens per minute for the crew execution to be respected.
+        rate_limit_storage_path: Path of a SQLite database sharing the max_rpm/max_tpm budget across processes.
+        rate_limit_key: Name of the budget shared through rate_limit_storage_path.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         task_callback: Callback to be executed after each task for every agents execution.
@@ -112,12 +119,13 @@ class Crew(FlowTrackable, BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
     _user_memory: Optional[InstanceOf[UserMemory]] = PrivateAttr()
     _external_memory: Optional[InstanceOf[ExternalMemory]] = PrivateAttr()
+    _memory_writer: Optional[MemoryWriter] = PrivateAttr(default=None)
     _train: Optional[bool] = PrivateAttr(default=False)
     _train_iteration: Optional[int] = PrivateAttr()
     _inputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)
@@ -130,9 +138,18 @@ class Crew(FlowTrackable, BaseModel):
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Cache used for the results of the tools execution, defaults to an in-memory CacheHandler.",
+    )
     tasks: List[Task] = Field(default_factory=list)
     agents: List[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
+    max_concurrent_tasks: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of tasks running at the same time when using the dag process.",
+    )
     verbose: bool = Field(default=False)
     memory: bool = Field(
         default=False,
@@ -204,6 +221,18 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the crew execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the crew execution to be respected.",
+    )
+    rate_limit_storage_path: Optional[str] = Field(
+        default=None,
+        description="Path of a SQLite database sharing the max_rpm/max_tpm budget across processes.",
+    )
+    rate_limit_key: str = Field(
+        default="default",
+        description="Name of the budget shared through rate_limit_storage_path.",
+    )
     prompt_file: Optional[str] = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
@@ -232,6 +261,10 @@ class Crew(FlowTrackable, BaseModel):
         default=None,
         description="Knowledge sources for the crew. Add knowledge sources to the knowledge object.",
     )
+    knowledge_config: Optional[KnowledgeConfig] = Field(
+        default=None,
+        description="Knowledge configuration for the crew's knowledge, such as its vector store.",
+    )
     chat_llm: Optional[Union[str, InstanceOf[BaseLLM], Any]] = Field(
         default=None,
         description="LLM used to handle chatting with the crew.",
@@ -273,14 +306,20 @@ class Crew(FlowTrackable, BaseModel):
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
 
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         event_listener = EventListener()
         event_listener.verbose = self.verbose
         event_listener.formatter.verbose = self.verbose
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = RPMController(
+            max_rpm=self.max_rpm,
+            max_tpm=self.max_tpm,
+            storage_path=self.rate_limit_storage_path,
+            key=self.rate_limit_key,
+            logger=self._logger,
+        )
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -329,6 +368,9 @@ class Crew(FlowTrackable, BaseModel):
             self._initialize_default_memories()
             self._initialize_user_memory()
 
+        if self.memory_config and self.memory_config.get("write_behind"):
+            self._memory_writer = MemoryWriter()
+
         return self
 
     @model_validator(mode="after")
@@ -343,6 +385,16 @@ class Crew(FlowTrackable, BaseModel):
                         sources=self.knowledge_sources,
                         embedder=self.embedder,
                         collection_name="crew",
+                        vector_store=(
+                            self.knowledge_config.vector_store
+                            if self.knowledge_config
+                            else "chroma"
+                        ),
+                        purge_removed_files=(
+                            self.knowledge_config.purge_removed_files
+                            if self.knowledge_config
+                            else False
+                        ),
                     )
                     self.knowledge.add_sources()
 
@@ -391,18 +443,18 @@ class Crew(FlowTrackable, BaseModel):
             for agent in self.agents:
                 if self.cache:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
+                if self.max_rpm or self.max_tpm:
                     agent.set_rpm_controller(self._rpm_controller)
         return self
 
     @model_validator(mode="after")
     def validate_tasks(self):
-        if self.process == Process.sequential:
+        if self.process in (Process.sequential, Process.dag):
             for task in self.tasks:
                 if task.agent is None:
                     raise PydanticCustomError(
                         "missing_agent_in_task",
-                        f"Sequential process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
+                        f"{self.process.value.capitalize()} process error: Agent is missing in the task with the following description: {task.description}",  # type: ignore # Argument of type "str" cannot be assigned to parameter "message_template" of type "LiteralString"
                         {},
                     )
 
@@ -617,70 +669,126 @@ class Crew(FlowTrackable, BaseModel):
         inputs: Optional[Dict[str, Any]] = None,
     ) -> CrewOutput:
         try:
-            for before_callback in self.before_kickoff_callbacks:
-                if inputs is None:
-                    inputs = {}
-                inputs = before_callback(inputs)
+            self._prepare_kickoff(inputs)
+
+            if self.process == Process.sequential:
+                result = self._run_sequential_process()
+            elif self.process == Process.hierarchical:
+                result = self._run_hierarchical_process()
+            elif self.process == Process.dag:
+                result = self._run_dag_process()
+            else:
+                raise NotImplementedError(
+                    f"The process '{self.process}' is not implemented yet."
+                )
 
+            return self._complete_kickoff(result)
+        except Exception as e:
             crewai_event_bus.emit(
                 self,
-                CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
+                CrewKickoffFailedEvent(error=str(e), crew_name=self.name or "crew"),
             )
+            raise
+        finally:
+            self.flush_memories()
+            crewai_event_bus.flush()
+            if self.output_log_file:
+                self._file_handler.flush()
 
-            # Starts the crew to work on its assigned tasks.
-            self._task_output_handler.reset()
-            self._logging_color = "bold_purple"
-
-            if inputs is not None:
-                self._inputs = inputs
-                self._interpolate_inputs(inputs)
-            self._set_tasks_callbacks()
-
-            i18n = I18N(prompt_file=self.prompt_file)
-
-            for agent in self.agents:
-                agent.i18n = i18n
-                # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
-                agent.crew = self  # type: ignore[attr-defined]
-                agent.set_knowledge(crew_embedder=self.embedder)
-                # TODO: Create an AgentFunctionCalling protocol for future refactoring
-                if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-                    agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
-
-                if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
-                    agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
-
-                agent.create_agent_executor()
-
-            if self.planning:
-                self._handle_crew_planning()
+    async def akickoff(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+    ) -> CrewOutput:
+        """Native asynchronous kickoff running the tasks on the current event loop.
 
-            metrics: List[UsageMetrics] = []
+        Unlike ``kickoff_async``, no thread is held for the whole crew execution:
+        agents await their LLM calls, so many crews can share one event loop.
+        """
+        try:
+            await asyncio.to_thread(self._prepare_kickoff, inputs)
 
             if self.process == Process.sequential:
-                result = self._run_sequential_process()
+                result = await self._aexecute_tasks(self.tasks)
             elif self.process == Process.hierarchical:
-                result = self._run_hierarchical_process()
+                self._create_manager_agent()
+                result = await self._aexecute_tasks(self.tasks)
+            elif self.process == Process.dag:
+                result = await self._aexecute_tasks_dag(self.tasks)
             else:
                 raise NotImplementedError(
                     f"The process '{self.process}' is not implemented yet."
                 )
 
-            for after_callback in self.after_kickoff_callbacks:
-                result = after_callback(result)
-
-            metrics += [agent._token_process.get_summary() for agent in self.agents]
-
-            self.usage_metrics = UsageMetrics()
-            for metric in metrics:
-                self.usage_metrics.add_usage_metrics(metric)
-            return result
+            return self._complete_kickoff(result)
         except Exception as e:
             crewai_event_bus.emit(
                 self,
                 CrewKickoffFailedEvent(error=str(e), crew_name=self.name or "crew"),
             )
             raise
+        finally:
+            await asyncio.to_thread(self.flush_memories)
+            await asyncio.to_thread(crewai_event_bus.flush)
+            if self.output_log_file:
+                await asyncio.to_thread(self._file_handler.flush)
+
+    def _prepare_kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> None:
+        """Runs the before kickoff callbacks and sets up the agents for execution."""
+        for before_callback in self.before_kickoff_callbacks:
+            if inputs is None:
+                inputs = {}
+            inputs = before_callback(inputs)
+
+        crewai_event_bus.emit(
+            self,
+            CrewKickoffStartedEvent(crew_name=self.name or "crew", inputs=inputs),
+        )
+
+        # Starts the crew to work on its assigned tasks.
+        self._task_output_handler.reset()
+        self._logging_color = "bold_purple"
+
+        if inputs is not None:
+            self._inputs = inputs
+            self._interpolate_inputs(inputs)
+        self._set_tasks_callbacks()
+
+        i18n = I18N(prompt_file=self.prompt_file)
+
+        for agent in self.agents:
+            agent.i18n = i18n
+            # type: ignore[attr-defined] # Argument 1 to "_interpolate_inputs" of "Crew" has incompatible type "dict[str, Any] | None"; expected "dict[str, Any]"
+            agent.crew = self  # type: ignore[attr-defined]
+            agent.set_knowledge(crew_embedder=self.embedder)
+            # TODO: Create an AgentFunctionCalling protocol for future refactoring
+            if not agent.function_calling_llm:  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+                agent.function_calling_llm = self.function_calling_llm  # type: ignore # "BaseAgent" has no attribute "function_calling_llm"
+
+            if not agent.step_callback:  # type: ignore # "BaseAgent" has no attribute "step_callback"
+                agent.step_callback = self.step_callback  # type: ignore # "BaseAgent" has no attribute "step_callback"
+
+            agent.create_agent_executor()
+
+        if self.planning:
+            self._handle_crew_planning()
+
+    def _complete_kickoff(self, result: CrewOutput) -> CrewOutput:
+        """Runs the after kickoff callbacks and aggregates the usage metrics."""
+        metrics: List[UsageMetrics] = []
+
+        for after_callback in self.after_kickoff_callbacks:
+            result = after_callback(result)
+
+        metrics += [agent._token_process.get_summary() for agent in self.agents]
+
+        self.usage_metrics = UsageMetrics()
+        for metric in metrics:
+            self.usage_metrics.add_usage_metrics(metric)
+        if self.cache:
+            self.usage_metrics.cache_hits = self._cache_handler.hits
+            self.usage_metrics.cache_misses = self._cache_handler.misses
+            self.usage_metrics.cache_evictions = self._cache_handler.evictions
+        return result
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
         """Executes the Crew's workflow for each input in the list and aggregates results."""
@@ -777,6 +885,10 @@ class Crew(FlowTrackable, BaseModel):
         self._create_manager_agent()
         return self._execute_tasks(self.tasks)
 
+    def _run_dag_process(self) -> CrewOutput:
+        """Executes tasks as a dependency graph built from their context."""
+        return self._execute_tasks_dag(self.tasks)
+
     def _create_manager_agent(self):
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
@@ -887,6 +999,370 @@ class Crew(FlowTrackable, BaseModel):
 
         return self._create_crew_output(task_outputs)
 
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Asynchronous counterpart of ``_execute_tasks``.
+
+        Synchronous tasks are awaited in order, while tasks with
+        ``async_execution`` run as asyncio tasks until the next synchronous task.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+            start_index (Optional[int]): Index of the first task to execute
+            was_replayed (bool): Whether the execution is a replay
+
+        Returns:
+            CrewOutput: Final output of the crew
+        """
+        task_outputs: List[TaskOutput] = []
+        pending_tasks: List[Tuple[Task, asyncio.Task[TaskOutput], int]] = []
+        last_sync_output: Optional[TaskOutput] = None
+
+        for task_index, task in enumerate(tasks):
+            if start_index is not None and task_index < start_index:
+                if task.output:
+                    if task.async_execution:
+                        task_outputs.append(task.output)
+                    else:
+                        task_outputs = [task.output]
+                        last_sync_output = task.output
+                continue
+
+            agent_to_use = self._get_agent_to_use(task)
+            if agent_to_use is None:
+                raise ValueError(
+                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                )
+
+            tools_for_task = task.tools or agent_to_use.tools or []
+            tools_for_task = self._prepare_tools(
+                agent_to_use,
+                task,
+                cast(Union[List[Tool], List[BaseTool]], tools_for_task),
+            )
+
+            self._log_task_start(task, agent_to_use.role)
+
+            if isinstance(task, ConditionalTask):
+                if pending_tasks:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending_tasks, was_replayed
+                    )
+                    pending_tasks.clear()
+                skipped_task_output = self._handle_conditional_task(
+                    task, task_outputs, [], task_index, was_replayed
+                )
+                if skipped_task_output:
+                    task_outputs.append(skipped_task_output)
+                    continue
+
+            if task.async_execution:
+                context = self._get_context(
+                    task, [last_sync_output] if last_sync_output else []
+                )
+                running_task = asyncio.create_task(
+                    task.aexecute(
+                        agent=agent_to_use,
+                        context=context,
+                        tools=cast(List[BaseTool], tools_for_task),
+                    )
+                )
+                pending_tasks.append((task, running_task, task_index))
+            else:
+                if pending_tasks:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending_tasks, was_replayed
+                    )
+                    pending_tasks.clear()
+
+                context = self._get_context(task, task_outputs)
+                task_output = await task.aexecute(
+                    agent=agent_to_use,
+                    context=context,
+                    tools=cast(List[BaseTool], tools_for_task),
+                )
+                task_outputs.append(task_output)
+                self._process_task_result(task, task_output)
+                self._store_execution_log(task, task_output, task_index, was_replayed)
+
+        if pending_tasks:
+            task_outputs = await self._aprocess_async_tasks(pending_tasks, was_replayed)
+
+        return self._create_crew_output(task_outputs)
+
+    def _build_task_dependencies(self, tasks: List[Task]) -> List[Set[int]]:
+        """Builds the dependency graph of the given tasks from their context.
+
+        A task depends on every task of its explicit ``context`` list that is
+        part of ``tasks``. A ``ConditionalTask`` without an explicit context
+        depends on the task right before it, as its condition is evaluated on
+        that output. Tasks can only depend on earlier tasks, so the list order
+        is always a valid topological order.
+
+        Args:
+            tasks (List[Task]): List of tasks to build the graph for
+
+        Returns:
+            List[Set[int]]: Indices of the dependencies of each task
+        """
+        task_indices = {id(task): i for i, task in enumerate(tasks)}
+        dependencies: List[Set[int]] = []
+
+        for task_index, task in enumerate(tasks):
+            if isinstance(task.context, list):
+                task_dependencies = {
+                    task_indices[id(context_task)]
+                    for context_task in task.context
+                    if id(context_task) in task_indices
+                }
+            elif isinstance(task, ConditionalTask) and task_index > 0:
+                task_dependencies = {task_index - 1}
+            else:
+                task_dependencies = set()
+            dependencies.append(task_dependencies)
+
+        return dependencies
+
+    def _execute_tasks_dag(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Executes tasks as soon as all their dependencies are completed.
+
+        Ready tasks run on a worker pool bounded by ``max_concurrent_tasks``.
+        Tasks sharing an agent never run at the same time, since an agent
+        holds a single executor.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+            start_index (Optional[int]): Index of the first task to execute, earlier tasks are reused from their stored output
+            was_replayed (bool): Whether the execution is a replay
+
+        Returns:
+            CrewOutput: Final output of the crew
+        """
+        dependencies = self._build_task_dependencies(tasks)
+        completed = self._get_replayed_dag_outputs(tasks, start_index)
+        pending = [i for i in range(len(tasks)) if i not in completed]
+        running: Dict[Future[TaskOutput], int] = {}
+        busy_agents: Set[int] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrent_tasks,
+            thread_name_prefix="crewai-dag",
+        ) as executor:
+            try:
+                while pending or running:
+                    for (
+                        task_index,
+                        agent,
+                        context,
+                        tools,
+                    ) in self._start_ready_dag_tasks(
+                        tasks,
+                        dependencies,
+                        pending,
+                        completed,
+                        busy_agents,
+                        self.max_concurrent_tasks - len(running),
+                        was_replayed,
+                    ):
+                        future = executor.submit(
+                            tasks[task_index].execute_sync,
+                            agent=agent,
+                            context=context,
+                            tools=tools,
+                        )
+                        running[future] = task_index
+
+                    if not running:
+                        self._check_dag_pending_tasks(pending)
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task_index = running.pop(future)
+                        self._complete_dag_task(
+                            tasks[task_index],
+                            future.result(),
+                            task_index,
+                            completed,
+                            busy_agents,
+                            was_replayed,
+                        )
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+        task_outputs = [completed[i] for i in sorted(completed)]
+        return self._create_crew_output(task_outputs)
+
+    async def _aexecute_tasks_dag(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> CrewOutput:
+        """Asynchronous counterpart of ``_execute_tasks_dag`` running tasks as asyncio tasks."""
+        dependencies = self._build_task_dependencies(tasks)
+        completed = self._get_replayed_dag_outputs(tasks, start_index)
+        pending = [i for i in range(len(tasks)) if i not in completed]
+        running: Dict[asyncio.Task[TaskOutput], int] = {}
+        busy_agents: Set[int] = set()
+
+        try:
+            while pending or running:
+                for task_index, agent, context, tools in self._start_ready_dag_tasks(
+                    tasks,
+                    dependencies,
+                    pending,
+                    completed,
+                    busy_agents,
+                    self.max_concurrent_tasks - len(running),
+                    was_replayed,
+                ):
+                    running_task = asyncio.create_task(
+                        tasks[task_index].aexecute(
+                            agent=agent, context=context, tools=tools
+                        )
+                    )
+                    running[running_task] = task_index
+
+                if not running:
+                    self._check_dag_pending_tasks(pending)
+                    break
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for running_task in done:
+                    task_index = running.pop(running_task)
+                    self._complete_dag_task(
+                        tasks[task_index],
+                        running_task.result(),
+                        task_index,
+                        completed,
+                        busy_agents,
+                        was_replayed,
+                    )
+        except BaseException:
+            for running_task in running:
+                running_task.cancel()
+            raise
+
+        task_outputs = [completed[i] for i in sorted(completed)]
+        return self._create_crew_output(task_outputs)
+
+    def _get_replayed_dag_outputs(
+        self, tasks: List[Task], start_index: Optional[int]
+    ) -> Dict[int, TaskOutput]:
+        """Returns the stored outputs of the tasks before ``start_index``."""
+        return {
+            task_index: task.output
+            for task_index, task in enumerate(tasks)
+            if start_index is not None and task_index < start_index and task.output
+        }
+
+    def _start_ready_dag_tasks(
+        self,
+        tasks: List[Task],
+        dependencies: List[Set[int]],
+        pending: List[int],
+        completed: Dict[int, TaskOutput],
+        busy_agents: Set[int],
+        capacity: int,
+        was_replayed: bool,
+    ) -> List[Tuple[int, BaseAgent, str, List[BaseTool]]]:
+        """Picks the pending tasks that can start now.
+
+        A task is ready once all its dependencies are completed and its agent is
+        not busy. Skipped conditional tasks are completed right away. The
+        returned tasks are removed from ``pending`` and their agents marked busy.
+
+        Returns:
+            List of (task index, agent, context, tools) to execute
+        """
+        ready: List[Tuple[int, BaseAgent, str, List[BaseTool]]] = []
+
+        for task_index in list(pending):
+            if len(ready) >= capacity:
+                break
+            if not dependencies[task_index].issubset(completed):
+                continue
+
+            task = tasks[task_index]
+            agent_to_use = self._get_agent_to_use(task)
+            if agent_to_use is None:
+                raise ValueError(
+                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                )
+            if id(agent_to_use) in busy_agents:
+                continue
+
+            dependency_outputs = [
+                completed[i] for i in sorted(dependencies[task_index])
+            ]
+            if isinstance(task, ConditionalTask):
+                skipped_task_output = self._handle_conditional_task(
+                    task, dependency_outputs, [], task_index, was_replayed
+                )
+                if skipped_task_output:
+                    completed[task_index] = skipped_task_output
+                    pending.remove(task_index)
+                    continue
+
+            tools_for_task = self._prepare_tools(
+                agent_to_use,
+                task,
+                cast(
+                    Union[List[Tool], List[BaseTool]],
+                    task.tools or agent_to_use.tools or [],
+                ),
+            )
+            self._log_task_start(task, agent_to_use.role)
+
+            ready.append(
+                (
+                    task_index,
+                    agent_to_use,
+                    self._get_context(task, dependency_outputs),
+                    tools_for_task,
+                )
+            )
+            busy_agents.add(id(agent_to_use))
+            pending.remove(task_index)
+
+        return ready
+
+    def _complete_dag_task(
+        self,
+        task: Task,
+        task_output: TaskOutput,
+        task_index: int,
+        completed: Dict[int, TaskOutput],
+        busy_agents: Set[int],
+        was_replayed: bool,
+    ) -> None:
+        """Records the output of a finished task and releases its agent."""
+        busy_agents.discard(id(self._get_agent_to_use(task)))
+        completed[task_index] = task_output
+        self._process_task_result(task, task_output)
+        self._store_execution_log(task, task_output, task_index, was_replayed)
+
+    def _check_dag_pending_tasks(self, pending: List[int]) -> None:
+        """Raises if tasks are left pending while nothing is running."""
+        if pending:
+            raise ValueError(
+                "Unable to schedule the remaining tasks, their dependencies can't be satisfied."
+            )
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -1096,6 +1572,21 @@ class Crew(FlowTrackable, BaseModel):
             )
         return task_outputs
 
+    async def _aprocess_async_tasks(
+        self,
+        pending_tasks: List[Tuple[Task, asyncio.Task[TaskOutput], int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        task_outputs: List[TaskOutput] = []
+        for pending_task, running_task, task_index in pending_tasks:
+            task_output = await running_task
+            task_outputs.append(task_output)
+            self._process_task_result(pending_task, task_output)
+            self._store_execution_log(
+                pending_task, task_output, task_index, was_replayed
+            )
+        return task_outputs
+
     def _find_task_index(
         self, task_id: str, stored_outputs: List[Any]
     ) -> Optional[int]:
@@ -1146,6 +1637,8 @@ class Crew(FlowTrackable, BaseModel):
             self.tasks[i].output = task_output
 
         self._logging_color = "bold_blue"
+        if self.process == Process.dag:
+            return self._execute_tasks_dag(self.tasks, start_index, True)
         result = self._execute_tasks(self.tasks, start_index, True)
         return result
 
@@ -1198,6 +1691,7 @@ class Crew(FlowTrackable, BaseModel):
             "_execution_span",
             "_file_handler",
             "_cache_handler",
+            "cache_handler",
             "_short_term_memory",
             "_long_term_memory",
             "_entity_memory",
@@ -1261,6 +1755,7 @@ class Crew(FlowTrackable, BaseModel):
             knowledge=existing_knowledge,
             manager_agent=manager_agent,
             manager_llm=manager_llm,
+            cache_handler=self.cache_handler,
         )
 
         return copied_crew
@@ -1285,7 +1780,7 @@ class Crew(FlowTrackable, BaseModel):
             agent.interpolate_inputs(inputs)
 
     def _finish_execution(self, final_string_output: str) -> None:
-        if self.max_rpm:
+        if self.max_rpm or self.max_tpm:
             self._rpm_controller.stop_rpm_counter()
 
     def calculate_usage_metrics(self) -> UsageMetrics:
@@ -1298,6 +1793,10 @@ class Crew(FlowTrackable, BaseModel):
         if self.manager_agent and hasattr(self.manager_agent, "_token_process"):
             token_sum = self.manager_agent._token_process.get_summary()
             total_usage_metrics.add_usage_metrics(token_sum)
+        if self.cache:
+            total_usage_metrics.cache_hits = self._cache_handler.hits
+            total_usage_metrics.cache_misses = self._cache_handler.misses
+            total_usage_metrics.cache_evictions = self._cache_handler.evictions
         self.usage_metrics = total_usage_metrics
         return total_usage_metrics
 
@@ -1348,6 +1847,23 @@ class Crew(FlowTrackable, BaseModel):
     def __repr__(self):
         return f"Crew(id={self.id}, process={self.process}, number_of_agents={len(self.agents)}, number_of_tasks={len(self.tasks)})"
 
+    def flush_memories(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the queued and buffered memories to be saved.
+
+        Args:
+            timeout: Maximum number of seconds to wait, None waits until done.
+
+        Returns:
+            True if every pending memory was saved, False if the timeout expired.
+        """
+        flushed = True
+        if self._memory_writer is not None:
+            flushed = self._memory_writer.flush(timeout)
+        for memory in (self._short_term_memory, self._entity_memory):
+            if memory is not None:
+                memory.flush()
+        return flushed
+
     def reset_memories(self, command_type: str) -> None:
         """Reset specific or all memories for the crew.
 
@@ -1378,6 +1894,7 @@ class Crew(FlowTrackable, BaseModel):
                 f"Invalid command type. Must be one of: {', '.join(sorted(VALID_TYPES))}"
             )
 
+        self.flush_memories()
         try:
             if command_type == "all":
                 self._reset_all_memories()
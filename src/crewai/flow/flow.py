@@ -1,15 +1,19 @@
 import asyncio
+import contextlib
 import copy
 import inspect
 import logging
+import weakref
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
     List,
+    Literal,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -28,6 +32,7 @@ from crewai.utilities.events.flow_events import (
     FlowFinishedEvent,
     FlowPlotEvent,
     FlowStartedEvent,
+    FlowStateEvent,
     MethodExecutionFailedEvent,
     MethodExecutionFinishedEvent,
     MethodExecutionStartedEvent,
@@ -54,6 +59,9 @@ StateT = TypeVar(
     "StateT", bound=Union[Dict[str, Any], BaseModel]
 )  # State validation type parameter
 
+# Listeners triggered by each method or router path, with their AND condition bit
+TriggerIndex = Dict[str, List[Tuple[str, int]]]
+
 
 def ensure_state_type(state: Any, expected_type: Type[StateT]) -> StateT:
     """Ensure state matches expected type with proper validation.
@@ -95,7 +103,22 @@ def ensure_state_type(state: Any, expected_type: Type[StateT]) -> StateT:
     raise TypeError(f"Invalid expected_type: {expected_type}")
 
 
-def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
+def _set_execution_limits(
+    func: Callable, max_concurrency: Optional[int], timeout: Optional[float]
+) -> None:
+    if max_concurrency is not None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        func.__max_concurrency__ = max_concurrency  # type: ignore[attr-defined]
+    if timeout is not None:
+        func.__timeout__ = timeout  # type: ignore[attr-defined]
+
+
+def start(
+    condition: Optional[Union[str, dict, Callable]] = None,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Callable:
     """
     Marks a method as a flow's starting point.
 
@@ -111,6 +134,13 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this start
         Default is None, meaning unconditional start.
+    max_concurrency : Optional[int], optional
+        Maximum number of executions of this method running at once, when it
+        is triggered again before finishing. Default is None, meaning no limit.
+    timeout : Optional[float], optional
+        Seconds after which an execution of this method fails with
+        asyncio.TimeoutError. Synchronous methods with a timeout run on a
+        thread, which keeps running after the timeout. Default is None.
 
     Returns
     -------
@@ -157,12 +187,17 @@ def start(condition: Optional[Union[str, dict, Callable]] = None) -> Callable:
                 raise ValueError(
                     "Condition must be a method, string, or a result of or_() or and_()"
                 )
+        _set_execution_limits(func, max_concurrency, timeout)
         return func
 
     return decorator
 
 
-def listen(condition: Union[str, dict, Callable]) -> Callable:
+def listen(
+    condition: Union[str, dict, Callable],
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Callable:
     """
     Creates a listener that executes when specified conditions are met.
 
@@ -177,6 +212,13 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
         - str: Name of a method that triggers this listener
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this listener
+    max_concurrency : Optional[int], optional
+        Maximum number of executions of this method running at once, when it
+        is triggered again before finishing. Default is None, meaning no limit.
+    timeout : Optional[float], optional
+        Seconds after which an execution of this method fails with
+        asyncio.TimeoutError. Synchronous methods with a timeout run on a
+        thread, which keeps running after the timeout. Default is None.
 
     Returns
     -------
@@ -217,12 +259,17 @@ def listen(condition: Union[str, dict, Callable]) -> Callable:
             raise ValueError(
                 "Condition must be a method, string, or a result of or_() or and_()"
             )
+        _set_execution_limits(func, max_concurrency, timeout)
         return func
 
     return decorator
 
 
-def router(condition: Union[str, dict, Callable]) -> Callable:
+def router(
+    condition: Union[str, dict, Callable],
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Callable:
     """
     Creates a routing method that directs flow execution based on conditions.
 
@@ -238,6 +285,13 @@ def router(condition: Union[str, dict, Callable]) -> Callable:
         - str: Name of a method that triggers this router
         - dict: Contains "type" ("AND"/"OR") and "methods" (list of triggers)
         - Callable: A method reference that triggers this router
+    max_concurrency : Optional[int], optional
+        Maximum number of executions of this method running at once, when it
+        is triggered again before finishing. Default is None, meaning no limit.
+    timeout : Optional[float], optional
+        Seconds after which an execution of this method fails with
+        asyncio.TimeoutError. Synchronous methods with a timeout run on a
+        thread, which keeps running after the timeout. Default is None.
 
     Returns
     -------
@@ -283,6 +337,7 @@ def router(condition: Union[str, dict, Callable]) -> Callable:
             raise ValueError(
                 "Condition must be a method, string, or a result of or_() or and_()"
             )
+        _set_execution_limits(func, max_concurrency, timeout)
         return func
 
     return decorator
@@ -380,6 +435,31 @@ def and_(*conditions: Union[str, dict, Callable]) -> dict:
     return {"type": "AND", "methods": methods}
 
 
+def _index_triggers(
+    listeners: Dict[str, Tuple[str, List[str]]], routers: Set[str]
+) -> Tuple[TriggerIndex, TriggerIndex, Dict[str, int]]:
+    """
+    Index the routers and the other listeners by the methods (or router paths)
+    triggering them, in declaration order.
+
+    Each entry pairs a listener with the bit of the trigger in its AND
+    condition, 0 for OR conditions. The returned masks have the bits of every
+    trigger of each AND condition set.
+    """
+    router_triggers: TriggerIndex = {}
+    listener_triggers: TriggerIndex = {}
+    and_masks: Dict[str, int] = {}
+    for listener_name, (condition_type, methods) in listeners.items():
+        index = router_triggers if listener_name in routers else listener_triggers
+        triggers = list(dict.fromkeys(methods))
+        if condition_type == "AND":
+            and_masks[listener_name] = (1 << len(triggers)) - 1
+        for position, trigger in enumerate(triggers):
+            bit = 1 << position if condition_type == "AND" else 0
+            index.setdefault(trigger, []).append((listener_name, bit))
+    return router_triggers, listener_triggers, and_masks
+
+
 class FlowMeta(type):
     def __new__(mcs, name, bases, dct):
         cls = super().__new__(mcs, name, bases, dct)
@@ -416,10 +496,17 @@ class FlowMeta(type):
                         if possible_returns:
                             router_paths[attr_name] = possible_returns
 
+        router_triggers, listener_triggers, and_masks = _index_triggers(
+            listeners, routers
+        )
+
         setattr(cls, "_start_methods", start_methods)
         setattr(cls, "_listeners", listeners)
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
+        setattr(cls, "_router_triggers", router_triggers)
+        setattr(cls, "_listener_triggers", listener_triggers)
+        setattr(cls, "_and_masks", and_masks)
 
         return cls
 
@@ -435,7 +522,19 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _router_triggers: TriggerIndex = {}
+    _listener_triggers: TriggerIndex = {}
+    _and_masks: Dict[str, int] = {}
     initial_state: Union[Type[T], T, None] = None
+    # How method execution events get the state: "lazy" only copies it when
+    # a handler reads or keeps the event, "eager" copies it for every event
+    # and "live" passes the state itself, without copying it.
+    event_state: Literal["lazy", "eager", "live"] = "lazy"
+    # Maximum number of flow methods running at once, None for no limit.
+    max_concurrency: Optional[int] = None
+    # Run synchronous methods on the event loop's thread pool, so they don't
+    # block the other branches of the flow.
+    offload_sync_methods: bool = False
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -458,9 +557,14 @@ class Flow(Generic[T], metaclass=FlowMeta):
         # Initialize basic instance attributes
         self._methods: Dict[str, Callable] = {}
         self._method_execution_counts: Dict[str, int] = {}
-        self._pending_and_listeners: Dict[str, Set[str]] = {}
+        # Bits of the triggers of each AND condition that already fired.
+        self._fired_and_triggers: Dict[str, int] = {}
         self._method_outputs: List[Any] = []  # List to store all method outputs
         self._persistence: Optional[FlowPersistence] = persistence
+        # Persistences that saved a state, including method-level ones, by id.
+        self._saving_persistences: Dict[int, FlowPersistence] = {}
+        self._concurrency_limit: Optional[asyncio.Semaphore] = None
+        self._method_limits: Dict[str, asyncio.Semaphore] = {}
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -578,6 +682,27 @@ class Flow(Generic[T], metaclass=FlowMeta):
     def _copy_state(self) -> T:
         return copy.deepcopy(self._state)
 
+    def _emit_state_event(
+        self, event_type: Type[FlowStateEvent], **fields: Any
+    ) -> None:
+        """Emit an event carrying the state, as set by ``event_state``."""
+        if self.event_state == "eager":
+            crewai_event_bus.emit(self, event_type(state=self._copy_state(), **fields))
+            return
+        if self.event_state == "live":
+            crewai_event_bus.emit(self, event_type(state=self._state, **fields))
+            return
+
+        event = event_type(state_snapshot=self._copy_state, **fields)
+        crewai_event_bus.emit(self, event)
+        # A handler kept the event without reading its state: take the
+        # snapshot before the state changes.
+        kept = weakref.ref(event)
+        del event
+        retained = kept()
+        if retained is not None:
+            retained.take_state_snapshot()
+
     @property
     def state(self) -> T:
         return self._state
@@ -780,12 +905,28 @@ class Flow(Generic[T], metaclass=FlowMeta):
         if inputs is not None and "id" not in inputs:
             self._initialize_state(inputs)
 
+        # Semaphores are created for each run, as they belong to its event loop.
+        self._concurrency_limit = (
+            asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        )
+        self._method_limits = {}
+
         tasks = [
             self._execute_start_method(start_method)
             for start_method in self._start_methods
         ]
         await asyncio.gather(*tasks)
 
+        # Saves may have been deferred to the end of a loop iteration.
+        persistences = dict(self._saving_persistences)
+        if self._persistence is not None:
+            persistences[id(self._persistence)] = self._persistence
+        for persistence in persistences.values():
+            try:
+                persistence.flush()
+            except Exception as e:
+                raise RuntimeError(f"State persistence failed: {str(e)}") from e
+
         final_output = self._method_outputs[-1] if self._method_outputs else None
 
         crewai_event_bus.emit(
@@ -829,37 +970,27 @@ class Flow(Generic[T], metaclass=FlowMeta):
             dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
                 kwargs or {}
             )
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionStartedEvent(
-                    type="method_execution_started",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    params=dumped_params,
-                    state=self._copy_state(),
-                ),
+            self._emit_state_event(
+                MethodExecutionStartedEvent,
+                type="method_execution_started",
+                method_name=method_name,
+                flow_name=self.__class__.__name__,
+                params=dumped_params,
             )
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+            result = await self._run_method(method_name, method, *args, **kwargs)
 
             self._method_outputs.append(result)
             self._method_execution_counts[method_name] = (
                 self._method_execution_counts.get(method_name, 0) + 1
             )
 
-            crewai_event_bus.emit(
-                self,
-                MethodExecutionFinishedEvent(
-                    type="method_execution_finished",
-                    method_name=method_name,
-                    flow_name=self.__class__.__name__,
-                    state=self._copy_state(),
-                    result=result,
-                ),
+            self._emit_state_event(
+                MethodExecutionFinishedEvent,
+                type="method_execution_finished",
+                method_name=method_name,
+                flow_name=self.__class__.__name__,
+                result=result,
             )
 
             return result
@@ -875,6 +1006,37 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    async def _run_method(
+        self, method_name: str, method: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run a flow method within its own and the flow's concurrency limits, and
+        its timeout. Only the method itself counts towards the limits, not the
+        listeners it triggers, which would otherwise wait on their trigger.
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            max_concurrency = getattr(method, "__max_concurrency__", None)
+            if max_concurrency is not None:
+                limit = self._method_limits.get(method_name)
+                if limit is None:
+                    limit = self._method_limits[method_name] = asyncio.Semaphore(
+                        max_concurrency
+                    )
+                await stack.enter_async_context(limit)
+            if self._concurrency_limit is not None:
+                await stack.enter_async_context(self._concurrency_limit)
+
+            timeout = getattr(method, "__timeout__", None)
+            if asyncio.iscoroutinefunction(method):
+                execution = method(*args, **kwargs)
+            elif self.offload_sync_methods or timeout is not None:
+                execution = asyncio.to_thread(method, *args, **kwargs)
+            else:
+                return method(*args, **kwargs)
+            if timeout is None:
+                return await execution
+            return await asyncio.wait_for(execution, timeout)
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -961,33 +1123,24 @@ class Flow(Generic[T], metaclass=FlowMeta):
         - Handles both OR and AND conditions:
           * OR: Triggers if any condition is met
           * AND: Triggers only when all conditions are met
-        - Maintains state for AND conditions using _pending_and_listeners
-        - Separates router and normal listener evaluation
+        - Looks the trigger up in the indexes built when the class is created,
+          so only the listeners of this trigger are considered
+        - Tracks the fired triggers of AND conditions as bitmasks in
+          _fired_and_triggers
         """
+        index = self._router_triggers if router_only else self._listener_triggers
         triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
+        for listener_name, bit in index.get(trigger_method, ()):
+            if not bit:
+                triggered.append(listener_name)
                 continue
-
-            if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
-            elif condition_type == "AND":
-                # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
-
-                if not self._pending_and_listeners[listener_name]:
-                    # All required methods have been executed
-                    triggered.append(listener_name)
-                    # Reset pending methods for this listener
-                    self._pending_and_listeners.pop(listener_name, None)
+            fired = self._fired_and_triggers.get(listener_name, 0) | bit
+            if fired == self._and_masks[listener_name]:
+                # All required methods have been executed
+                triggered.append(listener_name)
+                self._fired_and_triggers.pop(listener_name, None)
+            else:
+                self._fired_and_triggers[listener_name] = fired
 
         return triggered
 
@@ -51,3 +51,7 @@ class FlowPersistence(abc.ABC):
             The most recent state as a dictionary, or None if no state exists
         """
         pass
+
+    def flush(self) -> None:
+        """Write the states whose saving was deferred, if the backend defers any."""
+        pass
@@ -100,6 +100,10 @@ class PersistenceDecorator:
                     method_name=method_name,
                     state_data=state,
                 )
+                # Lets the flow write deferred saves when it finishes
+                saving = getattr(flow_instance, "_saving_persistences", None)
+                if saving is not None:
+                    saving[id(persistence_instance)] = persistence_instance
             except Exception as e:
                 error_msg = LOG_MESSAGES["save_error"].format(method_name, str(e))
                 cls._printer.print(error_msg, color="red")
@@ -0,0 +1,103 @@
+"""
+Minimal JSON Patch (RFC 6902) support, used to persist flow states as deltas.
+
+Only the ``add``, ``remove`` and ``replace`` operations are produced and
+applied, which is all it takes to turn one JSON document into another.
+"""
+
+from typing import Any, Dict, List
+
+Patch = List[Dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(old: Any, new: Any) -> bool:
+    """Equality telling apart values Python finds equal, like ``1``, ``1.0`` and
+    ``True``, but JSON doesn't."""
+    if type(old) is not type(new):
+        return False
+    if isinstance(new, dict):
+        return old.keys() == new.keys() and all(_same(old[k], new[k]) for k in new)
+    if isinstance(new, list):
+        return len(old) == len(new) and all(map(_same, old, new))
+    return old == new
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> Patch:
+    """
+    Return the operations turning the JSON document ``old`` into ``new``.
+
+    Objects, and arrays of the same length, are compared member by member.
+    Items appended to an array are added one by one. Other changed values are
+    replaced whole.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(new, dict):
+        patch: Patch = [
+            {"op": "remove", "path": f"{path}/{_escape(key)}"}
+            for key in old
+            if key not in new
+        ]
+        for key, value in new.items():
+            member = f"{path}/{_escape(key)}"
+            if key not in old:
+                patch.append({"op": "add", "path": member, "value": value})
+            elif not _same(old[key], value):
+                patch.extend(make_patch(old[key], value, member))
+        return patch
+
+    if isinstance(new, list):
+        if len(new) == len(old):
+            return [
+                operation
+                for i, (old_item, new_item) in enumerate(zip(old, new))
+                if not _same(old_item, new_item)
+                for operation in make_patch(old_item, new_item, f"{path}/{i}")
+            ]
+        if len(new) > len(old) and _same(new[: len(old)], old):
+            return [
+                {"op": "add", "path": f"{path}/-", "value": item}
+                for item in new[len(old) :]
+            ]
+
+    if not _same(old, new):
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """Apply ``patch`` to ``document``, in place when possible, and return it."""
+    for operation in patch:
+        tokens = [_unescape(token) for token in operation["path"].split("/")[1:]]
+        if not tokens:
+            document = operation.get("value")
+            continue
+
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        op, last = operation["op"], tokens[-1]
+        if isinstance(parent, list):
+            if op == "remove":
+                del parent[int(last)]
+            elif op == "add" and last == "-":
+                parent.append(operation["value"])
+            elif op == "add":
+                parent.insert(int(last), operation["value"])
+            else:
+                parent[int(last)] = operation["value"]
+        elif op == "remove":
+            del parent[last]
+        else:
+            parent[last] = operation["value"]
+    return document
@@ -2,15 +2,50 @@
 SQLite-based implementation of flow state persistence.
 """
 
+import asyncio
 import json
-import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
+from crewai.utilities.sqlite_pool import sqlite_pool
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS flow_states (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        flow_uuid TEXT NOT NULL,
+        method_name TEXT NOT NULL,
+        timestamp DATETIME NOT NULL,
+        state_json TEXT NOT NULL
+    )
+    """,
+    # Add index for faster UUID lookups
+    """
+    CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
+    ON flow_states(flow_uuid)
+    """,
+    # Rows of delta mode holding a JSON patch against the previous row
+    """
+    ALTER TABLE flow_states ADD COLUMN is_delta INTEGER NOT NULL DEFAULT 0
+    """,
+]
+
+# flow_uuid, method_name, timestamp, state_json, is_delta
+_Row = Tuple[str, str, str, str, int]
+
+
+class _Checkpoint:
+    """The last state saved for a flow, and the deltas saved since a snapshot."""
+
+    def __init__(self, state: Any):
+        self.state = state
+        self.deltas = 0
 
 
 class SQLiteFlowPersistence(FlowPersistence):
@@ -19,19 +54,35 @@ class SQLiteFlowPersistence(FlowPersistence):
     This class provides a simple, file-based persistence implementation using SQLite.
     It's suitable for development and testing, or for production use cases with
     moderate performance requirements.
+
+    In "delta" mode, each save stores a JSON patch against the previous save
+    of the flow instead of its full state, and every ``snapshot_interval``
+    deltas a full snapshot replaces them. States saved from a running event
+    loop are written together at the end of the current loop iteration; if
+    that write fails, they're kept and written again by the next ``flush``,
+    which raises if it fails too.
     """
 
     db_path: str
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        mode: Literal["full", "delta"] = "full",
+        snapshot_interval: int = 20,
+    ):
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            mode: "full" to store the whole state on every save, "delta" to
+                  store the changes since the previous save.
+            snapshot_interval: Number of deltas after which a full snapshot
+                               of the state is stored again, in delta mode.
 
         Raises:
-            ValueError: If db_path is invalid
+            ValueError: If db_path, mode or snapshot_interval is invalid
         """
         from crewai.utilities.paths import db_storage_path
 
@@ -41,30 +92,24 @@ class SQLiteFlowPersistence(FlowPersistence):
         if not path:
             raise ValueError("Database path must be provided")
 
+        if mode not in ("full", "delta"):
+            raise ValueError(f"Invalid mode '{mode}', expected 'full' or 'delta'")
+        if snapshot_interval <= 0:
+            raise ValueError("snapshot_interval must be a positive integer")
+
         self.db_path = path  # Now mypy knows this is str
+        self.mode = mode
+        self.snapshot_interval = snapshot_interval
+        self._checkpoints: Dict[str, _Checkpoint] = {}
+        self._pending: List[_Row] = []
+        self._flush_scheduled = False
+        self._lock = threading.RLock()
         self.init_db()
 
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-            CREATE TABLE IF NOT EXISTS flow_states (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                flow_uuid TEXT NOT NULL,
-                method_name TEXT NOT NULL,
-                timestamp DATETIME NOT NULL,
-                state_json TEXT NOT NULL
-            )
-            """
-            )
-            # Add index for faster UUID lookups
-            conn.execute(
-                """
-            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
-            ON flow_states(flow_uuid)
-            """
-            )
+        self._pool = sqlite_pool(self.db_path)
+        self._pool.migrate("flow_states", MIGRATIONS)
 
     def save_state(
         self,
@@ -89,23 +134,89 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        state_json = json.dumps(state_dict)
+        timestamp = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            if self.mode == "delta":
+                row = self._delta_row(flow_uuid, method_name, timestamp, state_json)
+            else:
+                row = (flow_uuid, method_name, timestamp, state_json, 0)
+            self._pending.append(row)
+
+            loop: Optional[asyncio.AbstractEventLoop] = None
+            if self.mode == "delta":
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    pass
+            if loop is None:
+                self.flush()
+            elif not self._flush_scheduled:
+                loop.call_soon(self._deferred_flush)
+                self._flush_scheduled = True
+
+    def _delta_row(
+        self, flow_uuid: str, method_name: str, timestamp: str, state_json: str
+    ) -> _Row:
+        """The row saving a state in delta mode, a snapshot or a delta."""
+        state = json.loads(state_json)
+        checkpoint = self._checkpoints.get(flow_uuid)
+        if checkpoint is None or checkpoint.deltas >= self.snapshot_interval:
+            self._checkpoints[flow_uuid] = _Checkpoint(state)
+            return (flow_uuid, method_name, timestamp, state_json, 0)
+
+        patch = make_patch(checkpoint.state, state)
+        checkpoint.state = state
+        checkpoint.deltas += 1
+        return (flow_uuid, method_name, timestamp, json.dumps(patch), 1)
+
+    def _deferred_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            # The states stay pending, the next flush writes them or raises.
+            pass
+
+    def flush(self) -> None:
+        """Write the saved states not written yet, in a single transaction."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            self._flush_scheduled = False
+            if not rows:
+                return
+            try:
+                self._write(rows)
+            except Exception:
+                self._pending[:0] = rows
+                raise
+
+    def _write(self, rows: List[_Row]) -> None:
+        with self._pool.connection() as conn:
+            conn.executemany(
                 """
             INSERT INTO flow_states (
                 flow_uuid,
                 method_name,
                 timestamp,
-                state_json
-            ) VALUES (?, ?, ?, ?)
+                state_json,
+                is_delta
+            ) VALUES (?, ?, ?, ?, ?)
             """,
-                (
-                    flow_uuid,
-                    method_name,
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(state_dict),
-                ),
+                rows,
             )
+            if self.mode == "delta":
+                # Deltas before a flow's latest snapshot are never replayed.
+                compacted = {row[0] for row in rows if not row[4]}
+                conn.executemany(
+                    """
+                DELETE FROM flow_states
+                WHERE flow_uuid = ? AND is_delta = 1 AND id < (
+                    SELECT MAX(id) FROM flow_states
+                    WHERE flow_uuid = ? AND is_delta = 0
+                )
+                """,
+                    [(flow_uuid, flow_uuid) for flow_uuid in compacted],
+                )
 
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Load the most recent state for a given flow UUID.
@@ -116,19 +227,27 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush()
+        with self._pool.connection() as conn:
             cursor = conn.execute(
                 """
-            SELECT state_json
+            SELECT state_json, is_delta
             FROM flow_states
-            WHERE flow_uuid = ?
-            ORDER BY id DESC
-            LIMIT 1
+            WHERE flow_uuid = ? AND id >= COALESCE((
+                SELECT MAX(id) FROM flow_states
+                WHERE flow_uuid = ? AND is_delta = 0
+            ), 0)
+            ORDER BY id
             """,
-                (flow_uuid,),
+                (flow_uuid, flow_uuid),
             )
-            row = cursor.fetchone()
-
-        if row:
-            return json.loads(row[0])
-        return None
+            rows = cursor.fetchall()
+
+        # The latest snapshot, then the deltas saved after it.
+        state: Optional[Dict[str, Any]] = None
+        for state_json, is_delta in rows:
+            if not is_delta:
+                state = json.loads(state_json)
+            elif state is not None:
+                state = apply_patch(state, json.loads(state_json))
+        return state
@@ -0,0 +1,268 @@
+"""Chunking strategies used by knowledge sources to split their text."""
+
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, NamedTuple, Tuple
+
+
+class Span(NamedTuple):
+    """A chunk, as the position of its text in the source text."""
+
+    offset: int
+    length: int
+
+    def text(self, source: str) -> str:
+        return source[self.offset : self.offset + self.length]
+
+
+class BaseChunker(ABC):
+    """
+    Splits text into chunks of at most ``chunk_size`` units, consecutive chunks
+    sharing up to ``chunk_overlap`` units.
+    """
+
+    def __init__(self, chunk_size: int = 4000, chunk_overlap: int = 200):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    @abstractmethod
+    def spans(self, text: str) -> Iterator[Span]:
+        """Yield the chunks of ``text`` as spans, without copying it."""
+
+    @abstractmethod
+    def stream(self, segments: Iterable[str]) -> Iterator[str]:
+        """
+        Yield the chunks of the text arriving in ``segments``, the same ones
+        ``chunks`` would give for the joined text, while only keeping the text
+        of the chunk being built in memory.
+        """
+
+    def chunks(self, text: str) -> Iterator[str]:
+        for span in self.spans(text):
+            yield span.text(text)
+
+    def __repr__(self) -> str:
+        # Used as the chunking settings of the files saved with this chunker.
+        return f"{type(self).__name__}({self.chunk_size}, {self.chunk_overlap})"
+
+
+class CharacterChunker(BaseChunker):
+    """Slices the text every ``chunk_size - chunk_overlap`` characters."""
+
+    def spans(self, text: str) -> Iterator[Span]:
+        for i in range(0, len(text), self.chunk_size - self.chunk_overlap):
+            yield Span(i, min(self.chunk_size, len(text) - i))
+
+    def stream(self, segments: Iterable[str]) -> Iterator[str]:
+        step = self.chunk_size - self.chunk_overlap
+        if step <= 0:
+            yield from self.chunks("".join(segments))
+            return
+        buffer = ""
+        for segment in segments:
+            buffer += segment
+            start = 0
+            while len(buffer) - start >= self.chunk_size:
+                yield buffer[start : start + self.chunk_size]
+                start += step
+            buffer = buffer[start:]
+        while buffer:
+            yield buffer[: self.chunk_size]
+            buffer = buffer[step:]
+
+
+class _Piece(NamedTuple):
+    start: int
+    end: int
+    size: int
+
+
+class _Window:
+    """The text of a stream from ``base`` onwards."""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.base = 0
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.text)
+
+    def slice(self, start: int, end: int) -> str:
+        return self.text[start - self.base : end - self.base]
+
+    def release(self, offset: int) -> None:
+        # One character is kept before ``offset`` for the separators that
+        # look behind, like line starts.
+        drop = offset - 1 - self.base
+        if drop > 0:
+            self.text = self.text[drop:]
+            self.base += drop
+
+
+class SeparatorChunker(BaseChunker):
+    """
+    Splits the text at the first of ``separators`` (regular expressions, from
+    the coarsest to the finest) that gives pieces fitting in a chunk, then
+    packs consecutive pieces into chunks. Text is only cut mid-piece when even
+    the finest separator leaves a piece bigger than a chunk.
+
+    Args:
+        chunk_size: Maximum size of a chunk, as measured by ``length_function``.
+        chunk_overlap: Maximum size of the pieces repeated from the end of a
+            chunk at the start of the next one.
+        length_function: Measures the size of a text. Defaults to its number
+            of characters.
+    """
+
+    separators: Tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        chunk_size: int = 4000,
+        chunk_overlap: int = 200,
+        length_function: Callable[[str], int] = len,
+    ):
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        super().__init__(chunk_size, chunk_overlap)
+        self.length_function = length_function
+        self._patterns = [re.compile(sep, re.MULTILINE) for sep in self.separators]
+
+    def spans(self, text: str) -> Iterator[Span]:
+        window = _Window()
+        for start, end in self._pack(self._pieces(window, [text])):
+            yield Span(start, end - start)
+
+    def stream(self, segments: Iterable[str]) -> Iterator[str]:
+        window = _Window()
+        for start, end in self._pack(self._pieces(window, segments)):
+            yield window.slice(start, end)
+            # Later chunks never start before this one.
+            window.release(start)
+
+    def _pieces(self, window: _Window, segments: Iterable[str]) -> Iterator[_Piece]:
+        """
+        Split the text arriving in ``segments`` at the coarsest separator. The
+        text from its last match on is held back until more text arrives, since
+        the separator could continue there.
+        """
+        scanned = 0
+        for segment in segments:
+            window.text += segment
+            if not self._patterns:
+                continue
+            for cut in self._cuts(window, 0, scanned, window.end)[:-1]:
+                yield from self._split(window, scanned, cut, 1)
+                scanned = cut
+        if self._patterns:
+            for cut in self._cuts(window, 0, scanned, window.end):
+                yield from self._split(window, scanned, cut, 1)
+                scanned = cut
+        if scanned < window.end:
+            yield from self._split(window, scanned, window.end, 1)
+
+    def _split(
+        self, window: _Window, start: int, end: int, level: int
+    ) -> Iterator[_Piece]:
+        size = self.length_function(window.slice(start, end))
+        if size <= self.chunk_size:
+            yield _Piece(start, end, size)
+        elif level < len(self._patterns):
+            for cut in self._cuts(window, level, start, end) + [end]:
+                yield from self._split(window, start, cut, level + 1)
+                start = cut
+        else:
+            # A chunk_size characters text is never bigger than chunk_size
+            # characters or tokens.
+            for cut in range(start, end, self.chunk_size):
+                piece_end = min(cut + self.chunk_size, end)
+                yield _Piece(
+                    cut,
+                    piece_end,
+                    self.length_function(window.slice(cut, piece_end)),
+                )
+
+    def _cuts(self, window: _Window, level: int, start: int, end: int) -> List[int]:
+        """Offsets between ``start`` and ``end`` right after a separator."""
+        matches = self._patterns[level].finditer(
+            window.text, start - window.base, end - window.base
+        )
+        cuts = [window.base + match.end() for match in matches]
+        return [cut for cut in dict.fromkeys(cuts) if start < cut < end]
+
+    def _pack(self, pieces: Iterable[_Piece]) -> Iterator[Tuple[int, int]]:
+        current: Deque[_Piece] = deque()
+        size = 0
+        for piece in pieces:
+            if current and size + piece.size > self.chunk_size:
+                yield current[0].start, current[-1].end
+                while current and (
+                    size > self.chunk_overlap or size + piece.size > self.chunk_size
+                ):
+                    size -= current.popleft().size
+            current.append(piece)
+            size += piece.size
+        if current:
+            yield current[0].start, current[-1].end
+
+    def __repr__(self) -> str:
+        length = getattr(self.length_function, "__name__", "custom")
+        return (
+            f"{type(self).__name__}({self.chunk_size}, {self.chunk_overlap}, {length})"
+        )
+
+
+class SentenceChunker(SeparatorChunker):
+    """Keeps paragraphs, then sentences, then words whole."""
+
+    separators = (r"\n\s*\n", r"(?<=[.!?])\s+", r"\s+")
+
+
+class MarkdownChunker(SeparatorChunker):
+    """
+    Keeps sections, then blocks like paragraphs, lists and tables, then lines
+    and words whole. Sections start at headings.
+    """
+
+    separators = (r"^(?=#{1,6}\s)", r"\n\s*\n", r"\n", r"\s+")
+
+
+class RowChunker(SeparatorChunker):
+    """Keeps the rows (lines) of tabular text, like CSV, whole."""
+
+    separators = (r"\n",)
+
+
+class TokenChunker(SentenceChunker):
+    """
+    Sentence-aware chunker measuring chunks in tokens of a ``tiktoken``
+    encoding, so they fit the input limit of the embedding model.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        chunk_overlap: int = 64,
+        encoding_name: str = "cl100k_base",
+    ):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError(
+                "tiktoken is not installed. Please install it with: pip install tiktoken"
+            )
+        encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding_name = encoding_name
+        super().__init__(
+            chunk_size,
+            chunk_overlap,
+            lambda text: len(encoding.encode(text, disallowed_special=())),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.chunk_size}, {self.chunk_overlap}, "
+            f"{self.encoding_name})"
+        )
@@ -1,10 +1,12 @@
 import os
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.local_knowledge_storage import LocalKnowledgeStorage
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
 
@@ -16,6 +18,8 @@ class Knowledge(BaseModel):
         sources: List[BaseKnowledgeSource] = Field(default_factory=list)
         storage: Optional[KnowledgeStorage] = Field(default=None)
         embedder: Optional[Dict[str, Any]] = None
+        vector_store: str = "chroma"
+        purge_removed_files: bool = False
     """
 
     sources: List[BaseKnowledgeSource] = Field(default_factory=list)
@@ -23,6 +27,7 @@ class Knowledge(BaseModel):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     embedder: Optional[Dict[str, Any]] = None
     collection_name: Optional[str] = None
+    purge_removed_files: bool = False
 
     def __init__(
         self,
@@ -30,11 +35,18 @@ class Knowledge(BaseModel):
         sources: List[BaseKnowledgeSource],
         embedder: Optional[Dict[str, Any]] = None,
         storage: Optional[KnowledgeStorage] = None,
+        vector_store: str = "chroma",
+        purge_removed_files: bool = False,
         **data,
     ):
         super().__init__(**data)
+        self.purge_removed_files = purge_removed_files
         if storage:
             self.storage = storage
+        elif vector_store == "local":
+            self.storage = LocalKnowledgeStorage(
+                embedder=embedder, collection_name=collection_name
+            )
         else:
             self.storage = KnowledgeStorage(
                 embedder=embedder, collection_name=collection_name
@@ -70,6 +82,16 @@ class Knowledge(BaseModel):
         except Exception as e:
             raise e
 
+        # Files no longer part of the knowledge are removed from the collection.
+        # Opt-in, since crews and agents alike share a collection by name.
+        if self.purge_removed_files and isinstance(self.storage, KnowledgeStorage):
+            self.storage.purge_files(
+                Path(path).resolve()
+                for source in self.sources
+                for path in getattr(source, "safe_file_paths", [])
+                if isinstance(path, Path)
+            )
+
     def reset(self) -> None:
         if self.storage:
             self.storage.reset()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -7,6 +9,9 @@ class KnowledgeConfig(BaseModel):
     Args:
         results_limit (int): The number of relevant documents to return.
         score_threshold (float): The minimum score for a document to be considered relevant.
+        vector_store (str): Where the knowledge is stored, "chroma" or "local".
+        purge_removed_files (bool): Whether to delete the chunks of the files
+            saved in the collection that the knowledge no longer lists.
     """
 
     results_limit: int = Field(default=3, description="The number of results to return")
@@ -14,3 +19,14 @@ class KnowledgeConfig(BaseModel):
         default=0.35,
         description="The minimum score for a result to be considered relevant",
     )
+    vector_store: Literal["chroma", "local"] = Field(
+        default="chroma",
+        description="Vector store of the knowledge: a ChromaDB client, or 'local' "
+        "for an in-process index over a memory-mapped matrix",
+    )
+    purge_removed_files: bool = Field(
+        default=False,
+        description="Whether to delete the chunks of the files saved in the "
+        "collection that the knowledge no longer lists. Only enable it when no "
+        "other crew or agent shares the collection",
+    )
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 from pydantic import Field, field_validator
 
@@ -43,13 +43,22 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
         """Post-initialization method to load content."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if not self.streaming:
+            self.content = self.load_content()
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess file content. Should be overridden by subclasses. Assume that the file path is relative to the project root in the knowledge directory."""
         pass
 
+    def _reader(self) -> Optional[Callable[[Path], Iterable[str]]]:
+        """
+        Module-level function yielding the text of a file piece by piece, used
+        to stream and parallelize loading. Sources without one are read with
+        ``load_content``.
+        """
+        return None
+
     def validate_content(self):
         """Validate the paths."""
         for path in self.safe_file_paths:
@@ -67,6 +76,19 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
+    def add(self) -> None:
+        """
+        Chunk the content of the files and save it, skipping the files that
+        haven't changed since they were last saved.
+        """
+        reader = self._reader()
+        if not self.streaming:
+            self._save_file_documents(self.content)
+        elif reader is None:
+            self._save_file_documents(self.load_content())
+        else:
+            self._save_file_stream(reader, self.safe_file_paths)
+
     def _save_documents(self):
         """Save the documents to the storage."""
         if self.storage:
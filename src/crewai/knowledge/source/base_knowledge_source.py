@@ -1,10 +1,31 @@
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from crewai.knowledge.chunking import BaseChunker, CharacterChunker
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.constants import EMBEDDING_BATCH_SIZE
+
+T = TypeVar("T")
 
 
 class BaseKnowledgeSource(BaseModel, ABC):
@@ -12,6 +33,11 @@ class BaseKnowledgeSource(BaseModel, ABC):
 
     chunk_size: int = 4000
     chunk_overlap: int = 200
+    chunker: Optional[BaseChunker] = Field(
+        default=None,
+        description="Strategy splitting the content into chunks. Defaults to "
+        "slicing it every chunk_size - chunk_overlap characters.",
+    )
     chunks: List[str] = Field(default_factory=list)
     chunk_embeddings: List[np.ndarray] = Field(default_factory=list)
 
@@ -19,6 +45,15 @@ class BaseKnowledgeSource(BaseModel, ABC):
     storage: Optional[KnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
+    streaming: bool = Field(
+        default=False,
+        description="Read files while they are added instead of when the source "
+        "is created, without keeping their content or chunks in memory.",
+    )
+    load_workers: int = Field(
+        default=1,
+        description="Number of processes parsing files in parallel.",
+    )
 
     @abstractmethod
     def validate_content(self) -> Any:
@@ -36,10 +71,10 @@ class BaseKnowledgeSource(BaseModel, ABC):
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        return list(self._get_chunker().chunks(text))
+
+    def _get_chunker(self) -> BaseChunker:
+        return self.chunker or CharacterChunker(self.chunk_size, self.chunk_overlap)
 
     def _save_documents(self):
         """
@@ -50,3 +85,137 @@ class BaseKnowledgeSource(BaseModel, ABC):
             self.storage.save(self.chunks)
         else:
             raise ValueError("No storage found to save documents.")
+
+    def _chunk_stream(self, segments: Iterable[str]) -> Iterator[str]:
+        """
+        Split text arriving in segments into chunks, yielding the same chunks
+        as ``_chunk_text`` on the joined text while only buffering about one
+        chunk of it.
+        """
+        return self._get_chunker().stream(segments)
+
+    def _map_files(
+        self, function: Callable[[Path], T], paths: List[Path]
+    ) -> Iterator[Tuple[Path, T]]:
+        """
+        Apply ``function`` to each path, in order, lazily. With more than one
+        ``load_workers`` the files are processed on a process pool, keeping at
+        most two results per worker waiting to be consumed.
+        """
+        if self.load_workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                yield path, function(path)
+            return
+
+        workers = min(self.load_workers, len(paths))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: Deque[Tuple[Path, Future]] = deque()
+            for path in paths:
+                pending.append((path, pool.submit(function, path)))
+                if len(pending) >= 2 * workers:
+                    done_path, future = pending.popleft()
+                    yield done_path, future.result()
+            while pending:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+
+    def _read_files(
+        self, reader: Callable[[Path], Iterable[str]], paths: List[Path]
+    ) -> Dict[Path, str]:
+        """Read the whole text of each file with ``reader``."""
+        return dict(self._map_files(partial(_read_text, reader), paths))
+
+    def _stream_files(
+        self, reader: Callable[[Path], Iterable[str]], paths: List[Path]
+    ) -> Iterator[Tuple[Path, Iterable[str]]]:
+        """
+        Yield the text of each file as it is read. Files parsed on the process
+        pool come back whole, otherwise their text is read piece by piece.
+        """
+        if self.load_workers > 1:
+            for path, text in self._map_files(partial(_read_text, reader), paths):
+                yield path, [text]
+        else:
+            for path in paths:
+                yield path, reader(path)
+
+    def _save_file_documents(self, files: Dict[Path, str]) -> None:
+        """
+        Chunk and save the text of each file, skipping the files whose chunks
+        were already saved from the same content with the same chunking.
+        """
+        self._save_files(
+            list(files), lambda paths: ((path, [files[path]]) for path in paths)
+        )
+
+    def _save_file_stream(
+        self, reader: Callable[[Path], Iterable[str]], paths: List[Path]
+    ) -> None:
+        """
+        Read, chunk and save the files one at a time, embedding their chunks in
+        batches, so neither the files nor their chunks are kept in memory.
+        Unchanged files are skipped before being read.
+        """
+        self._save_files(
+            paths, lambda changed: self._stream_files(reader, changed), streaming=True
+        )
+
+    def _save_files(
+        self,
+        paths: List[Path],
+        load: Callable[[List[Path]], Iterable[Tuple[Path, Iterable[str]]]],
+        streaming: bool = False,
+    ) -> None:
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        if not isinstance(self.storage, KnowledgeStorage) or not self.storage.manifest:
+            for _, segments in load(paths):
+                if streaming:
+                    for batch in _batched(
+                        self._chunk_stream(segments), EMBEDDING_BATCH_SIZE
+                    ):
+                        self.storage.save(batch)
+                else:
+                    self.chunks.extend(self._chunk_text("".join(segments)))
+            if not streaming:
+                self._save_documents()
+            return
+
+        chunking = (
+            f"{type(self).__name__}:{self.chunker!r}"
+            if self.chunker
+            else f"{type(self).__name__}:{self.chunk_size}:{self.chunk_overlap}"
+        )
+        content_hashes: Dict[Path, Callable[[], str]] = {}
+        for path in paths:
+            resolved = Path(path).resolve()
+            content_hash = lru_cache(maxsize=None)(partial(_hash_file, resolved))
+            if not self.storage.is_file_current(resolved, chunking, content_hash):
+                content_hashes[path] = content_hash
+        for path, segments in load(list(content_hashes)):
+            if streaming:
+                chunks: Iterable[str] = self._chunk_stream(segments)
+            else:
+                chunks = self._chunk_text("".join(segments))
+                self.chunks.extend(chunks)
+            self.storage.save_file(
+                Path(path).resolve(), chunks, content_hashes[path](), chunking
+            )
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_text(reader: Callable[[Path], Iterable[str]], path: Path) -> str:
+    return "".join(reader(path))
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -15,8 +15,11 @@ except ImportError:
 
 from pydantic import Field
 
-from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
-from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.knowledge.source.base_knowledge_source import (
+    BaseKnowledgeSource,
+    _batched,
+)
+from crewai.utilities.constants import EMBEDDING_BATCH_SIZE, KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
 
@@ -64,7 +67,8 @@ class CrewDoclingSource(BaseKnowledgeSource):
             )
             self.file_paths = self.file_path
         self.safe_file_paths = self.validate_content()
-        self.content = self._load_content()
+        if not self.streaming:
+            self.content = self._load_content()
 
     def _load_content(self) -> List["DoclingDocument"]:
         try:
@@ -81,6 +85,18 @@ class CrewDoclingSource(BaseKnowledgeSource):
             raise e
 
     def add(self) -> None:
+        if self.streaming:
+            # Documents are converted one by one as their chunks are saved.
+            if not self.storage:
+                raise ValueError("No storage found to save documents.")
+            chunks = (
+                chunk
+                for result in self.document_converter.convert_all(self.safe_file_paths)
+                for chunk in self._chunk_doc(result.document)
+            )
+            for batch in _batched(chunks, EMBEDDING_BATCH_SIZE):
+                self.storage.save(batch)
+            return
         if self.content is None:
             return
         for doc in self.content:
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from pydantic import Field, field_validator
@@ -98,7 +98,8 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             self.file_paths = self.file_path
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self._load_content()
+        if not self.streaming:
+            self.content = self._load_content()
 
     def _load_content(self) -> Dict[Path, Dict[str, str]]:
         """Load and preprocess Excel file content from multiple sheets.
@@ -112,19 +113,13 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             ImportError: If required dependencies are missing.
             FileNotFoundError: If the specified Excel file cannot be opened.
         """
-        pd = self._import_dependencies()
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            file_path = self.convert_to_path(file_path)
-            with pd.ExcelFile(file_path) as xl:
-                sheet_dict = {
-                    str(sheet_name): str(
-                        pd.read_excel(xl, sheet_name).to_csv(index=False)
-                    )
-                    for sheet_name in xl.sheet_names
-                }
-            content_dict[file_path] = sheet_dict
-        return content_dict
+        self._import_dependencies()
+        return dict(
+            self._map_files(
+                _read_excel,
+                [self.convert_to_path(path) for path in self.safe_file_paths],
+            )
+        )
 
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
@@ -145,25 +140,38 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
     def add(self) -> None:
         """
         Add Excel file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
+        and save the embeddings. Workbooks unchanged since they were last saved
+        are skipped.
         """
-        # Convert dictionary values to a single string if content is a dictionary
+        if self.streaming:
+            self._import_dependencies()
+            self._save_file_stream(_read_excel_text, self.safe_file_paths)
+            return
         # Updated to account for .xlsx workbooks with multiple tabs/sheets
-        content_str = ""
-        for value in self.content.values():
-            if isinstance(value, dict):
-                for sheet_value in value.values():
-                    content_str += str(sheet_value) + "\n"
-            else:
-                content_str += str(value) + "\n"
-
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        self._save_file_documents(
+            {
+                path: "".join(f"{sheet_value}\n" for sheet_value in sheets.values())
+                for path, sheets in self.content.items()
+            }
+        )
+
+
+def _read_excel_sheets(path: Path) -> Iterator[Tuple[str, str]]:
+    """Yield the name and CSV content of each sheet, parsing one at a time."""
+    import pandas as pd
+
+    with pd.ExcelFile(path) as xl:
+        for sheet_name in xl.sheet_names:
+            yield (
+                str(sheet_name),
+                str(pd.read_excel(xl, sheet_name).to_csv(index=False)),
+            )
+
+
+def _read_excel(path: Path) -> Dict[str, str]:
+    return dict(_read_excel_sheets(path))
+
+
+def _read_excel_text(path: Path) -> Iterator[str]:
+    for _, sheet in _read_excel_sheets(path):
+        yield f"{sheet}\n"
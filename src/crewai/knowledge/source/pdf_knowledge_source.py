@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
 
@@ -9,20 +9,14 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
 
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess PDF file content."""
-        pdfplumber = self._import_pdfplumber()
+        self._import_pdfplumber()
+        return self._read_files(
+            _read_pdf_pages, [self.convert_to_path(p) for p in self.safe_file_paths]
+        )
 
-        content = {}
-
-        for path in self.safe_file_paths:
-            text = ""
-            path = self.convert_to_path(path)
-            with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            content[path] = text
-        return content
+    def _reader(self) -> Callable[[Path], Iterable[str]]:
+        self._import_pdfplumber()
+        return _read_pdf_pages
 
     def _import_pdfplumber(self):
         """Dynamically import pdfplumber."""
@@ -35,19 +29,14 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
                 "pdfplumber is not installed. Please install it with: pip install pdfplumber"
             )
 
-    def add(self) -> None:
-        """
-        Add PDF file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+
+def _read_pdf_pages(path: Path) -> Iterator[str]:
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text + "\n"
+            # Release the objects parsed for the page once its text is out.
+            page.close()
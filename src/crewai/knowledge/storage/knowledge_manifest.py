@@ -0,0 +1,132 @@
+import json
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Set
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import sqlite_pool
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS knowledge_files (
+        collection TEXT NOT NULL,
+        path TEXT NOT NULL,
+        mtime REAL NOT NULL,
+        size INTEGER NOT NULL,
+        content_hash TEXT NOT NULL,
+        chunking TEXT NOT NULL,
+        chunk_ids TEXT NOT NULL,
+        PRIMARY KEY (collection, path)
+    )
+    """,
+]
+
+
+class KnowledgeFileRecord(NamedTuple):
+    path: str
+    mtime: float
+    size: int
+    content_hash: str
+    chunking: str
+    chunk_ids: List[str]
+
+
+class KnowledgeManifest:
+    """
+    Records which chunks were saved for each knowledge file of a collection,
+    along with the file's modification time, size, content hash and chunking
+    settings, so that unchanged files aren't chunked and embedded again.
+
+    Records are kept per ``scope``, identifying the vector store and embedder
+    the chunks were saved with, so that a collection of the same name in
+    another store or embedded by another model isn't taken as up to date.
+    """
+
+    def __init__(self, collection: str, db_path: Optional[str] = None, scope: str = ""):
+        self.collection = f"{scope}|{collection}" if scope else collection
+        self.db_path = db_path or str(Path(db_storage_path()) / "knowledge_manifest.db")
+        self._pool = sqlite_pool(self.db_path)
+        self._pool.migrate("knowledge_files", MIGRATIONS)
+
+    def get(self, path: str) -> Optional[KnowledgeFileRecord]:
+        row = (
+            self._pool.connection()
+            .execute(
+                "SELECT path, mtime, size, content_hash, chunking, chunk_ids "
+                "FROM knowledge_files WHERE collection = ? AND path = ?",
+                (self.collection, path),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return KnowledgeFileRecord(*row[:5], chunk_ids=json.loads(row[5]))
+
+    def put(self, record: KnowledgeFileRecord) -> None:
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO knowledge_files "
+                "(collection, path, mtime, size, content_hash, chunking, chunk_ids) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.collection,
+                    record.path,
+                    record.mtime,
+                    record.size,
+                    record.content_hash,
+                    record.chunking,
+                    json.dumps(record.chunk_ids),
+                ),
+            )
+
+    def delete(self, path: str) -> None:
+        with self._pool.connection() as conn:
+            conn.execute(
+                "DELETE FROM knowledge_files WHERE collection = ? AND path = ?",
+                (self.collection, path),
+            )
+
+    def paths(self) -> List[str]:
+        rows = (
+            self._pool.connection()
+            .execute(
+                "SELECT path FROM knowledge_files WHERE collection = ?",
+                (self.collection,),
+            )
+            .fetchall()
+        )
+        return [row[0] for row in rows]
+
+    def chunk_ids(self) -> Set[str]:
+        """Chunk ids saved for the files of the collection."""
+        rows = (
+            self._pool.connection()
+            .execute(
+                "SELECT chunk_ids FROM knowledge_files WHERE collection = ?",
+                (self.collection,),
+            )
+            .fetchall()
+        )
+        return {chunk_id for row in rows for chunk_id in json.loads(row[0])}
+
+    def chunk_ids_used_by_others(self, path: str) -> Set[str]:
+        """Chunk ids saved for the other files of the collection."""
+        rows = (
+            self._pool.connection()
+            .execute(
+                "SELECT chunk_ids FROM knowledge_files "
+                "WHERE collection = ? AND path != ?",
+                (self.collection, path),
+            )
+            .fetchall()
+        )
+        return {chunk_id for row in rows for chunk_id in json.loads(row[0])}
+
+    def clear(self, all_collections: bool = False) -> None:
+        with self._pool.connection() as conn:
+            if all_collections:
+                conn.execute("DELETE FROM knowledge_files")
+            else:
+                conn.execute(
+                    "DELETE FROM knowledge_files WHERE collection = ?",
+                    (self.collection,),
+                )
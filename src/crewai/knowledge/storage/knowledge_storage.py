@@ -4,7 +4,8 @@ import io
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import chromadb
 import chromadb.errors
@@ -13,9 +14,14 @@ from chromadb.api.types import OneOrMany
 from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_manifest import (
+    KnowledgeFileRecord,
+    KnowledgeManifest,
+)
 from crewai.utilities import EmbeddingConfigurator
-from crewai.utilities.chromadb import sanitize_collection_name
-from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.chromadb import query_collection, sanitize_collection_name
+from crewai.utilities.constants import EMBEDDING_BATCH_SIZE, KNOWLEDGE_DIRECTORY
+from crewai.utilities.embedding_cache import embedder_key, embedding_cache
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
 
@@ -46,6 +52,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     collection: Optional[chromadb.Collection] = None
     collection_name: Optional[str] = "knowledge"
     app: Optional[ClientAPI] = None
+    manifest: Optional[KnowledgeManifest] = None
 
     def __init__(
         self,
@@ -64,27 +71,18 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     ) -> List[Dict[str, Any]]:
         with suppress_logging():
             if self.collection:
-                fetched = self.collection.query(
-                    query_texts=query,
-                    n_results=limit,
+                return query_collection(
+                    self.collection,
+                    embedding_cache.embed(self._embedder_key, self.embedder, query),
+                    limit=limit,
+                    score_threshold=score_threshold,
                     where=filter,
                 )
-                results = []
-                for i in range(len(fetched["ids"][0])):  # type: ignore
-                    result = {
-                        "id": fetched["ids"][0][i],  # type: ignore
-                        "metadata": fetched["metadatas"][0][i],  # type: ignore
-                        "context": fetched["documents"][0][i],  # type: ignore
-                        "score": fetched["distances"][0][i],  # type: ignore
-                    }
-                    if result["score"] >= score_threshold:
-                        results.append(result)
-                return results
             else:
                 raise Exception("Collection not initialized")
 
     def initialize_knowledge_storage(self):
-        base_path = os.path.join(db_storage_path(), "knowledge")
+        base_path = self._base_path()
         chroma_client = chromadb.PersistentClient(
             path=base_path,
             settings=Settings(allow_reset=True),
@@ -103,13 +101,14 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                     name=sanitize_collection_name(collection_name),
                     embedding_function=self.embedder,
                 )
+                self.manifest = self._create_manifest(collection_name)
             else:
                 raise Exception("Vector Database Client not initialized")
         except Exception:
             raise Exception("Failed to create or get collection")
 
     def reset(self):
-        base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
+        base_path = self._base_path()
         if not self.app:
             self.app = chromadb.PersistentClient(
                 path=base_path,
@@ -120,6 +119,8 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         shutil.rmtree(base_path)
         self.app = None
         self.collection = None
+        if self.manifest:
+            self.manifest.clear(all_collections=True)
 
     def save(
         self,
@@ -155,6 +156,24 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 filtered_metadata.append(meta)
                 filtered_ids.append(doc_id)
 
+            # Chunks already in the collection have the same content, and so
+            # the same embedding if the manifest records them for this store
+            # and embedder: only the others are sent to the embedder.
+            existing_ids = set(self.collection.get(ids=filtered_ids, include=[])["ids"])
+            if existing_ids:
+                existing_ids &= self.manifest.chunk_ids() if self.manifest else set()
+            if existing_ids:
+                new = [
+                    i
+                    for i, doc_id in enumerate(filtered_ids)
+                    if doc_id not in existing_ids
+                ]
+                filtered_docs = [filtered_docs[i] for i in new]
+                filtered_metadata = [filtered_metadata[i] for i in new]
+                filtered_ids = [filtered_ids[i] for i in new]
+                if not filtered_ids:
+                    return
+
             # If we have no metadata at all, set it to None
             final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
                 None if all(m is None for m in filtered_metadata) else filtered_metadata
@@ -180,6 +199,114 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
+    def is_file_current(
+        self, path: Path, chunking: str, content_hash: Callable[[], str]
+    ) -> bool:
+        """Whether the chunks saved for ``path`` still match the file.
+
+        Args:
+            path: Resolved path of the file.
+            chunking: Description of the chunking settings the chunks must
+                have been made with.
+            content_hash: Returns the hash of the file content. Only called
+                when the modification time or size changed since the file was
+                saved.
+        """
+        if self.manifest is None:
+            return False
+        record = self.manifest.get(str(path))
+        if record is None or record.chunking != chunking:
+            return False
+        if not self._has_chunks(record.chunk_ids):
+            return False
+        stat = path.stat()
+        if record.mtime == stat.st_mtime and record.size == stat.st_size:
+            return True
+        if record.content_hash != content_hash():
+            return False
+        self.manifest.put(record._replace(mtime=stat.st_mtime, size=stat.st_size))
+        return True
+
+    def save_file(
+        self,
+        path: Path,
+        chunks: Iterable[str],
+        content_hash: str,
+        chunking: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Save the chunks of a file, replacing the chunks of its previous version.
+
+        Chunks are embedded ``EMBEDDING_BATCH_SIZE`` at a time, so a generator
+        of chunks is saved without holding all of them in memory.
+        """
+        chunk_ids: Dict[str, None] = {}
+        batch: List[str] = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) == EMBEDDING_BATCH_SIZE:
+                self.save(batch, metadata)
+                batch = []
+            chunk_ids[hashlib.sha256(chunk.encode("utf-8")).hexdigest()] = None
+        if batch:
+            self.save(batch, metadata)
+        if self.manifest is None:
+            return
+
+        previous = self.manifest.get(str(path))
+        if previous is not None:
+            self._delete_chunks(str(path), set(previous.chunk_ids) - chunk_ids.keys())
+        stat = path.stat()
+        self.manifest.put(
+            KnowledgeFileRecord(
+                str(path),
+                stat.st_mtime,
+                stat.st_size,
+                content_hash,
+                chunking,
+                list(chunk_ids),
+            )
+        )
+
+    def purge_files(self, keep: Iterable[Path]) -> None:
+        """Delete the chunks of the saved files that aren't in ``keep``."""
+        if self.manifest is None:
+            return
+        keep_paths = {str(path) for path in keep}
+        for path in self.manifest.paths():
+            if path in keep_paths:
+                continue
+            record = self.manifest.get(path)
+            if record is not None:
+                self._delete_chunks(path, set(record.chunk_ids))
+            self.manifest.delete(path)
+
+    def _delete_chunks(self, path: str, chunk_ids: set) -> None:
+        if self.manifest is None or self.collection is None:
+            return
+        # The same chunk can come from several files.
+        stale = chunk_ids - self.manifest.chunk_ids_used_by_others(path)
+        if stale:
+            self.collection.delete(ids=list(stale))
+
+    def _has_chunks(self, chunk_ids: List[str]) -> bool:
+        """Whether the collection still holds every chunk of ``chunk_ids``."""
+        if self.collection is None:
+            return False
+        if not chunk_ids:
+            return True
+        found = self.collection.get(ids=chunk_ids, include=[])
+        return set(found["ids"]) == set(chunk_ids)
+
+    def _create_manifest(self, collection_name: str) -> KnowledgeManifest:
+        store = os.path.abspath(self._base_path())
+        return KnowledgeManifest(
+            collection_name, scope=f"{store}|{self._persistent_embedder_key}"
+        )
+
+    def _base_path(self) -> str:
+        return os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
+
     def _create_default_embedding_function(self):
         from chromadb.utils.embedding_functions.ollama_embedding_function import (
             OllamaEmbeddingFunction,
@@ -202,3 +329,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             if embedder
             else self._create_default_embedding_function()
         )
+        self._embedder_key = embedder_key(embedder, self.embedder)
+        self._persistent_embedder_key = embedder_key(
+            embedder, self.embedder, persistent=True
+        )
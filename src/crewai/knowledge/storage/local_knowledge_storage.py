@@ -0,0 +1,51 @@
+import os
+from typing import Any, Dict, Optional
+
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
+from crewai.utilities.local_vector_store import (
+    LocalVectorCollection,
+    clear_local_vectors,
+)
+from crewai.utilities.paths import db_storage_path
+
+
+class LocalKnowledgeStorage(KnowledgeStorage):
+    """
+    KnowledgeStorage keeping its chunks in a LocalVectorCollection, searched in
+    process from a memory-mapped matrix, instead of a ChromaDB client.
+    Selected with ``KnowledgeConfig(vector_store="local")``.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Dict[str, Any]] = None,
+        collection_name: Optional[str] = None,
+        ivf_min_size: Optional[int] = 100_000,
+        ivf_nprobe: int = 16,
+    ):
+        super().__init__(embedder=embedder, collection_name=collection_name)
+        self.ivf_min_size = ivf_min_size
+        self.ivf_nprobe = ivf_nprobe
+
+    def initialize_knowledge_storage(self):
+        collection_name = (
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
+        self.collection = LocalVectorCollection(  # type: ignore[assignment]
+            self._base_path(),
+            collection_name,
+            embedding_function=self.embedder,
+            ivf_min_size=self.ivf_min_size,
+            ivf_nprobe=self.ivf_nprobe,
+        )
+        self.manifest = self._create_manifest(collection_name)
+
+    def reset(self):
+        clear_local_vectors(self._base_path())
+        self.collection = None
+        if self.manifest:
+            self.manifest.clear(all_collections=True)
+
+    def _base_path(self) -> str:
+        return os.path.join(db_storage_path(), f"{KNOWLEDGE_DIRECTORY}_local")
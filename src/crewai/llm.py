@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -5,9 +6,10 @@ import sys
 import threading
 import warnings
 from collections import defaultdict
-from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from contextlib import ExitStack, contextmanager, redirect_stderr, redirect_stdout
 from typing import (
     Any,
+    Callable,
     DefaultDict,
     Dict,
     List,
@@ -20,7 +22,7 @@ from typing import (
 )
 
 from dotenv import load_dotenv
-from litellm.types.utils import ChatCompletionDeltaToolCall
+from litellm.types.utils import ChatCompletionDeltaToolCall, Usage
 from pydantic import BaseModel, Field
 
 # Configure logger
@@ -224,21 +226,44 @@ LLM_CONTEXT_WINDOW_SIZES = {
 DEFAULT_CONTEXT_WINDOW_SIZE = 8192
 CONTEXT_WINDOW_USAGE_RATIO = 0.75
 
+# litellm keeps its callbacks in module globals, which concurrent calls update.
+_callbacks_lock = threading.Lock()
+
+# Warning filters and standard streams are process-wide: overlapping uses of
+# suppress_warnings, from threads or from coroutines awaiting inside it, share
+# a single suppression, undone when the last one exits.
+_suppress_lock = threading.Lock()
+_suppress_depth = 0
+_suppress_stack: Optional[ExitStack] = None
+
 
 @contextmanager
 def suppress_warnings():
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore")
-        warnings.filterwarnings(
-            "ignore", message="open_text is deprecated*", category=DeprecationWarning
-        )
+    global _suppress_depth, _suppress_stack
+    with _suppress_lock:
+        if _suppress_depth == 0:
+            stack = ExitStack()
+            stack.enter_context(warnings.catch_warnings())
+            warnings.filterwarnings("ignore")
+            warnings.filterwarnings(
+                "ignore",
+                message="open_text is deprecated*",
+                category=DeprecationWarning,
+            )
 
-        # Redirect stdout and stderr
-        with (
-            redirect_stdout(FilteredStream(sys.stdout)),
-            redirect_stderr(FilteredStream(sys.stderr)),
-        ):
-            yield
+            # Redirect stdout and stderr
+            stack.enter_context(redirect_stdout(FilteredStream(sys.stdout)))
+            stack.enter_context(redirect_stderr(FilteredStream(sys.stderr)))
+            _suppress_stack = stack
+        _suppress_depth += 1
+    try:
+        yield
+    finally:
+        with _suppress_lock:
+            _suppress_depth -= 1
+            if _suppress_depth == 0 and _suppress_stack is not None:
+                _suppress_stack.close()
+                _suppress_stack = None
 
 
 class Delta(TypedDict):
@@ -428,6 +453,7 @@ class LLM(BaseLLM):
         params: Dict[str, Any],
         callbacks: Optional[List[Any]] = None,
         available_functions: Optional[Dict[str, Any]] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
     ) -> str:
         """Handle a streaming response from the LLM.
 
@@ -435,6 +461,8 @@ class LLM(BaseLLM):
             params: Parameters for the completion call
             callbacks: Optional list of callback functions
             available_functions: Dict of available functions
+            stop_when: Optional function called with each chunk, the stream is
+                stopped as soon as it returns True
 
         Returns:
             str: The complete response text
@@ -448,6 +476,7 @@ class LLM(BaseLLM):
         chunk_count = 0
         usage_info = None
         tool_calls = None
+        stopped_early = False
 
         accumulated_tool_args: DefaultDict[int, AccumulatedToolArgs] = defaultdict(
             AccumulatedToolArgs
@@ -459,7 +488,8 @@ class LLM(BaseLLM):
 
         try:
             # --- 3) Process each chunk in the stream
-            for chunk in litellm.completion(**params):
+            stream = litellm.completion(**params)
+            for chunk in stream:
                 chunk_count += 1
                 last_chunk = chunk
 
@@ -538,6 +568,16 @@ class LLM(BaseLLM):
                         self,
                         event=LLMStreamChunkEvent(chunk=chunk_content),
                     )
+
+                    if stop_when is not None and stop_when(chunk_content):
+                        stopped_early = True
+                        break
+
+            if stopped_early:
+                self._close_stream(stream)
+                # The last chunk, carrying the usage, is never received.
+                if not usage_info:
+                    usage_info = self._estimate_usage(params, full_response)
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
                 logging.warning(
@@ -710,6 +750,35 @@ class LLM(BaseLLM):
                     continue
         return None
 
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        """Close a stream left before its end, releasing its connection."""
+        for target in (stream, getattr(stream, "completion_stream", None)):
+            close = getattr(target, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logging.debug(f"Error closing streaming response: {e}")
+                return
+
+    def _estimate_usage(self, params: Dict[str, Any], completion: str) -> Usage:
+        """Estimate the usage of a stream stopped before its usage chunk."""
+        try:
+            prompt_tokens = litellm.token_counter(
+                model=self.model, messages=params.get("messages", [])
+            )
+            completion_tokens = litellm.token_counter(model=self.model, text=completion)
+        except Exception:
+            # Rough estimate for models litellm can't tokenize.
+            prompt_tokens = len(str(params.get("messages", ""))) // 4 + 1
+            completion_tokens = len(completion) // 4 + 1
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
     def _handle_streaming_callbacks(
         self,
         callbacks: Optional[List[Any]],
@@ -780,6 +849,53 @@ class LLM(BaseLLM):
             # for consistent handling in the rest of the codebase
             raise LLMContextLengthExceededException(str(e))
 
+        return self._process_non_streaming_response(
+            response, params, callbacks, available_functions
+        )
+
+    async def _ahandle_non_streaming_response(
+        self,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Handle a non-streaming response from the LLM without blocking the event loop.
+
+        Args:
+            params: Parameters for the completion call
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+
+        Returns:
+            str: The response text
+        """
+        try:
+            response = await litellm.acompletion(**params)
+        except ContextWindowExceededError as e:
+            raise LLMContextLengthExceededException(str(e))
+
+        return self._process_non_streaming_response(
+            response, params, callbacks, available_functions
+        )
+
+    def _process_non_streaming_response(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Extract the text or tool call result of a non-streaming completion.
+
+        Args:
+            response: The completion response returned by litellm
+            params: Parameters used for the completion call
+            callbacks: Optional list of callback functions
+            available_functions: Dict of available functions
+
+        Returns:
+            str: The response text
+        """
         # --- 2) Extract response message and content with error handling
         # Check if response has choices before accessing index 0
         response_choices = cast(ModelResponse, response).choices
@@ -875,6 +991,7 @@ class LLM(BaseLLM):
         tools: Optional[List[dict]] = None,
         callbacks: Optional[List[Any]] = None,
         available_functions: Optional[Dict[str, Any]] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
     ) -> Union[str, Any]:
         """High-level LLM call method.
 
@@ -889,6 +1006,9 @@ class LLM(BaseLLM):
                       during and after the LLM call.
             available_functions: Optional dict mapping function names to callables
                                that can be invoked by the LLM.
+            stop_when: Optional function called with each streamed chunk, the
+                      stream is stopped as soon as it returns True. Only used
+                      when streaming is enabled.
 
         Returns:
             Union[str, Any]: Either a text response from the LLM (str) or
@@ -899,6 +1019,114 @@ class LLM(BaseLLM):
             ValueError: If response format is not supported
             LLMContextLengthExceededException: If input exceeds model's context limit
         """
+        messages = self._start_call(messages, tools, callbacks, available_functions)
+
+        # --- 5) Set up callbacks if provided
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+            try:
+                # --- 6) Prepare parameters for the completion call
+                params = self._prepare_completion_params(messages, tools)
+
+                # --- 7) Make the completion call and handle response
+                if self.stream:
+                    return self._handle_streaming_response(
+                        params, callbacks, available_functions, stop_when
+                    )
+                else:
+                    return self._handle_non_streaming_response(
+                        params, callbacks, available_functions
+                    )
+
+            except LLMContextLengthExceededException:
+                # Re-raise LLMContextLengthExceededException as it should be handled
+                # by the CrewAgentExecutor._invoke_loop method, which can then decide
+                # whether to summarize the content or abort based on the respect_context_window flag
+                raise
+            except Exception as e:
+                assert hasattr(crewai_event_bus, "emit")
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMCallFailedEvent(error=str(e)),
+                )
+                logging.error(f"LiteLLM call failed: {str(e)}")
+                raise
+
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
+    ) -> Union[str, Any]:
+        """Asynchronous counterpart of :meth:`call` built on ``litellm.acompletion``.
+
+        Non-streaming completions are awaited natively so many concurrent calls
+        can share a single event loop. Streaming completions still go through
+        the synchronous streaming handler in a worker thread.
+
+        Args:
+            messages: Input messages for the LLM.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions.
+            available_functions: Optional dict mapping function names to callables.
+            stop_when: Optional function stopping a streamed response early.
+
+        Returns:
+            Union[str, Any]: Either a text response from the LLM (str) or
+                           the result of a tool function call (Any).
+        """
+        if self.stream:
+            return await asyncio.to_thread(
+                self.call, messages, tools, callbacks, available_functions, stop_when
+            )
+
+        messages = self._start_call(messages, tools, callbacks, available_functions)
+
+        with suppress_warnings():
+            if callbacks and len(callbacks) > 0:
+                self.set_callbacks(callbacks)
+
+            try:
+                params = self._prepare_completion_params(messages, tools)
+                return await self._ahandle_non_streaming_response(
+                    params, callbacks, available_functions
+                )
+            except LLMContextLengthExceededException:
+                raise
+            except Exception as e:
+                assert hasattr(crewai_event_bus, "emit")
+                crewai_event_bus.emit(
+                    self,
+                    event=LLMCallFailedEvent(error=str(e)),
+                )
+                logging.error(f"LiteLLM call failed: {str(e)}")
+                raise
+
+    def _start_call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, str]]:
+        """Emit the call started event and validate the call inputs.
+
+        Args:
+            messages: Input messages for the LLM.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions.
+            available_functions: Optional dict mapping function names to callables.
+
+        Returns:
+            List[Dict[str, str]]: The validated messages in list format.
+
+        Raises:
+            ValueError: If the messages format is invalid.
+        """
         # --- 1) Emit call started event
         assert hasattr(crewai_event_bus, "emit")
         crewai_event_bus.emit(
@@ -938,38 +1166,7 @@ class LLM(BaseLLM):
                 if message.get("role") == "system":
                     message["role"] = "assistant"
 
-        # --- 5) Set up callbacks if provided
-        with suppress_warnings():
-            if callbacks and len(callbacks) > 0:
-                self.set_callbacks(callbacks)
-
-            try:
-                # --- 6) Prepare parameters for the completion call
-                params = self._prepare_completion_params(messages, tools)
-
-                # --- 7) Make the completion call and handle response
-                if self.stream:
-                    return self._handle_streaming_response(
-                        params, callbacks, available_functions
-                    )
-                else:
-                    return self._handle_non_streaming_response(
-                        params, callbacks, available_functions
-                    )
-
-            except LLMContextLengthExceededException:
-                # Re-raise LLMContextLengthExceededException as it should be handled
-                # by the CrewAgentExecutor._invoke_loop method, which can then decide
-                # whether to summarize the content or abort based on the respect_context_window flag
-                raise
-            except Exception as e:
-                assert hasattr(crewai_event_bus, "emit")
-                crewai_event_bus.emit(
-                    self,
-                    event=LLMCallFailedEvent(error=str(e)),
-                )
-                logging.error(f"LiteLLM call failed: {str(e)}")
-                raise
+        return messages
 
     def _handle_emit_call_events(self, response: Any, call_type: LLMCallType):
         """Handle the events for the LLM call.
@@ -1133,7 +1330,7 @@ class LLM(BaseLLM):
         Attempt to keep a single set of callbacks in litellm by removing old
         duplicates and adding new ones.
         """
-        with suppress_warnings():
+        with suppress_warnings(), _callbacks_lock:
             callback_types = [type(callback) for callback in callbacks]
             for callback in litellm.success_callback[:]:
                 if type(callback) in callback_types:
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -73,6 +74,33 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def acall(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        """Asynchronously call the LLM with the given messages.
+
+        The default implementation runs :meth:`call` in a worker thread so every
+        custom LLM can be used from the async execution path. Implementations
+        backed by an async client should override it.
+
+        Args:
+            messages: Input messages for the LLM.
+            tools: Optional list of tool schemas for function calling.
+            callbacks: Optional list of callback functions.
+            available_functions: Optional dict mapping function names to callables.
+
+        Returns:
+            Either a text response from the LLM (str) or
+            the result of a tool function call (Any).
+        """
+        return await asyncio.to_thread(
+            self.call, messages, tools, callbacks, available_functions
+        )
+
     def supports_stop_words(self) -> bool:
         """Check if the LLM supports stop words.
 
@@ -1,4 +1,7 @@
-from typing import Any, Dict, Optional
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, List, Optional
 
 from crewai.memory import (
     EntityMemory,
@@ -7,6 +10,9 @@ from crewai.memory import (
     ShortTermMemory,
     UserMemory,
 )
+from crewai.memory.storage.rag_storage import RAGStorage
+
+DEFAULT_RETRIEVAL_TIMEOUT = 10.0
 
 
 class ContextualMemory:
@@ -19,10 +25,12 @@ class ContextualMemory:
         um: UserMemory,
         exm: ExternalMemory,
     ):
-        if memory_config is not None:
-            self.memory_provider = memory_config.get("provider")
-        else:
-            self.memory_provider = None
+        memory_config = memory_config or {}
+        self.memory_provider = memory_config.get("provider")
+        self.concurrent_retrieval = memory_config.get("concurrent_retrieval", False)
+        self.retrieval_timeout = memory_config.get(
+            "retrieval_timeout", DEFAULT_RETRIEVAL_TIMEOUT
+        )
         self.stm = stm
         self.ltm = ltm
         self.em = em
@@ -39,6 +47,9 @@ class ContextualMemory:
         if query == "":
             return ""
 
+        if self.concurrent_retrieval:
+            return self._build_context_concurrently(task.description, query)
+
         context = []
         context.append(self._fetch_ltm_context(task.description))
         context.append(self._fetch_stm_context(query))
@@ -48,7 +59,80 @@ class ContextualMemory:
             context.append(self._fetch_user_context(query))
         return "\n".join(filter(None, context))
 
-    def _fetch_stm_context(self, query) -> str:
+    def _build_context_concurrently(self, description: str, query: str) -> str:
+        """
+        Queries every memory store at the same time. The query is embedded once
+        and shared by the stores using the same embedder, and a store that
+        doesn't answer within ``retrieval_timeout`` seconds is left out.
+        """
+        fetchers: Dict[str, Callable[[], Optional[str]]] = {
+            "ltm": lambda: self._fetch_ltm_context(description),
+            "external": lambda: self._fetch_external_context(query),
+        }
+        if self.memory_provider == "mem0":
+            fetchers["user"] = lambda: self._fetch_user_context(query)
+
+        pool = ThreadPoolExecutor(
+            max_workers=len(fetchers) + 2, thread_name_prefix="crewai-memory"
+        )
+        try:
+            futures: Dict[Future, str] = {
+                pool.submit(fetch): name for name, fetch in fetchers.items()
+            }
+            # Stores that don't need the embedding run while it's computed.
+            query_embedding = self._embed_query(query)
+            futures[pool.submit(self._fetch_stm_context, query, query_embedding)] = (
+                "stm"
+            )
+            futures[pool.submit(self._fetch_entity_context, query, query_embedding)] = (
+                "entity"
+            )
+
+            results: Dict[str, Optional[str]] = {}
+            try:
+                for future in as_completed(futures, timeout=self.retrieval_timeout):
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logging.error(f"Error fetching {name} memory context: {e}")
+            except FuturesTimeoutError:
+                pending = sorted(set(futures.values()) - set(results))
+                logging.warning(f"Memory retrieval timed out for: {', '.join(pending)}")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        order = ["ltm", "stm", "entity", "external", "user"]
+        return "\n".join(filter(None, (results.get(name) for name in order)))
+
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embeds the query once for short-term and entity memory when both are
+        backed by RAG storages configured with the same embedder.
+        """
+        storages = [
+            memory.storage
+            for memory in (self.stm, self.em)
+            if memory is not None and self.memory_provider != "mem0"
+        ]
+        if not storages or not all(
+            isinstance(storage, RAGStorage) for storage in storages
+        ):
+            return None
+        if any(
+            storage.embedder_source != storages[0].embedder_source
+            for storage in storages
+        ):
+            return None
+        try:
+            return storages[0].embed_query(query)
+        except Exception as e:
+            logging.warning(f"Falling back to per-store query embedding: {e}")
+            return None
+
+    def _fetch_stm_context(
+        self, query, query_embedding: Optional[List[float]] = None
+    ) -> str:
         """
         Fetches recent relevant insights from STM related to the task's description and expected_output,
         formatted as bullet points.
@@ -57,7 +141,10 @@ class ContextualMemory:
         if self.stm is None:
             return ""
 
-        stm_results = self.stm.search(query)
+        if query_embedding is not None:
+            stm_results = self.stm.search(query, query_embedding=query_embedding)
+        else:
+            stm_results = self.stm.search(query)
         formatted_results = "\n".join(
             [
                 f"- {result['memory'] if self.memory_provider == 'mem0' else result['context']}"
@@ -89,7 +176,9 @@ class ContextualMemory:
 
         return f"Historical Data:\n{formatted_results}" if ltm_results else ""
 
-    def _fetch_entity_context(self, query) -> str:
+    def _fetch_entity_context(
+        self, query, query_embedding: Optional[List[float]] = None
+    ) -> str:
         """
         Fetches relevant entity information from Entity Memory related to the task's description and expected_output,
         formatted as bullet points.
@@ -97,7 +186,10 @@ class ContextualMemory:
         if self.em is None:
             return ""
 
-        em_results = self.em.search(query)
+        if query_embedding is not None:
+            em_results = self.em.search(query, query_embedding=query_embedding)
+        else:
+            em_results = self.em.search(query)
         formatted_results = "\n".join(
             [
                 f"- {result['memory'] if self.memory_provider == 'mem0' else result['context']}"
@@ -1,10 +1,10 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import PrivateAttr
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.memory import Memory
-from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.storage.rag_storage import batch_settings, rag_storage_class
 
 
 class EntityMemory(Memory):
@@ -34,12 +34,13 @@ class EntityMemory(Memory):
             storage = (
                 storage
                 if storage
-                else RAGStorage(
+                else rag_storage_class(crew)(
                     type="entities",
                     allow_reset=True,
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    **batch_settings(crew),
                 )
             )
 
@@ -48,16 +49,23 @@ class EntityMemory(Memory):
 
     def save(self, item: EntityMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
         """Saves an entity item into the SQLite storage."""
+        super().save(self._format(item), item.metadata)
+
+    def save_many(self, items: List[EntityMemoryItem]) -> None:  # type: ignore # Signature of "save_many" incompatible with supertype "Memory"
+        """Saves several entity items, embedded in a single batch."""
+        super().save_many(
+            [self._format(item) for item in items], [item.metadata for item in items]
+        )
+
+    def _format(self, item: EntityMemoryItem) -> str:
         if self._memory_provider == "mem0":
-            data = f"""
+            return f"""
             Remember details about the following entity:
             Name: {item.name}
             Type: {item.type}
             Entity Description: {item.description}
             """
-        else:
-            data = f"{item.name}({item.type}): {item.description}"
-        super().save(data, item.metadata)
+        return f"{item.name}({item.type}): {item.description}"
 
     def reset(self) -> None:
         try:
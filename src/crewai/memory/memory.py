@@ -28,12 +28,45 @@ class Memory(BaseModel):
 
         self.storage.save(value, metadata)
 
+    def save_many(
+        self,
+        values: List[Any],
+        metadatas: Optional[List[Optional[Dict[str, Any]]]] = None,
+        agent: Optional[str] = None,
+    ) -> None:
+        """Save several values, in a single embedding batch when supported."""
+        metadatas = [
+            dict(metadata or {}) for metadata in metadatas or [None] * len(values)
+        ]
+        if agent:
+            for metadata in metadatas:
+                metadata["agent"] = agent
+
+        if hasattr(self.storage, "save_many"):
+            self.storage.save_many(values, metadatas)
+        else:
+            for value, metadata in zip(values, metadatas):
+                self.storage.save(value, metadata)
+
+    def flush(self) -> None:
+        """Write the items buffered by the storage, if it buffers any."""
+        if hasattr(self.storage, "flush"):
+            self.storage.flush()
+
     def search(
         self,
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Any]:
+        if query_embedding is not None:
+            return self.storage.search(
+                query=query,
+                limit=limit,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding,
+            )
         return self.storage.search(
             query=query, limit=limit, score_threshold=score_threshold
         )
@@ -0,0 +1,85 @@
+import threading
+from collections import deque
+from typing import Callable, Deque, Optional
+
+from crewai.utilities.printer import Printer
+
+
+class MemoryWriter:
+    """
+    Write-behind queue for the memories created after each task.
+
+    Writes run in order on a background thread, so the next task doesn't wait
+    for the task evaluation or the embedding requests. The thread is started
+    on demand and exits once the queue is empty.
+    """
+
+    def __init__(self, max_queue_size: int = 1000, batch_size: int = 32):
+        if max_queue_size <= 0 or batch_size <= 0:
+            raise ValueError("max_queue_size and batch_size must be positive integers")
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self._queue: Deque[Callable[[], None]] = deque()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._worker: Optional[threading.Thread] = None
+        self._printer = Printer()
+
+    def submit(self, write: Callable[[], None]) -> None:
+        """Queue ``write``, waiting for room if the queue is full."""
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._queue) < self.max_queue_size)
+            self._queue.append(write)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="crewai-memory-writer", daemon=True
+                )
+                self._worker.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued write has completed.
+
+        Args:
+            timeout: Maximum number of seconds to wait, None waits until done.
+
+        Returns:
+            True if the queue was drained, False if the timeout expired.
+        """
+        if threading.current_thread() is self._worker:
+            return not self._queue
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    @property
+    def pending(self) -> int:
+        """Number of writes queued or running."""
+        with self._condition:
+            return len(self._queue) + self._in_flight
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._worker = None
+                    self._condition.notify_all()
+                    return
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+            for write in batch:
+                try:
+                    write()
+                except Exception as e:
+                    self._printer.print(
+                        content=f"Failed to write memory: {e}", color="red"
+                    )
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
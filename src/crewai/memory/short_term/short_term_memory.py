@@ -1,10 +1,10 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import PrivateAttr
 
 from crewai.memory.memory import Memory
 from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
-from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.storage.rag_storage import batch_settings, rag_storage_class
 
 
 class ShortTermMemory(Memory):
@@ -36,11 +36,12 @@ class ShortTermMemory(Memory):
             storage = (
                 storage
                 if storage
-                else RAGStorage(
+                else rag_storage_class(crew)(
                     type="short_term",
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    **batch_settings(crew),
                 )
             )
         super().__init__(storage=storage)
@@ -58,12 +59,33 @@ class ShortTermMemory(Memory):
 
         super().save(value=item.data, metadata=item.metadata, agent=item.agent)
 
+    def save_many(
+        self,
+        values: List[Any],
+        metadatas: Optional[List[Optional[Dict[str, Any]]]] = None,
+        agent: Optional[str] = None,
+    ) -> None:
+        if self._memory_provider == "mem0":
+            values = [
+                f"Remember the following insights from Agent run: {value}"
+                for value in values
+            ]
+        super().save_many(values, metadatas, agent)
+
     def search(
         self,
         query: str,
         limit: int = 3,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ):
+        if query_embedding is not None:
+            return self.storage.search(
+                query=query,
+                limit=limit,
+                score_threshold=score_threshold,
+                query_embedding=query_embedding,
+            )
         return self.storage.search(
             query=query, limit=limit, score_threshold=score_threshold
         )  # type: ignore # BUG? The reference is to the parent class, but the parent class does not have this parameters
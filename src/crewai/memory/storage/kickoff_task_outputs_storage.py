@@ -9,9 +9,28 @@ from crewai.utilities import Printer
 from crewai.utilities.crew_json_encoder import CrewJSONEncoder
 from crewai.utilities.errors import DatabaseError, DatabaseOperationError
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import sqlite_pool
 
 logger = logging.getLogger(__name__)
 
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
+        task_id TEXT PRIMARY KEY,
+        expected_output TEXT,
+        output JSON,
+        task_index INTEGER,
+        inputs JSON,
+        was_replayed BOOLEAN,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_latest_kickoff_task_outputs_task_index
+    ON latest_kickoff_task_outputs (task_index)
+    """,
+]
+
 
 class KickoffTaskOutputsSQLiteStorage:
     """
@@ -38,24 +57,9 @@ class KickoffTaskOutputsSQLiteStorage:
         Raises:
             DatabaseOperationError: If database initialization fails due to SQLite errors.
         """
+        self._pool = sqlite_pool(self.db_path)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS latest_kickoff_task_outputs (
-                        task_id TEXT PRIMARY KEY,
-                        expected_output TEXT,
-                        output JSON,
-                        task_index INTEGER,
-                        inputs JSON,
-                        was_replayed BOOLEAN,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                )
-
-                conn.commit()
+            self._pool.migrate("latest_kickoff_task_outputs", MIGRATIONS)
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.INIT_ERROR, e)
             logger.error(error_msg)
@@ -82,10 +86,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If saving the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._pool.connection() as conn:
+                conn.execute(
                     """
                 INSERT OR REPLACE INTO latest_kickoff_task_outputs
                 (task_id, expected_output, output, task_index, inputs, was_replayed)
@@ -100,7 +102,6 @@ class KickoffTaskOutputsSQLiteStorage:
                         was_replayed,
                     ),
                 )
-                conn.commit()
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.SAVE_ERROR, e)
             logger.error(error_msg)
@@ -125,10 +126,7 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If updating the task output fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-
+            with self._pool.connection() as conn:
                 fields = []
                 values = []
                 for key, value in kwargs.items():
@@ -142,8 +140,7 @@ class KickoffTaskOutputsSQLiteStorage:
                 query = f"UPDATE latest_kickoff_task_outputs SET {', '.join(fields)} WHERE task_index = ?"  # nosec
                 values.append(task_index)
 
-                cursor.execute(query, tuple(values))
-                conn.commit()
+                cursor = conn.execute(query, tuple(values))
 
                 if cursor.rowcount == 0:
                     logger.warning(f"No row found with task_index {task_index}. No update performed.")
@@ -164,9 +161,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If loading task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
+            with self._pool.connection() as conn:
+                cursor = conn.execute("""
                 SELECT *
                 FROM latest_kickoff_task_outputs
                 ORDER BY task_index
@@ -203,11 +199,8 @@ class KickoffTaskOutputsSQLiteStorage:
             DatabaseOperationError: If deleting task outputs fails due to SQLite errors.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("BEGIN TRANSACTION")
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM latest_kickoff_task_outputs")
-                conn.commit()
+            with self._pool.connection() as conn:
+                conn.execute("DELETE FROM latest_kickoff_task_outputs")
         except sqlite3.Error as e:
             error_msg = DatabaseError.format_error(DatabaseError.DELETE_ERROR, e)
             logger.error(error_msg)
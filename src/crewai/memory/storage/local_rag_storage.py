@@ -0,0 +1,39 @@
+from typing import Optional
+
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.local_vector_store import LocalVectorCollection
+
+
+class LocalRAGStorage(RAGStorage):
+    """
+    RAGStorage keeping its entries in a LocalVectorCollection, searched in
+    process from a memory-mapped matrix, instead of a ChromaDB client.
+    Selected with ``memory_config={"vector_store": "local"}``.
+    """
+
+    def __init__(
+        self,
+        *args,
+        ivf_min_size: Optional[int] = 100_000,
+        ivf_nprobe: int = 16,
+        **kwargs,
+    ):
+        self.ivf_min_size = ivf_min_size
+        self.ivf_nprobe = ivf_nprobe
+        super().__init__(*args, **kwargs)
+
+    def _initialize_app(self):
+        self._set_embedder_config()
+        self.app = None
+        self.collection = LocalVectorCollection(
+            self.path
+            or self._build_storage_file_name(f"{self.type}_local", self.agents),
+            self.type,
+            embedding_function=self.embedder_config,
+            ivf_min_size=self.ivf_min_size,
+            ivf_nprobe=self.ivf_nprobe,
+        )
+
+    def reset(self) -> None:
+        self._discard_buffer()
+        self.collection.clear()
@@ -1,10 +1,27 @@
 import json
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from crewai.utilities import Printer
 from crewai.utilities.paths import db_storage_path
+from crewai.utilities.sqlite_pool import sqlite_pool
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS long_term_memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_description TEXT,
+        metadata TEXT,
+        datetime TEXT,
+        score REAL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_long_term_memories_task_description
+    ON long_term_memories (task_description, datetime)
+    """,
+]
 
 
 class LTMSQLiteStorage:
@@ -28,22 +45,9 @@ class LTMSQLiteStorage:
         """
         Initializes the SQLite database and creates LTM table
         """
+        self._pool = sqlite_pool(self.db_path)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS long_term_memories (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        task_description TEXT,
-                        metadata TEXT,
-                        datetime TEXT,
-                        score REAL
-                    )
-                """
-                )
-
-                conn.commit()
+            self._pool.migrate("long_term_memories", MIGRATIONS)
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred during database initialization: {e}",
@@ -58,17 +62,24 @@ class LTMSQLiteStorage:
         score: Union[int, float],
     ) -> None:
         """Saves data to the LTM table with error handling."""
+        self.save_many([(task_description, metadata, datetime, score)])
+
+    def save_many(
+        self, rows: List[Tuple[str, Dict[str, Any], str, Union[int, float]]]
+    ) -> None:
+        """Saves (task_description, metadata, datetime, score) rows at once."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._pool.connection() as conn:
+                conn.executemany(
                     """
                 INSERT INTO long_term_memories (task_description, metadata, datetime, score)
                 VALUES (?, ?, ?, ?)
             """,
-                    (task_description, json.dumps(metadata), datetime, score),
+                    [
+                        (task_description, json.dumps(metadata), datetime, score)
+                        for task_description, metadata, datetime, score in rows
+                    ],
                 )
-                conn.commit()
         except sqlite3.Error as e:
             self._printer.print(
                 content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
@@ -80,17 +91,16 @@ class LTMSQLiteStorage:
     ) -> Optional[List[Dict[str, Any]]]:
         """Queries the LTM table by task description with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    f"""
+            with self._pool.connection() as conn:
+                cursor = conn.execute(
+                    """
                     SELECT metadata, datetime, score
                     FROM long_term_memories
                     WHERE task_description = ?
                     ORDER BY datetime DESC, score ASC
-                    LIMIT {latest_n}
-                """,  # nosec
-                    (task_description,),
+                    LIMIT ?
+                """,
+                    (task_description, latest_n),
                 )
                 rows = cursor.fetchall()
                 if rows:
@@ -115,10 +125,8 @@ class LTMSQLiteStorage:
     ) -> None:
         """Resets the LTM table with error handling."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM long_term_memories")
-                conn.commit()
+            with self._pool.connection() as conn:
+                conn.execute("DELETE FROM long_term_memories")
 
         except sqlite3.Error as e:
             self._printer.print(
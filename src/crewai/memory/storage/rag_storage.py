@@ -1,18 +1,53 @@
+import atexit
 import contextlib
 import io
 import logging
 import os
 import shutil
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from chromadb.api import ClientAPI
 
 from crewai.memory.storage.base_rag_storage import BaseRAGStorage
 from crewai.utilities import EmbeddingConfigurator
-from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
+from crewai.utilities.chromadb import query_collection
+from crewai.utilities.constants import EMBEDDING_BATCH_SIZE, MAX_FILE_NAME_LENGTH
+from crewai.utilities.embedding_cache import embedder_key, embedding_cache
 from crewai.utilities.paths import db_storage_path
 
+# Storages with buffered items, flushed when the interpreter exits since their
+# flush timers are daemon threads.
+_buffered_storages: "weakref.WeakSet[RAGStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_storages() -> None:
+    for storage in list(_buffered_storages):
+        storage.flush()
+
+
+def batch_settings(crew: Any) -> Dict[str, Any]:
+    """Read the save batching options of a crew's ``memory_config``."""
+    memory_config = getattr(crew, "memory_config", None) or {}
+    return {
+        key: memory_config[key]
+        for key in ("batch_size", "batch_interval")
+        if key in memory_config
+    }
+
+
+def rag_storage_class(crew: Any) -> Type["RAGStorage"]:
+    """The RAGStorage class selected by the ``vector_store`` of ``memory_config``."""
+    memory_config = getattr(crew, "memory_config", None) or {}
+    if memory_config.get("vector_store") == "local":
+        from crewai.memory.storage.local_rag_storage import LocalRAGStorage
+
+        return LocalRAGStorage
+    return RAGStorage
+
 
 @contextlib.contextmanager
 def suppress_logging(
@@ -35,14 +70,33 @@ class RAGStorage(BaseRAGStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    With ``batch_size`` above 1, saved items are buffered and embedded together
+    once ``batch_size`` items are waiting or ``batch_interval`` seconds after
+    the first one. Searches flush the buffer first so they see every save.
     """
 
     app: ClientAPI | None = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        batch_size: int = 1,
+        batch_interval: float = 1.0,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._buffer: List[Tuple[Any, Dict[str, Any]]] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Kept before it's replaced by the embedding function so storages
+        # configured alike can share query embeddings.
+        self.embedder_source = embedder_config
         agents = crew.agents if crew else []
         agents = [self._sanitize_role(agent.role) for agent in agents]
         agents = "_".join(agents)
@@ -58,6 +112,7 @@ class RAGStorage(BaseRAGStorage):
     def _set_embedder_config(self):
         configurator = EmbeddingConfigurator()
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
+        self._embedder_key = embedder_key(self.embedder_source, self.embedder_config)
 
     def _initialize_app(self):
         import chromadb
@@ -101,6 +156,21 @@ class RAGStorage(BaseRAGStorage):
         return f"{base_path}/{file_name}"
 
     def save(self, value: Any, metadata: Dict[str, Any]) -> None:
+        if self.batch_size > 1:
+            with self._buffer_lock:
+                self._buffer.append((value, metadata))
+                if len(self._buffer) < self.batch_size:
+                    if self._flush_timer is None:
+                        self._flush_timer = threading.Timer(
+                            self.batch_interval, self.flush
+                        )
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+                        _buffered_storages.add(self)
+                    return
+            self.flush()
+            return
+
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
         try:
@@ -108,36 +178,84 @@ class RAGStorage(BaseRAGStorage):
         except Exception as e:
             logging.error(f"Error during {self.type} save: {str(e)}")
 
+    def save_many(
+        self, values: List[Any], metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Embed and add several items, ``EMBEDDING_BATCH_SIZE`` at a time."""
+        if not values:
+            return
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        metadatas = metadatas or [{} for _ in values]
+        for start in range(0, len(values), EMBEDDING_BATCH_SIZE):
+            batch = values[start : start + EMBEDDING_BATCH_SIZE]
+            try:
+                self.collection.add(
+                    documents=batch,
+                    # Chroma rejects empty metadata dicts but accepts None.
+                    metadatas=[
+                        metadata or None
+                        for metadata in metadatas[start : start + len(batch)]
+                    ],
+                    ids=[str(uuid.uuid4()) for _ in batch],
+                )
+            except Exception as e:
+                logging.error(f"Error during {self.type} save: {str(e)}")
+
+    def flush(self) -> None:
+        """Write the buffered items now."""
+        with self._buffer_lock:
+            buffer, self._buffer = self._buffer, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if buffer:
+            values, metadatas = zip(*buffer)
+            self.save_many(list(values), list(metadatas))
+
+    def _discard_buffer(self) -> None:
+        with self._buffer_lock:
+            self._buffer = []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
     def search(
         self,
         query: str,
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Any]:
         if not hasattr(self, "app"):
             self._initialize_app()
+        self.flush()
 
         try:
             with suppress_logging():
-                response = self.collection.query(query_texts=query, n_results=limit)
-
-            results = []
-            for i in range(len(response["ids"][0])):
-                result = {
-                    "id": response["ids"][0][i],
-                    "metadata": response["metadatas"][0][i],
-                    "context": response["documents"][0][i],
-                    "score": response["distances"][0][i],
-                }
-                if result["score"] >= score_threshold:
-                    results.append(result)
-
-            return results
+                if query_embedding is None:
+                    query_embedding = self.embed_query(query)
+                return query_collection(
+                    self.collection,
+                    [query_embedding],
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    where=filter,
+                )
         except Exception as e:
             logging.error(f"Error during {self.type} search: {str(e)}")
             return []
 
+    def embed_query(self, query: str) -> List[float]:
+        """Embed ``query``, reusing the cached embedding of the same text."""
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        (embedding,) = embedding_cache.embed(
+            self._embedder_key, self.embedder_config, [query]
+        )
+        return embedding
+
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
@@ -149,6 +267,7 @@ class RAGStorage(BaseRAGStorage):
         )
 
     def reset(self) -> None:
+        self._discard_buffer()
         try:
             if self.app:
                 self.app.reset()
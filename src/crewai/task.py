@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import inspect
 import json
@@ -390,6 +391,15 @@ class Task(BaseModel):
         result = self._execute_core(agent, context, tools)
         future.set_result(result)
 
+    async def aexecute(
+        self,
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[BaseTool]] = None,
+    ) -> TaskOutput:
+        """Execute the task natively on the running event loop."""
+        return await self._aexecute_core(agent, context, tools)
+
     def _execute_core(
         self,
         agent: Optional[BaseAgent],
@@ -398,101 +408,159 @@ class Task(BaseModel):
     ) -> TaskOutput:
         """Run the core execution logic of the task."""
         try:
-            agent = agent or self.agent
-            self.agent = agent
-            if not agent:
-                raise Exception(
-                    f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
-                )
+            agent, tools = self._start_execution(agent, context, tools)
+            result = agent.execute_task(
+                task=self,
+                context=context,
+                tools=tools,
+            )
 
-            self.start_time = datetime.datetime.now()
+            task_output, retry_context = self._build_task_output(agent, result)
+            if retry_context is not None:
+                return self._execute_core(agent, retry_context, tools)
 
-            self.prompt_context = context
-            tools = tools or self.tools or []
+            return self._complete_execution(task_output)
+        except Exception as e:
+            self.end_time = datetime.datetime.now()
+            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+            raise e  # Re-raise the exception after emitting the event
 
-            self.processed_by_agents.add(agent.role)
-            crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
-            result = agent.execute_task(
+    async def _aexecute_core(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> TaskOutput:
+        """Run the core execution logic of the task, awaiting the agent."""
+        try:
+            agent, tools = self._start_execution(agent, context, tools)
+            result = await agent.aexecute_task(
                 task=self,
                 context=context,
                 tools=tools,
             )
 
-            pydantic_output, json_output = self._export_output(result)
-            task_output = TaskOutput(
-                name=self.name,
-                description=self.description,
-                expected_output=self.expected_output,
-                raw=result,
-                pydantic=pydantic_output,
-                json_dict=json_output,
-                agent=agent.role,
-                output_format=self._get_output_format(),
+            # Guardrails, conversion, callbacks and file output block, they run
+            # in worker threads to keep the event loop free for other tasks.
+            task_output, retry_context = await asyncio.to_thread(
+                self._build_task_output, agent, result
             )
+            if retry_context is not None:
+                return await self._aexecute_core(agent, retry_context, tools)
 
-            if self._guardrail:
-                guardrail_result = self._process_guardrail(task_output)
-                if not guardrail_result.success:
-                    if self.retry_count >= self.max_retries:
-                        raise Exception(
-                            f"Task failed guardrail validation after {self.max_retries} retries. "
-                            f"Last error: {guardrail_result.error}"
-                        )
-
-                    self.retry_count += 1
-                    context = self.i18n.errors("validation_error").format(
-                        guardrail_result_error=guardrail_result.error,
-                        task_output=task_output.raw,
-                    )
-                    printer = Printer()
-                    printer.print(
-                        content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
-                        color="yellow",
-                    )
-                    return self._execute_core(agent, context, tools)
+            return await asyncio.to_thread(self._complete_execution, task_output)
+        except Exception as e:
+            self.end_time = datetime.datetime.now()
+            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
+            raise e  # Re-raise the exception after emitting the event
 
-                if guardrail_result.result is None:
-                    raise Exception(
-                        "Task guardrail returned None as result. This is not allowed."
-                    )
+    def _start_execution(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> Tuple[BaseAgent, List[Any]]:
+        """Resolve the agent and tools of the execution and emit the started event."""
+        agent = agent or self.agent
+        self.agent = agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
 
-                if isinstance(guardrail_result.result, str):
-                    task_output.raw = guardrail_result.result
-                    pydantic_output, json_output = self._export_output(
-                        guardrail_result.result
-                    )
-                    task_output.pydantic = pydantic_output
-                    task_output.json_dict = json_output
-                elif isinstance(guardrail_result.result, TaskOutput):
-                    task_output = guardrail_result.result
+        self.start_time = datetime.datetime.now()
 
-            self.output = task_output
-            self.end_time = datetime.datetime.now()
+        self.prompt_context = context
+        tools = tools or self.tools or []
 
-            if self.callback:
-                self.callback(self.output)
+        self.processed_by_agents.add(agent.role)
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        return agent, tools
 
-            crew = self.agent.crew  # type: ignore[union-attr]
-            if crew and crew.task_callback and crew.task_callback != self.callback:
-                crew.task_callback(self.output)
+    def _build_task_output(
+        self, agent: BaseAgent, result: str
+    ) -> Tuple[TaskOutput, Optional[str]]:
+        """Build the task output from the agent result and apply the guardrail.
+
+        Returns:
+            The task output and, when the guardrail asks for a retry, the context
+            to execute the task again with.
+        """
+        pydantic_output, json_output = self._export_output(result)
+        task_output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
 
-            if self.output_file:
-                content = (
-                    json_output
-                    if json_output
-                    else (
-                        pydantic_output.model_dump_json() if pydantic_output else result
+        if self._guardrail:
+            guardrail_result = self._process_guardrail(task_output)
+            if not guardrail_result.success:
+                if self.retry_count >= self.max_retries:
+                    raise Exception(
+                        f"Task failed guardrail validation after {self.max_retries} retries. "
+                        f"Last error: {guardrail_result.error}"
                     )
+
+                self.retry_count += 1
+                context = self.i18n.errors("validation_error").format(
+                    guardrail_result_error=guardrail_result.error,
+                    task_output=task_output.raw,
+                )
+                printer = Printer()
+                printer.print(
+                    content=f"Guardrail blocked, retrying, due to: {guardrail_result.error}\n",
+                    color="yellow",
+                )
+                return task_output, context
+
+            if guardrail_result.result is None:
+                raise Exception(
+                    "Task guardrail returned None as result. This is not allowed."
+                )
+
+            if isinstance(guardrail_result.result, str):
+                task_output.raw = guardrail_result.result
+                pydantic_output, json_output = self._export_output(
+                    guardrail_result.result
+                )
+                task_output.pydantic = pydantic_output
+                task_output.json_dict = json_output
+            elif isinstance(guardrail_result.result, TaskOutput):
+                task_output = guardrail_result.result
+
+        return task_output, None
+
+    def _complete_execution(self, task_output: TaskOutput) -> TaskOutput:
+        """Store the output, run the callbacks and save the output file."""
+        self.output = task_output
+        self.end_time = datetime.datetime.now()
+
+        if self.callback:
+            self.callback(self.output)
+
+        crew = self.agent.crew  # type: ignore[union-attr]
+        if crew and crew.task_callback and crew.task_callback != self.callback:
+            crew.task_callback(self.output)
+
+        if self.output_file:
+            content = (
+                task_output.json_dict
+                if task_output.json_dict
+                else (
+                    task_output.pydantic.model_dump_json()
+                    if task_output.pydantic
+                    else task_output.raw
                 )
-                self._save_file(content)
-            crewai_event_bus.emit(
-                self, TaskCompletedEvent(output=task_output, task=self)
             )
-            return task_output
-        except Exception as e:
-            self.end_time = datetime.datetime.now()
-            crewai_event_bus.emit(self, TaskFailedEvent(error=str(e), task=self))
-            raise e  # Re-raise the exception after emitting the event
+            self._save_file(content)
+        crewai_event_bus.emit(self, TaskCompletedEvent(output=task_output, task=self))
+        return task_output
 
     def _process_guardrail(self, task_output: TaskOutput) -> GuardrailResult:
         assert self._guardrail is not None
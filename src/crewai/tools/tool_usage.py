@@ -326,11 +326,7 @@ class ToolUsage:
     ) -> bool:
         if not self.tools_handler:
             return False
-        if last_tool_usage := self.tools_handler.last_used_tool:
-            return (calling.tool_name == last_tool_usage.tool_name) and (
-                calling.arguments == last_tool_usage.arguments
-            )
-        return False
+        return self.tools_handler.is_last_used(calling)
 
     def _select_tool(self, tool_name: str) -> Any:
         order_tools = sorted(
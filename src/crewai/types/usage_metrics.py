@@ -11,6 +11,9 @@ class UsageMetrics(BaseModel):
         cached_prompt_tokens: Number of cached prompt tokens used.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
+        cache_hits: Number of tool calls served from the cache.
+        cache_misses: Number of tool calls not found in the cache.
+        cache_evictions: Number of cached tool results evicted to respect the cache size.
     """
 
     total_tokens: int = Field(default=0, description="Total number of tokens used.")
@@ -26,6 +29,16 @@ class UsageMetrics(BaseModel):
     successful_requests: int = Field(
         default=0, description="Number of successful requests made."
     )
+    cache_hits: int = Field(
+        default=0, description="Number of tool calls served from the cache."
+    )
+    cache_misses: int = Field(
+        default=0, description="Number of tool calls not found in the cache."
+    )
+    cache_evictions: int = Field(
+        default=0,
+        description="Number of cached tool results evicted to respect the cache size.",
+    )
 
     def add_usage_metrics(self, usage_metrics: "UsageMetrics"):
         """
@@ -39,3 +52,6 @@ class UsageMetrics(BaseModel):
         self.cached_prompt_tokens += usage_metrics.cached_prompt_tokens
         self.completion_tokens += usage_metrics.completion_tokens
         self.successful_requests += usage_metrics.successful_requests
+        self.cache_hits += usage_metrics.cache_hits
+        self.cache_misses += usage_metrics.cache_misses
+        self.cache_evictions += usage_metrics.cache_evictions
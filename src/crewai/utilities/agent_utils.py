@@ -8,6 +8,7 @@ from crewai.agents.parser import (
     AgentFinish,
     CrewAgentParser,
     OutputParserException,
+    StreamingAgentParser,
 )
 from crewai.llm import LLM
 from crewai.llms.base_llm import BaseLLM
@@ -16,6 +17,7 @@ from crewai.tools.base_tool import BaseTool
 from crewai.tools.structured_tool import CrewStructuredTool
 from crewai.tools.tool_types import ToolResult
 from crewai.utilities import I18N, Printer
+from crewai.utilities.context_window_manager import ContextWindowManager
 from crewai.utilities.errors import AgentRepositoryError
 from crewai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
@@ -142,13 +144,65 @@ def get_llm_response(
     messages: List[Dict[str, str]],
     callbacks: List[Any],
     printer: Printer,
+    stream_parser: Optional[StreamingAgentParser] = None,
 ) -> str:
-    """Call the LLM and return the response, handling any invalid responses."""
+    """Call the LLM and return the response, handling any invalid responses.
+
+    When the LLM streams and a ``stream_parser`` is given, the stream stops as
+    soon as a complete action has been generated.
+    """
     try:
-        answer = llm.call(
-            messages,
-            callbacks=callbacks,
+        if stream_parser is not None and isinstance(llm, LLM) and llm.stream:
+            answer = llm.call(
+                messages,
+                callbacks=callbacks,
+                stop_when=stream_parser.feed,
+            )
+            if stream_parser.is_complete:
+                answer = stream_parser.action_text
+        else:
+            answer = llm.call(
+                messages,
+                callbacks=callbacks,
+            )
+    except Exception as e:
+        printer.print(
+            content=f"Error during LLM call: {e}",
+            color="red",
         )
+        raise e
+    if not answer:
+        printer.print(
+            content="Received None or empty response from LLM call.",
+            color="red",
+        )
+        raise ValueError("Invalid response from LLM call - None or empty.")
+
+    return answer
+
+
+async def aget_llm_response(
+    llm: Union[LLM, BaseLLM],
+    messages: List[Dict[str, str]],
+    callbacks: List[Any],
+    printer: Printer,
+    stream_parser: Optional[StreamingAgentParser] = None,
+) -> str:
+    """Asynchronously call the LLM and return the response, handling any invalid responses."""
+    try:
+        if stream_parser is not None and isinstance(llm, LLM) and llm.stream:
+            answer = await llm.acall(
+                messages,
+                callbacks=callbacks,
+                stop_when=stream_parser.feed,
+            )
+            if stream_parser.is_complete:
+                answer = stream_parser.action_text
+        else:
+            answer = await llm.acall(
+                messages,
+                callbacks=callbacks,
+            )
     except Exception as e:
         printer.print(
             content=f"Error during LLM call: {e}",
@@ -296,6 +350,7 @@ def handle_context_length(
     llm: Any,
     callbacks: List[Any],
     i18n: Any,
+    context_window_manager: Optional[ContextWindowManager] = None,
 ) -> None:
     """Handle context length exceeded by either summarizing or raising an error.
 
@@ -306,13 +361,14 @@ def handle_context_length(
         llm: LLM instance for summarization
         callbacks: List of callbacks for LLM
         i18n: I18N instance for messages
+        context_window_manager: Optional manager reused across calls to keep its caches
     """
     if respect_context_window:
         printer.print(
             content="Context length exceeded. Summarizing content to fit the model context window.",
             color="yellow",
         )
-        summarize_messages(messages, llm, callbacks, i18n)
+        summarize_messages(messages, llm, callbacks, i18n, context_window_manager)
     else:
         printer.print(
             content="Context length exceeded. Consider using smaller text or RAG tools from crewai_tools.",
@@ -328,45 +384,19 @@ def summarize_messages(
     llm: Any,
     callbacks: List[Any],
     i18n: Any,
+    context_window_manager: Optional[ContextWindowManager] = None,
 ) -> None:
-    """Summarize messages to fit within context window.
+    """Summarize the oldest messages to fit within context window.
 
     Args:
         messages: List of messages to summarize
         llm: LLM instance for summarization
         callbacks: List of callbacks for LLM
         i18n: I18N instance for messages
+        context_window_manager: Optional manager reused across calls to keep its caches
     """
-    messages_groups = []
-    for message in messages:
-        content = message["content"]
-        cut_size = llm.get_context_window_size()
-        for i in range(0, len(content), cut_size):
-            messages_groups.append({"content": content[i : i + cut_size]})
-
-    summarized_contents = []
-    for group in messages_groups:
-        summary = llm.call(
-            [
-                format_message_for_llm(
-                    i18n.slice("summarizer_system_message"), role="system"
-                ),
-                format_message_for_llm(
-                    i18n.slice("summarize_instruction").format(group=group["content"]),
-                ),
-            ],
-            callbacks=callbacks,
-        )
-        summarized_contents.append({"content": str(summary)})
-
-    merged_summary = " ".join(content["content"] for content in summarized_contents)
-
-    messages.clear()
-    messages.append(
-        format_message_for_llm(
-            i18n.slice("summary").format(merged_summary=merged_summary)
-        )
-    )
+    manager = context_window_manager or ContextWindowManager(llm, i18n)
+    manager.summarize(messages, callbacks)
 
 
 def show_agent_logs(
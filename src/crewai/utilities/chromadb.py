@@ -1,5 +1,8 @@
+import math
 import re
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 MIN_COLLECTION_LENGTH = 3
 MAX_COLLECTION_LENGTH = 63
@@ -60,3 +63,61 @@ def sanitize_collection_name(name: Optional[str]) -> str:
             sanitized = sanitized[:-1] + "z"
 
     return sanitized
+
+
+def query_collection(
+    collection: Any,
+    query_embeddings: Sequence[Sequence[float]],
+    limit: int = 3,
+    score_threshold: float = 0.35,
+    where: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Query a collection for up to ``limit`` results of the first query embedding
+    whose score (distance) is at least ``score_threshold``, keeping only the
+    items matching ``where``.
+
+    When too few of the fetched results pass the threshold, more are fetched,
+    in proportion to how many passed, until ``limit`` results do or the
+    collection runs out of items.
+
+    Args:
+        collection: A ChromaDB collection, or one with the same query API.
+        query_embeddings: The query embeddings; results are those of the first.
+        limit: The maximum number of results.
+        score_threshold: The minimum score of a result.
+        where: A ChromaDB metadata filter.
+
+    Returns:
+        The results, as dicts with ``id``, ``metadata``, ``context`` and
+        ``score`` keys.
+    """
+    available = collection.count()
+    n_results = min(limit, available)
+    if n_results <= 0:
+        return []
+    while True:
+        response = collection.query(
+            query_embeddings=query_embeddings, n_results=n_results, where=where
+        )
+        ids = response["ids"][0]
+        scores = np.asarray(response["distances"][0], dtype=float)
+        passed = np.flatnonzero(scores >= score_threshold)[:limit]
+        if len(passed) == limit or len(ids) < n_results or n_results == available:
+            break
+        n_results = min(
+            available,
+            max(2 * n_results, math.ceil(n_results * limit / max(len(passed), 1))),
+        )
+
+    metadatas = response["metadatas"][0]
+    documents = response["documents"][0]
+    return [
+        {
+            "id": ids[i],
+            "metadata": metadatas[i],
+            "context": documents[i],
+            "score": float(scores[i]),
+        }
+        for i in passed.tolist()
+    ]
@@ -3,6 +3,8 @@ TRAINED_AGENTS_DATA_FILE = "trained_agents_data.pkl"
 DEFAULT_SCORE_THRESHOLD = 0.35
 KNOWLEDGE_DIRECTORY = "knowledge"
 MAX_LLM_RETRY = 3
+MAX_PARALLEL_TOOL_CALLS = 8
+EMBEDDING_BATCH_SIZE = 128
 MAX_FILE_NAME_LENGTH = 255
 EMITTER_COLOR = "bold_blue"
 
@@ -0,0 +1,213 @@
+"""Keeps an agent's message history within the LLM context window."""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import litellm
+
+from crewai.utilities.i18n import I18N
+
+MAX_SUMMARY_WORKERS = 4
+
+
+class ContextWindowManager:
+    """
+    Summarizes the oldest part of a conversation once it no longer fits in the
+    LLM context window.
+
+    Token counts are computed once per message content and only the oldest
+    messages beyond the target size are summarized. Summaries from earlier
+    calls are carried over as they are instead of being summarized again, and
+    chunks are summarized concurrently, each summary cached so the same
+    messages are never summarized twice. The chunk calls all pass the same
+    callbacks, which the LLM reports each call's usage to.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        i18n: Optional[I18N] = None,
+        target_ratio: float = 0.5,
+        max_workers: int = MAX_SUMMARY_WORKERS,
+    ):
+        self.llm = llm
+        self.i18n = i18n or I18N()
+        self.target_ratio = target_ratio
+        self.max_workers = max_workers
+        self._token_counts: Dict[str, int] = {}
+        self._summaries: Dict[str, str] = {}
+        # Merged summary of each summary message this manager wrote
+        self._merged_summaries: Dict[str, str] = {}
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of ``text``, caching the result by content."""
+        key = self._hash(text)
+        if key in self._token_counts:
+            return self._token_counts[key]
+        try:
+            tokens = litellm.token_counter(
+                model=getattr(self.llm, "model", ""), text=text
+            )
+        except Exception:
+            # Rough estimate for models litellm can't tokenize.
+            tokens = len(text) // 4 + 1
+        self._token_counts[key] = tokens
+        return tokens
+
+    def summarize(
+        self, messages: List[Dict[str, str]], callbacks: Optional[List[Any]] = None
+    ) -> None:
+        """Replace the oldest messages with a summary so the history fits.
+
+        Leading system messages and the most recent messages that fit in
+        ``target_ratio`` of the context window are kept as they are.
+
+        Args:
+            messages: Conversation to shrink, modified in place.
+            callbacks: Callbacks passed to the summarization LLM calls.
+        """
+        window = self.llm.get_context_window_size()
+        head = 0
+        while head < len(messages) and messages[head].get("role") == "system":
+            head += 1
+
+        budget = int(window * self.target_ratio) - sum(
+            self.count_tokens(message["content"]) for message in messages[:head]
+        )
+        tail = len(messages)
+        while tail > head:
+            tokens = self.count_tokens(messages[tail - 1]["content"])
+            if tokens > budget:
+                break
+            budget -= tokens
+            tail -= 1
+
+        overflow = messages[head:tail]
+        if not overflow:
+            return
+
+        # Earlier summaries split the overflow into segments, each chunked from
+        # its start so its chunks stay the same as messages are added. Pieces
+        # are either chunks to summarize or carried over summaries.
+        chunk_tokens = max(window // 2, 1)
+        pieces: List[Tuple[bool, str]] = []
+        segment: List[Dict[str, str]] = []
+        for message in overflow:
+            merged = self._merged_summaries.get(self._hash(message["content"]))
+            if merged is None:
+                segment.append(message)
+                continue
+            pieces += [(True, chunk) for chunk in self._chunk(segment, chunk_tokens)]
+            pieces.append((False, merged))
+            segment = []
+        pieces += [(True, chunk) for chunk in self._chunk(segment, chunk_tokens)]
+
+        summaries = self._summarize_chunks(
+            [text for is_chunk, text in pieces if is_chunk], callbacks
+        )
+        merged_summary = " ".join(
+            summaries[text] if is_chunk else text for is_chunk, text in pieces
+        )
+
+        # Carried over summaries add up: the merged summary is summarized again
+        # while it doesn't fit next to the kept messages, or stops shrinking.
+        kept_tokens = sum(
+            self.count_tokens(message["content"])
+            for message in messages[:head] + messages[tail:]
+        )
+        content = self.i18n.slice("summary").format(merged_summary=merged_summary)
+        while self.count_tokens(content) > window - kept_tokens:
+            parts = self._chunk([{"content": merged_summary}], chunk_tokens)
+            summarized = self._summarize_chunks(parts, callbacks)
+            shorter = " ".join(summarized[part] for part in parts)
+            if self.count_tokens(shorter) >= self.count_tokens(merged_summary):
+                break
+            merged_summary = shorter
+            content = self.i18n.slice("summary").format(merged_summary=merged_summary)
+
+        self._merged_summaries[self._hash(content)] = merged_summary
+        messages[head:tail] = [{"role": "user", "content": content}]
+
+    def _chunk(self, messages: List[Dict[str, str]], chunk_tokens: int) -> List[str]:
+        """Group messages into chunks of at most ``chunk_tokens`` tokens.
+
+        Chunks follow message boundaries and are packed from the first message,
+        so messages added at the end leave the earlier chunks, and their cached
+        summaries, unchanged. Messages larger than a chunk are split on their
+        own.
+        """
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+        for message in messages:
+            content = message["content"]
+            tokens = self.count_tokens(content)
+            if tokens > chunk_tokens:
+                if current:
+                    chunks.append("\n\n".join(current))
+                    current, current_tokens = [], 0
+                chunk_chars = max(len(content) * chunk_tokens // tokens, 1)
+                chunks.extend(
+                    content[i : i + chunk_chars]
+                    for i in range(0, len(content), chunk_chars)
+                )
+                continue
+            if current and current_tokens + tokens > chunk_tokens:
+                chunks.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            current.append(content)
+            current_tokens += tokens
+        if current:
+            chunks.append("\n\n".join(current))
+        return chunks
+
+    def _summarize_chunks(
+        self, chunks: List[str], callbacks: Optional[List[Any]]
+    ) -> Dict[str, str]:
+        """Summarize the chunks not summarized yet concurrently, and return the
+        summary of each chunk."""
+        missing = list(
+            dict.fromkeys(
+                chunk for chunk in chunks if self._hash(chunk) not in self._summaries
+            )
+        )
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(len(missing), self.max_workers),
+                thread_name_prefix="crewai-summary",
+            ) as pool:
+                list(
+                    pool.map(
+                        lambda chunk: self._summarize_chunk(chunk, callbacks), missing
+                    )
+                )
+        return {chunk: self._summaries[self._hash(chunk)] for chunk in chunks}
+
+    def _summarize_chunk(self, chunk: str, callbacks: Optional[List[Any]]) -> str:
+        key = self._hash(chunk)
+        if key in self._summaries:
+            return self._summaries[key]
+        summary = str(
+            self.llm.call(
+                [
+                    {
+                        "role": "system",
+                        "content": self.i18n.slice("summarizer_system_message"),
+                    },
+                    {
+                        "role": "user",
+                        "content": self.i18n.slice("summarize_instruction").format(
+                            group=chunk
+                        ),
+                    },
+                ],
+                callbacks=callbacks or [],
+            )
+        )
+        self._summaries[key] = summary
+        return summary
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
@@ -0,0 +1,108 @@
+"""Process-wide cache of query embeddings shared by memory and knowledge search."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence
+
+
+def embedder_key(
+    embedder_config: Any, embedding_function: Any, persistent: bool = False
+) -> str:
+    """Identify an embedder by its configuration and embedding function class.
+
+    The class is part of the key because storages pick different defaults when
+    no configuration is given. With ``persistent``, objects of the
+    configuration, like custom embedding functions, are identified by their
+    class rather than their repr, so the key is the same in every process.
+    """
+    canonical = json.dumps(
+        embedder_config,
+        sort_keys=True,
+        default=_class_name if persistent else repr,
+    )
+    name = _class_name(embedding_function)
+    return hashlib.sha256(f"{name}\x00{canonical}".encode()).hexdigest()
+
+
+def _class_name(value: Any) -> str:
+    cls = type(value)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class EmbeddingCache:
+    """
+    Size-bounded LRU cache of query embeddings keyed by embedder and text.
+
+    The same task description is searched against short-term, entity and
+    knowledge storages on every iteration; with the cache it is embedded once
+    per embedder.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed(
+        self,
+        embedder: str,
+        embedding_function: Callable[[List[str]], Sequence[Sequence[float]]],
+        texts: List[str],
+    ) -> List[List[float]]:
+        """Return the embedding of each text, computing the missing ones in one call.
+
+        Args:
+            embedder: Key of the embedder, see ``embedder_key``.
+            embedding_function: Function embedding a list of texts.
+            texts: Texts to embed.
+        """
+        keys = [
+            hashlib.sha256(f"{embedder}\x00{text}".encode()).hexdigest()
+            for text in texts
+        ]
+        embeddings: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    embeddings[key] = self._cache[key]
+                    self.hits += 1
+                else:
+                    self.misses += 1
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+        if missing:
+            computed = embedding_function(list(missing.values()))
+            with self._lock:
+                for key, embedding in zip(missing, computed):
+                    embeddings[key] = [float(value) for value in embedding]
+                    self._cache[key] = embeddings[key]
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+
+        return [embeddings[key] for key in keys]
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of looked up texts served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Global instance
+embedding_cache = EmbeddingCache()
@@ -1,19 +1,42 @@
+import atexit
 import threading
+from collections import deque
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Type, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from blinker import Signal
 
 from crewai.utilities.events.base_events import BaseEvent
 from crewai.utilities.events.event_types import EventTypes
+from crewai.utilities.events.flow_events import FlowStateEvent
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
 
 EventT = TypeVar("EventT", bound=BaseEvent)
 
+OverflowPolicy = Literal["block", "drop", "coalesce"]
+
 
 class CrewAIEventsBus:
     """
     A singleton event bus that uses blinker signals for event handling.
     Allows both internal (Flow/Crew) and external event handling.
+
+    Handlers run synchronously in the emitting thread by default. With
+    ``enable_async_delivery`` events are queued instead and a background
+    worker dispatches them in batches, so slow handlers don't slow down the
+    agents emitting them.
     """
 
     _instance = None
@@ -31,6 +54,21 @@ class CrewAIEventsBus:
         """Initialize the event bus internal state"""
         self._signal = Signal("crewai_event_bus")
         self._handlers: Dict[Type[BaseEvent], List[Callable]] = {}
+        # Handlers matching each concrete event class, rebuilt lazily after
+        # handlers change. Replaced rather than cleared so that an emit racing
+        # with a registration can't store a stale entry in the new table.
+        self._dispatch_table: Dict[
+            Type[BaseEvent], List[Tuple[Type[BaseEvent], Callable]]
+        ] = {}
+        self._async_delivery = False
+        self._queue: Deque[Tuple[Any, BaseEvent]] = deque()
+        self._queue_condition = threading.Condition()
+        self._max_queue_size = 10000
+        self._batch_size = 100
+        self._overflow_policy: OverflowPolicy = "block"
+        self._in_flight = 0
+        self._worker: Optional[threading.Thread] = None
+        self.dropped_events = 0
 
     def on(
         self, event_type: Type[EventT]
@@ -55,6 +93,7 @@ class CrewAIEventsBus:
             self._handlers[event_type].append(
                 cast(Callable[[Any, EventT], None], handler)
             )
+            self._dispatch_table = {}
             return handler
 
         return decorator
@@ -67,17 +106,48 @@ class CrewAIEventsBus:
             source: The object emitting the event
             event: The event instance to emit
         """
-        for event_type, handlers in self._handlers.items():
-            if isinstance(event, event_type):
-                for handler in handlers:
-                    try:
-                        handler(source, event)
-                    except Exception as e:
-                        print(
-                            f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
-                        )
+        if not self._handlers and not self._signal.receivers:
+            return
+        if self._async_delivery and threading.current_thread() is not self._worker:
+            if isinstance(event, FlowStateEvent):
+                # The flow keeps changing its state while the event is queued.
+                event.take_state_snapshot()
+            self._enqueue(source, event)
+        else:
+            self._dispatch(source, event)
 
-        self._signal.send(source, event=event)
+    def _dispatch(self, source: Any, event: BaseEvent) -> None:
+        if self._handlers:
+            dispatch_table = self._dispatch_table
+            event_class = type(event)
+            handlers = dispatch_table.get(event_class)
+            if handlers is None:
+                handlers = dispatch_table[event_class] = self._resolve_handlers(
+                    event_class
+                )
+            for event_type, handler in handlers:
+                try:
+                    handler(source, event)
+                except Exception as e:
+                    print(
+                        f"[EventBus Error] Handler '{handler.__name__}' failed for event '{event_type.__name__}': {e}"
+                    )
+
+        if self._signal.receivers:
+            self._signal.send(source, event=event)
+
+    def _resolve_handlers(
+        self, event_class: Type[BaseEvent]
+    ) -> List[Tuple[Type[BaseEvent], Callable]]:
+        """Collect the handlers registered for ``event_class`` or any of its bases,
+        in registration order."""
+        mro = set(event_class.__mro__)
+        return [
+            (event_type, handler)
+            for event_type, handlers in list(self._handlers.items())
+            if event_type in mro
+            for handler in list(handlers)
+        ]
 
     def register_handler(
         self, event_type: Type[EventTypes], handler: Callable[[Any, EventTypes], None]
@@ -88,6 +158,104 @@ class CrewAIEventsBus:
         self._handlers[event_type].append(
             cast(Callable[[Any, EventTypes], None], handler)
         )
+        self._dispatch_table = {}
+
+    def enable_async_delivery(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        overflow_policy: OverflowPolicy = "block",
+    ) -> None:
+        """
+        Deliver events from a bounded queue on a background worker.
+
+        Args:
+            max_queue_size: Maximum number of events waiting to be dispatched.
+            batch_size: Maximum number of events dispatched per worker wake-up.
+            overflow_policy: What ``emit`` does when the queue is full. "block"
+                waits for room, "drop" discards the event and counts it in
+                ``dropped_events``, "coalesce" merges a stream chunk into the
+                last queued chunk of the same source and blocks for other events.
+        """
+        if max_queue_size <= 0 or batch_size <= 0:
+            raise ValueError("max_queue_size and batch_size must be positive integers")
+        if overflow_policy not in ("block", "drop", "coalesce"):
+            raise ValueError(
+                f"Invalid overflow_policy '{overflow_policy}', expected 'block', 'drop' or 'coalesce'"
+            )
+        with self._queue_condition:
+            self._max_queue_size = max_queue_size
+            self._batch_size = batch_size
+            self._overflow_policy = overflow_policy
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="crewai-event-bus", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.flush)
+            self._async_delivery = True
+
+    def disable_async_delivery(self) -> None:
+        """Flush the queued events and go back to synchronous delivery."""
+        self._async_delivery = False
+        self.flush()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been dispatched.
+
+        Args:
+            timeout: Maximum number of seconds to wait, None waits until done.
+
+        Returns:
+            True if the queue was drained, False if the timeout expired.
+        """
+        if threading.current_thread() is self._worker:
+            return not self._queue
+        with self._queue_condition:
+            return self._queue_condition.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def _enqueue(self, source: Any, event: BaseEvent) -> None:
+        with self._queue_condition:
+            while len(self._queue) >= self._max_queue_size:
+                if self._overflow_policy == "drop":
+                    self.dropped_events += 1
+                    return
+                if self._overflow_policy == "coalesce" and isinstance(
+                    event, LLMStreamChunkEvent
+                ):
+                    last_source, last_event = self._queue[-1]
+                    if last_source is source and isinstance(
+                        last_event, LLMStreamChunkEvent
+                    ):
+                        self._queue[-1] = (
+                            source,
+                            last_event.model_copy(
+                                update={"chunk": last_event.chunk + event.chunk}
+                            ),
+                        )
+                        return
+                self._queue_condition.wait()
+            self._queue.append((source, event))
+            self._queue_condition.notify_all()
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._queue_condition:
+                self._queue_condition.wait_for(lambda: bool(self._queue))
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self._batch_size, len(self._queue)))
+                ]
+                self._in_flight = len(batch)
+                self._queue_condition.notify_all()
+            for source, event in batch:
+                self._dispatch(source, event)
+            with self._queue_condition:
+                self._in_flight = 0
+                self._queue_condition.notify_all()
 
     @contextmanager
     def scoped_handlers(self):
@@ -105,10 +273,12 @@ class CrewAIEventsBus:
         """
         previous_handlers = self._handlers.copy()
         self._handlers.clear()
+        self._dispatch_table = {}
         try:
             yield
         finally:
             self._handlers = previous_handlers
+            self._dispatch_table = {}
 
 
 # Global instance
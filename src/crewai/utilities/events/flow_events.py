@@ -1,6 +1,6 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_serializer
 
 from .base_events import BaseEvent
 
@@ -27,23 +27,68 @@ class FlowCreatedEvent(FlowEvent):
     type: str = "flow_created"
 
 
-class MethodExecutionStartedEvent(FlowEvent):
+class FlowStateEvent(FlowEvent):
+    """
+    Base class for flow events carrying a snapshot of the flow state.
+
+    The snapshot can be given as a function, ``state_snapshot``, instead of a
+    value. It is then only taken the first time ``state`` is read or the event
+    is serialized, so events whose state nobody reads don't copy it. Emitters
+    call ``take_state_snapshot`` before the state changes if the event is kept.
+    """
+
+    state: Union[Dict[str, Any], BaseModel]
+
+    _state_snapshot: Optional[Callable[[], Union[Dict[str, Any], BaseModel]]] = (
+        PrivateAttr(default=None)
+    )
+
+    def __init__(
+        self,
+        state_snapshot: Optional[Callable[[], Union[Dict[str, Any], BaseModel]]] = None,
+        **data: Any,
+    ):
+        if state_snapshot is None:
+            super().__init__(**data)
+            return
+        super().__init__(state={}, **data)
+        # Unset until read, see __getattr__.
+        del self.__dict__["state"]
+        self._state_snapshot = state_snapshot
+
+    def take_state_snapshot(self) -> None:
+        """Take the pending state snapshot, if any."""
+        if "state" not in self.__dict__:
+            self.__dict__["state"] = self._state_snapshot()  # type: ignore[misc]
+            self._state_snapshot = None
+
+    def __getattr__(self, item: str) -> Any:
+        if item == "state":
+            self.take_state_snapshot()
+            return self.__dict__["state"]
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    @model_serializer(mode="wrap")
+    def _serialize_with_state(self, handler: Callable[[Any], Any]) -> Any:
+        self.take_state_snapshot()
+        return handler(self)
+
+
+class MethodExecutionStartedEvent(FlowStateEvent):
     """Event emitted when a flow method starts execution"""
 
     flow_name: str
     method_name: str
-    state: Union[Dict[str, Any], BaseModel]
     params: Optional[Dict[str, Any]] = None
     type: str = "method_execution_started"
 
 
-class MethodExecutionFinishedEvent(FlowEvent):
+class MethodExecutionFinishedEvent(FlowStateEvent):
     """Event emitted when a flow method completes execution"""
 
     flow_name: str
     method_name: str
     result: Any = None
-    state: Union[Dict[str, Any], BaseModel]
     type: str = "method_execution_finished"
 
 
@@ -0,0 +1,126 @@
+"""Process-wide bounded execution of agent runs with cooperative cancellation."""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 32
+
+# Marks the threads of the pool, so executions nested in one run inline.
+_worker_state = threading.local()
+
+
+def _mark_worker() -> None:
+    _worker_state.active = True
+
+
+class ExecutionCancelledError(Exception):
+    """Raised inside an agent execution once its cancellation token is cancelled."""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between a caller and a running execution.
+
+    Python threads can't be stopped from the outside, so the running execution
+    checks the token at safe points (e.g. between agent loop iterations) and
+    stops by itself once the token is cancelled or its deadline has passed.
+    """
+
+    def __init__(self, deadline: Optional[float] = None):
+        self.deadline = deadline
+        self._event = threading.Event()
+
+    @classmethod
+    def with_timeout(cls, timeout: float) -> "CancellationToken":
+        """Create a token that cancels itself after ``timeout`` seconds."""
+        return cls(deadline=time.monotonic() + timeout)
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise ExecutionCancelledError("Execution was cancelled.")
+
+
+class ExecutionService:
+    """
+    A singleton, size-bounded thread pool used to run agent executions that
+    have a deadline, instead of creating a new pool for every execution.
+
+    The pool size defaults to the ``CREWAI_EXECUTION_MAX_WORKERS`` environment
+    variable, or 32 when it is not set. Executions submitted from a worker of
+    the pool, like delegated agents and nested crews, run inline in that
+    worker: waiting for a free worker from one could deadlock the pool.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:  # prevent race condition
+                    cls._instance = super(ExecutionService, cls).__new__(cls)
+                    cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        """Initialize the execution service internal state"""
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.max_workers = int(
+            os.environ.get("CREWAI_EXECUTION_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="crewai-execution",
+                        initializer=_mark_worker,
+                    )
+        return self._executor
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Schedule ``fn`` on the shared pool and return its future.
+
+        Called from a worker of the pool, ``fn`` runs right away in the calling
+        thread and the returned future is already done.
+        """
+        if getattr(_worker_state, "active", False):
+            future: "Future[T]" = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def configure(self, max_workers: int) -> None:
+        """Resize the pool. Running executions finish on the previous pool."""
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        with self._executor_lock:
+            previous_executor = self._executor
+            self._executor = None
+            self.max_workers = max_workers
+        if previous_executor is not None:
+            previous_executor.shutdown(wait=False)
+
+
+# Global instance
+execution_service = ExecutionService()
@@ -1,29 +1,64 @@
+import atexit
 import json
 import os
 import pickle
+import textwrap
+import threading
+import weakref
 from datetime import datetime
-from typing import Union
+from typing import Any, Dict, List, Optional, Union
+
+# Handlers with buffered entries, flushed when the interpreter exits since their
+# flush timers are daemon threads.
+_buffered_handlers: "weakref.WeakSet[FileHandler]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_handlers() -> None:
+    for handler in list(_buffered_handlers):
+        handler.flush()
 
 
 class FileHandler:
-    """Handler for file operations supporting both JSON and text-based logging.
-    
+    """Handler for file operations supporting JSON, JSON lines and text-based logging.
+
+    Text logs are written as entries come. JSON (``.json``) and JSON lines
+    (``.jsonl``) entries are buffered and appended together once
+    ``buffer_size`` entries are waiting or ``flush_interval`` seconds after the
+    first one. A ``.json`` log stays a single JSON list, extended in place
+    without reading it back.
+
     Args:
         file_path (Union[bool, str]): Path to the log file or boolean flag
+        buffer_size (int): Number of buffered JSON entries that triggers a write
+        flush_interval (float): Maximum number of seconds a JSON entry is buffered
     """
 
-    def __init__(self, file_path: Union[bool, str]):
+    def __init__(
+        self,
+        file_path: Union[bool, str],
+        buffer_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
         self._initialize_path(file_path)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        # Entries are serialized when logged, so errors surface in ``log``.
+        self._buffer: List[str] = []
+        self._buffer_lock = threading.Lock()
+        # Held while writing so batches land in the file in order.
+        self._write_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
         
     def _initialize_path(self, file_path: Union[bool, str]):
         if file_path is True:  # File path is boolean True
             self._path = os.path.join(os.curdir, "logs.txt")
         
         elif isinstance(file_path, str):  # File path is a string
-            if file_path.endswith((".json", ".txt")):
-                self._path = file_path  # No modification if the file ends with .json or .txt
+            if file_path.endswith((".json", ".jsonl", ".txt")):
+                self._path = file_path  # No modification if the file ends with .json, .jsonl or .txt
             else:
-                self._path = file_path + ".txt"  # Append .txt if the file doesn't end with .json or .txt
+                self._path = file_path + ".txt"  # Append .txt if the file doesn't end with .json, .jsonl or .txt
         
         else:
             raise ValueError("file_path must be a string or boolean.")  # Handle the case where file_path isn't valid
@@ -33,22 +68,26 @@ class FileHandler:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = {"timestamp": now, **kwargs}
 
-            if self._path.endswith(".json"):
-                # Append log in JSON format
-                with open(self._path, "a", encoding="utf-8") as file:
-                    # If the file is empty, start with a list; else, append to it
-                    try:
-                        # Try reading existing content to avoid overwriting
-                        with open(self._path, "r", encoding="utf-8") as read_file:
-                            existing_data = json.load(read_file)
-                            existing_data.append(log_entry)
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        # If no valid JSON or file doesn't exist, start with an empty list
-                        existing_data = [log_entry]
-                    
-                    with open(self._path, "w", encoding="utf-8") as write_file:
-                        json.dump(existing_data, write_file, indent=4)
-                        write_file.write("\n")
+            if self._path.endswith((".json", ".jsonl")):
+                # Buffer the entry, the file is written by batches
+                if self._path.endswith(".jsonl"):
+                    serialized = json.dumps(log_entry) + "\n"
+                else:
+                    serialized = textwrap.indent(
+                        json.dumps(log_entry, indent=4), "    "
+                    )
+                with self._buffer_lock:
+                    self._buffer.append(serialized)
+                    if len(self._buffer) < self.buffer_size:
+                        if self._flush_timer is None:
+                            self._flush_timer = threading.Timer(
+                                self.flush_interval, self.flush
+                            )
+                            self._flush_timer.daemon = True
+                            self._flush_timer.start()
+                            _buffered_handlers.add(self)
+                        return
+                self.flush()
             
             else:
                 # Append log in plain text format
@@ -58,6 +97,57 @@ class FileHandler:
 
         except Exception as e:
             raise ValueError(f"Failed to log message: {str(e)}")
+
+    def flush(self) -> None:
+        """Write the buffered JSON entries now."""
+        with self._write_lock:
+            with self._buffer_lock:
+                entries, self._buffer = self._buffer, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not entries:
+                return
+            if self._path.endswith(".jsonl"):
+                with open(self._path, "a", encoding="utf-8") as file:
+                    file.writelines(entries)
+            else:
+                self._extend_json_list(entries)
+
+    def _extend_json_list(self, entries: List[str]) -> None:
+        """Append the serialized ``entries`` to the JSON list of the log file, in
+        the layout ``json.dump(entries, file, indent=4)`` gives, by rewriting its
+        end only."""
+        items = ",\n".join(entries)
+        mode = "r+b" if os.path.exists(self._path) else "w+b"
+        with open(self._path, mode) as file:
+            size = file.seek(0, os.SEEK_END)
+            tail_start = max(0, size - 64)
+            file.seek(tail_start)
+            tail = file.read().rstrip()
+            if tail.endswith(b"]"):
+                # Overwrite the closing bracket of the list
+                head = tail[:-1].rstrip()
+                file.seek(tail_start + len(head))
+                separator = "\n" if head.endswith(b"[") else ",\n"
+            else:
+                # If no valid JSON or the file is empty, start a new list
+                file.seek(0)
+                separator = "[\n"
+            file.truncate()
+            file.write(f"{separator}{items}\n]\n".encode("utf-8"))
+
+    def read(self) -> List[Dict[str, Any]]:
+        """Return the entries of a JSON or JSON lines log, buffered ones included."""
+        if not self._path.endswith((".json", ".jsonl")):
+            raise ValueError("Only JSON and JSON lines logs can be read.")
+        self.flush()
+        if not os.path.exists(self._path):
+            return []
+        with open(self._path, "r", encoding="utf-8") as file:
+            if self._path.endswith(".json"):
+                return json.load(file)
+            return [json.loads(line) for line in file if line.strip()]
         
 class PickleHandler:
     def __init__(self, file_name: str) -> None:
@@ -0,0 +1,526 @@
+"""In-process vector collections backed by a memory-mapped NumPy matrix."""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from crewai.utilities.sqlite_pool import sqlite_pool
+
+DB_FILE_NAME = "local_vectors.db"
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS vector_collections (
+        name TEXT PRIMARY KEY,
+        dimension INTEGER,
+        rows INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS vector_records (
+        collection TEXT NOT NULL,
+        id TEXT NOT NULL,
+        row INTEGER NOT NULL,
+        document TEXT,
+        metadata TEXT,
+        PRIMARY KEY (collection, id)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_vector_records_row
+    ON vector_records (collection, row)
+    """,
+]
+
+_OPERATORS = {
+    "$eq": "=",
+    "$ne": "!=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
+
+# Ids bound per statement, below SQLite's limit on query parameters.
+_IDS_PER_QUERY = 500
+# Rows scored at a time when assigning them to IVF lists.
+_ASSIGN_BLOCK = 65536
+# Deleted or replaced rows tolerated in the matrix file before it's rewritten.
+_MIN_DEAD_ROWS = 1024
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _where_sql(where: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """Translate a Chroma-style metadata filter into a SQL condition."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    for key, condition in where.items():
+        if key in ("$and", "$or"):
+            parts = [_where_sql(sub) for sub in condition]
+            joiner = " AND " if key == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            params.extend(param for _, sub_params in parts for param in sub_params)
+            continue
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        path = '$."' + key.replace('"', '\\"') + '"'
+        for operator, value in condition.items():
+            if operator in ("$in", "$nin"):
+                negate = "NOT " if operator == "$nin" else ""
+                clauses.append(
+                    f"json_extract(metadata, ?) {negate}IN ({_placeholders(value)})"
+                )
+                params.extend([path, *value])
+            elif operator in _OPERATORS:
+                clauses.append(f"json_extract(metadata, ?) {_OPERATORS[operator]} ?")
+                params.extend([path, value])
+            else:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+    return " AND ".join(clauses) or "1", params
+
+
+class LocalVectorCollection:
+    """
+    A vector collection kept in the process instead of a vector database,
+    exposing the part of chromadb's ``Collection`` API the storages use.
+
+    Embeddings are normalized and appended to a float32 matrix file, memory
+    mapped for search and scored against the query with a single matrix
+    product. Documents and metadata live in SQLite, where metadata filters
+    run. Collections of at least ``ivf_min_size`` items are searched through
+    an inverted file index instead: rows are clustered around about sqrt(n)
+    centroids and only the ``ivf_nprobe`` clusters nearest to the query are
+    scored, trading a little recall for speed.
+
+    Distances are squared euclidean distances between the normalized vectors,
+    ``2 - 2 * cosine similarity``, the same as Chroma's default distance for
+    normalized embeddings.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        name: str,
+        embedding_function: Optional[Callable[[List[str]], Any]] = None,
+        ivf_min_size: Optional[int] = 100_000,
+        ivf_nprobe: int = 16,
+    ):
+        self.name = name
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.embedding_function = embedding_function
+        self.ivf_min_size = ivf_min_size
+        self.ivf_nprobe = ivf_nprobe
+        self._vectors_file = self.path / f"{name}.f32"
+        self._pool = sqlite_pool(str(self.path / DB_FILE_NAME))
+        self._pool.migrate("local_vectors", MIGRATIONS)
+        self._lock = threading.RLock()
+        self._loaded_rows = -1
+        self._matrix: Optional[np.ndarray] = None
+        self._alive = np.zeros(0, dtype=bool)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._ivf_built_rows = 0
+
+    def count(self) -> int:
+        return (
+            self._pool.connection()
+            .execute(
+                "SELECT COUNT(*) FROM vector_records WHERE collection = ?", (self.name,)
+            )
+            .fetchone()[0]
+        )
+
+    def add(
+        self,
+        ids: Sequence[str],
+        documents: Optional[Sequence[str]] = None,
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None:
+        """Add new items. Items whose id is already saved are left unchanged."""
+        existing = set(self.get(ids=list(ids), include=[])["ids"])
+        if existing:
+            keep = [i for i, item_id in enumerate(ids) if item_id not in existing]
+            ids = [ids[i] for i in keep]
+            documents = [documents[i] for i in keep] if documents else None
+            metadatas = [metadatas[i] for i in keep] if metadatas else None
+            embeddings = [embeddings[i] for i in keep] if embeddings else None
+        self._write(ids, documents, metadatas, embeddings)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        documents: Optional[Sequence[str]] = None,
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None:
+        """Add items, replacing the saved items with the same ids."""
+        self._write(ids, documents, metadatas, embeddings, replace=True)
+
+    def get(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        include: Sequence[str] = ("documents", "metadatas"),
+    ) -> Dict[str, Any]:
+        sql, params = _where_sql(where or {})
+        query = (
+            "SELECT id, document, metadata FROM vector_records "
+            f"WHERE collection = ? AND {sql}"
+        )
+        conn = self._pool.connection()
+        if ids is None:
+            rows = conn.execute(
+                query + " ORDER BY row", [self.name, *params]
+            ).fetchall()
+        else:
+            rows = []
+            for start in range(0, len(ids), _IDS_PER_QUERY):
+                batch = ids[start : start + _IDS_PER_QUERY]
+                rows.extend(
+                    conn.execute(
+                        query + f" AND id IN ({_placeholders(batch)})",
+                        [self.name, *params, *batch],
+                    )
+                )
+        if limit is not None:
+            rows = rows[:limit]
+        result: Dict[str, Any] = {"ids": [row[0] for row in rows]}
+        if "documents" in include:
+            result["documents"] = [row[1] for row in rows]
+        if "metadatas" in include:
+            result["metadatas"] = [
+                json.loads(row[2]) if row[2] else None for row in rows
+            ]
+        return result
+
+    def delete(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        sql, params = _where_sql(where or {})
+        query = f"DELETE FROM vector_records WHERE collection = ? AND {sql}"
+        with self._lock:
+            with self._pool.connection() as conn:
+                if ids is None:
+                    conn.execute(query, [self.name, *params])
+                for start in range(0, len(ids or []), _IDS_PER_QUERY):
+                    batch = list(ids or [])[start : start + _IDS_PER_QUERY]
+                    conn.execute(
+                        query + f" AND id IN ({_placeholders(batch)})",
+                        [self.name, *params, *batch],
+                    )
+            self._loaded_rows = -1
+            self._compact_if_sparse()
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = ("documents", "metadatas", "distances"),
+    ) -> Dict[str, List[List[Any]]]:
+        """Return the ``n_results`` items nearest to each query embedding."""
+        with self._lock:
+            self._refresh()
+            mask = self._alive if where is None else self._alive & self._mask(where)
+            queries = _normalize(np.asarray(query_embeddings, dtype=np.float32))
+            nearest = [self._nearest(query, mask, n_results) for query in queries]
+
+        response: Dict[str, List[List[Any]]] = {
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "distances": [],
+        }
+        conn = self._pool.connection()
+        for rows, similarities in nearest:
+            records = {
+                record[0]: record[1:]
+                for record in conn.execute(
+                    "SELECT row, id, document, metadata FROM vector_records "
+                    f"WHERE collection = ? AND row IN ({_placeholders(rows)})",
+                    [self.name, *rows],
+                )
+            }
+            found = [
+                (records[row], similarity)
+                for row, similarity in zip(rows, similarities)
+                if row in records
+            ]
+            response["ids"].append([record[0] for record, _ in found])
+            response["documents"].append([record[1] for record, _ in found])
+            response["metadatas"].append(
+                [json.loads(record[2]) if record[2] else None for record, _ in found]
+            )
+            response["distances"].append(
+                [max(0.0, 2.0 - 2.0 * similarity) for _, similarity in found]
+            )
+        return response
+
+    def clear(self) -> None:
+        """Delete every item of the collection."""
+        with self._lock:
+            with self._pool.connection() as conn:
+                conn.execute(
+                    "DELETE FROM vector_records WHERE collection = ?", (self.name,)
+                )
+                conn.execute(
+                    "DELETE FROM vector_collections WHERE name = ?", (self.name,)
+                )
+            self._matrix = None
+            self._vectors_file.unlink(missing_ok=True)
+            self._loaded_rows = -1
+
+    def _state(self, conn: sqlite3.Connection) -> Tuple[Optional[int], int]:
+        """Dimension and number of rows of the matrix file."""
+        row = conn.execute(
+            "SELECT dimension, rows FROM vector_collections WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def _write(
+        self,
+        ids: Sequence[str],
+        documents: Optional[Sequence[str]],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]],
+        embeddings: Optional[Sequence[Sequence[float]]],
+        replace: bool = False,
+    ) -> None:
+        if not ids:
+            return
+        if embeddings is None:
+            if documents is None or self.embedding_function is None:
+                raise ValueError("Either embeddings or documents must be provided")
+            embeddings = self.embedding_function(list(documents))
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+        metadatas = metadatas or [None] * len(ids)
+
+        with self._lock:
+            conn = self._pool.connection()
+            # Serializes the writers of every process using the file.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                dimension, rows = self._state(conn)
+                if dimension is not None and dimension != vectors.shape[1]:
+                    raise ValueError(
+                        f"Embedding dimension {vectors.shape[1]} does not match "
+                        f"collection dimensionality {dimension}"
+                    )
+                if replace:
+                    conn.executemany(
+                        "DELETE FROM vector_records WHERE collection = ? AND id = ?",
+                        [(self.name, item_id) for item_id in ids],
+                    )
+                with open(self._vectors_file, "ab") as f:
+                    # Drops the rows of an interrupted write, if any.
+                    f.truncate(rows * vectors.shape[1] * 4)
+                    f.write(vectors.tobytes())
+                conn.executemany(
+                    "INSERT INTO vector_records "
+                    "(collection, id, row, document, metadata) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            self.name,
+                            item_id,
+                            rows + i,
+                            documents[i] if documents else None,
+                            json.dumps(metadatas[i]) if metadatas[i] else None,
+                        )
+                        for i, item_id in enumerate(ids)
+                    ],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO vector_collections (name, dimension, rows) "
+                    "VALUES (?, ?, ?)",
+                    (self.name, vectors.shape[1], rows + len(ids)),
+                )
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            self._loaded_rows = -1
+            if replace:
+                self._compact_if_sparse()
+
+    def _refresh(self) -> None:
+        """Map the rows written since the last search, by any process."""
+        conn = self._pool.connection()
+        dimension, rows = self._state(conn)
+        if rows == self._loaded_rows:
+            return
+        self._matrix = (
+            np.memmap(
+                self._vectors_file,
+                dtype=np.float32,
+                mode="r",
+                shape=(rows, dimension),
+            )
+            if rows
+            else None
+        )
+        self._alive = np.zeros(rows, dtype=bool)
+        self._alive[
+            [
+                row
+                for (row,) in conn.execute(
+                    "SELECT row FROM vector_records WHERE collection = ?",
+                    (self.name,),
+                )
+            ]
+        ] = True
+        if rows < self._ivf_built_rows:
+            self._centroids = None
+            self._ivf_built_rows = 0
+        self._loaded_rows = rows
+
+    def _compact_if_sparse(self) -> None:
+        """Rewrite the matrix file without its deleted rows once they pile up."""
+        conn = self._pool.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            dimension, rows = self._state(conn)
+            alive = [
+                row
+                for (row,) in conn.execute(
+                    "SELECT row FROM vector_records WHERE collection = ? ORDER BY row",
+                    (self.name,),
+                )
+            ]
+            if rows - len(alive) < max(_MIN_DEAD_ROWS, len(alive)):
+                conn.rollback()
+                return
+            matrix = np.fromfile(self._vectors_file, dtype=np.float32)
+            compacted = self._vectors_file.with_suffix(".f32.tmp")
+            matrix.reshape(-1, dimension)[alive].tofile(compacted)
+            # Rows are renumbered in two passes to keep them unique meanwhile.
+            conn.executemany(
+                "UPDATE vector_records SET row = ? WHERE collection = ? AND row = ?",
+                [(-1 - new, self.name, old) for new, old in enumerate(alive)],
+            )
+            conn.execute(
+                "UPDATE vector_records SET row = -1 - row WHERE collection = ?",
+                (self.name,),
+            )
+            conn.execute(
+                "UPDATE vector_collections SET rows = ? WHERE name = ?",
+                (len(alive), self.name),
+            )
+            self._matrix = None
+            os.replace(compacted, self._vectors_file)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        self._loaded_rows = -1
+        self._centroids = None
+        self._ivf_built_rows = 0
+
+    def _mask(self, where: Dict[str, Any]) -> np.ndarray:
+        sql, params = _where_sql(where)
+        mask = np.zeros(len(self._alive), dtype=bool)
+        mask[
+            [
+                row
+                for (row,) in self._pool.connection().execute(
+                    f"SELECT row FROM vector_records WHERE collection = ? AND {sql}",
+                    [self.name, *params],
+                )
+            ]
+        ] = True
+        return mask
+
+    def _nearest(
+        self, query: np.ndarray, mask: np.ndarray, n_results: int
+    ) -> Tuple[List[int], List[float]]:
+        if self._matrix is None or n_results <= 0:
+            return [], []
+        candidates = self._ivf_candidates(query, mask)
+        if candidates is None:
+            similarities = np.asarray(self._matrix @ query)
+            similarities[~mask] = -np.inf
+            candidates = np.arange(len(similarities))
+        else:
+            similarities = np.asarray(self._matrix[candidates] @ query)
+        k = min(n_results, int(np.isfinite(similarities).sum()))
+        if k == 0:
+            return [], []
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        return candidates[top].tolist(), similarities[top].tolist()
+
+    def _ivf_candidates(
+        self, query: np.ndarray, mask: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Rows of the clusters nearest to ``query``, or None for a full scan."""
+        if self.ivf_min_size is None or int(mask.sum()) < self.ivf_min_size:
+            return None
+        if self._centroids is None or len(mask) > 2 * self._ivf_built_rows:
+            self._build_ivf(mask)
+        elif len(self._assignments) < len(mask):
+            self._assignments = np.concatenate(
+                [self._assignments, self._assign(len(self._assignments), len(mask))]
+            )
+        assert self._centroids is not None
+        nprobe = min(self.ivf_nprobe, len(self._centroids))
+        probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        return np.flatnonzero(np.isin(self._assignments, probes) & mask)
+
+    def _build_ivf(self, mask: np.ndarray, iterations: int = 10) -> None:
+        """Cluster the rows with spherical k-means over a sample of them."""
+        assert self._matrix is not None
+        rows = np.flatnonzero(mask)
+        n_lists = max(1, int(np.sqrt(len(rows))))
+        rng = np.random.default_rng(0)
+        sample_rows = rng.choice(rows, min(len(rows), n_lists * 64), replace=False)
+        sample = np.asarray(self._matrix[np.sort(sample_rows)])
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            filled = np.bincount(labels, minlength=n_lists) > 0
+            centroids[filled] = _normalize(sums[filled])
+        self._centroids = centroids
+        self._assignments = self._assign(0, len(mask))
+        self._ivf_built_rows = len(mask)
+
+    def _assign(self, start: int, end: int) -> np.ndarray:
+        assert self._matrix is not None and self._centroids is not None
+        labels = [np.zeros(0, dtype=np.int32)]
+        for block in range(start, end, _ASSIGN_BLOCK):
+            vectors = self._matrix[block : min(block + _ASSIGN_BLOCK, end)]
+            labels.append(
+                np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+            )
+        return np.concatenate(labels)
+
+
+def clear_local_vectors(path: str) -> None:
+    """Delete every collection saved in ``path``."""
+    db_path = Path(path) / DB_FILE_NAME
+    if not db_path.exists():
+        return
+    pool = sqlite_pool(str(db_path))
+    with pool.connection() as conn:
+        conn.execute("DELETE FROM vector_records")
+        conn.execute("DELETE FROM vector_collections")
+    for vectors_file in Path(path).glob("*.f32"):
+        vectors_file.unlink()
@@ -1,77 +1,212 @@
+"""Controls request and token rate limiting for API calls."""
+
+import asyncio
 import threading
 import time
-from typing import Optional
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from crewai.utilities.logger import Logger
+from crewai.utilities.sqlite_pool import sqlite_pool
+
+BucketState = Dict[str, float]
+
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS rate_limits (
+        key TEXT PRIMARY KEY,
+        requests REAL NOT NULL,
+        tokens REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+]
+
+
+class RateLimitBackend(ABC):
+    """Stores token bucket state and applies updates to it atomically."""
+
+    @abstractmethod
+    def update(
+        self,
+        key: str,
+        apply: Callable[[Optional[BucketState], float], Tuple[BucketState, float]],
+    ) -> float:
+        """Apply ``apply(state, now)`` to the bucket stored under ``key``.
+
+        Args:
+            key: Identifier of the bucket.
+            apply: Function receiving the current state (None for a new bucket)
+                and the current time, returning the new state and a result.
+
+        Returns:
+            The result returned by ``apply``.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Keeps bucket state in process memory, shared by all threads."""
+
+    def __init__(self):
+        self._states: Dict[str, BucketState] = {}
+        self._lock = threading.Lock()
+
+    def update(self, key, apply):
+        with self._lock:
+            state, result = apply(self._states.get(key), time.monotonic())
+            self._states[key] = state
+            return result
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Keeps bucket state in a SQLite database so several worker processes
+    can share the same budget.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._pool = sqlite_pool(db_path)
+        self._pool.migrate("rate_limits", MIGRATIONS)
 
-"""Controls request rate limiting for API calls."""
+    def update(self, key, apply):
+        conn = self._pool.connection()
+        # BEGIN IMMEDIATE takes the write lock up front so that the read and
+        # the write below are atomic across processes. It's outside the try:
+        # when it fails there is no transaction to roll back.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT requests, tokens, updated_at FROM rate_limits WHERE key = ?",
+                (key,),
+            ).fetchone()
+            current = (
+                {"requests": row[0], "tokens": row[1], "updated_at": row[2]}
+                if row
+                else None
+            )
+            state, result = apply(current, time.time())
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO rate_limits (key, requests, tokens, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, state["requests"], state["tokens"], state["updated_at"]),
+            )
+            conn.commit()
+            return result
+        except Exception:
+            conn.rollback()
+            raise
 
 
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Manages requests per minute and tokens per minute limiting.
+
+    Both budgets are token buckets that refill continuously, so callers only
+    wait for the fraction of a minute needed to free up capacity. A request
+    that exceeds the budget reserves its slot before waiting, which keeps
+    concurrent callers in order instead of retrying against each other.
+
+    Tokens are only known once a response comes back, so ``record_tokens``
+    charges them after the fact and later requests wait while the tokens
+    budget is overdrawn.
+    """
 
     max_rpm: Optional[int] = Field(default=None)
+    max_tpm: Optional[int] = Field(default=None)
+    storage_path: Optional[str] = Field(
+        default=None,
+        description="Path of a SQLite database used to share the budget across processes.",
+    )
+    key: str = Field(
+        default="default",
+        description="Name of the shared budget, used with storage_path.",
+    )
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _backend: Optional[RateLimitBackend] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
-    def reset_counter(self):
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+    def set_backend(self):
+        if self.max_rpm is not None or self.max_tpm is not None:
+            self._backend = (
+                SQLiteRateLimitBackend(self.storage_path)
+                if self.storage_path
+                else InMemoryRateLimitBackend()
+            )
         return self
 
     def check_or_wait(self):
-        if self.max_rpm is None:
-            return True
-
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
-            return True
-
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+        wait_time = self._reserve()
+        if wait_time > 0:
+            self._log_wait(wait_time)
+            self._wait(wait_time)
+        return True
+
+    async def acheck_or_wait(self):
+        wait_time = self._reserve()
+        if wait_time > 0:
+            self._log_wait(wait_time)
+            await asyncio.sleep(wait_time)
+        return True
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charge the tokens used by a finished request to the tokens budget."""
+        if self._backend is None or self.max_tpm is None or tokens <= 0:
+            return
+
+        def _apply(state, now):
+            state = self._refill(state, now)
+            state["tokens"] -= tokens
+            return state, 0.0
+
+        self._backend.update(self.key, _apply)
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
-
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
+        """Kept for backwards compatibility, the buckets need no background timer."""
+
+    def _reserve(self) -> float:
+        if self._backend is None:
+            return 0.0
+
+        def _apply(state, now):
+            state = self._refill(state, now)
+            wait_time = 0.0
+            if self.max_rpm is not None:
+                state["requests"] -= 1
+                if state["requests"] < 0:
+                    wait_time = -state["requests"] * 60 / self.max_rpm
+            if self.max_tpm is not None and state["tokens"] < 0:
+                wait_time = max(wait_time, -state["tokens"] * 60 / self.max_tpm)
+            return state, wait_time
+
+        return self._backend.update(self.key, _apply)
+
+    def _refill(self, state: Optional[BucketState], now: float) -> BucketState:
+        if state is None:
+            return {
+                "requests": float(self.max_rpm or 0),
+                "tokens": float(self.max_tpm or 0),
+                "updated_at": now,
+            }
+        elapsed = max(0.0, now - state["updated_at"])
+        if self.max_rpm is not None:
+            state["requests"] = min(
+                float(self.max_rpm), state["requests"] + elapsed * self.max_rpm / 60
+            )
+        if self.max_tpm is not None:
+            state["tokens"] = min(
+                float(self.max_tpm), state["tokens"] + elapsed * self.max_tpm / 60
+            )
+        state["updated_at"] = now
+        return state
+
+    def _log_wait(self, wait_time: float) -> None:
+        self.logger.log(
+            "info",
+            f"Rate limit reached, waiting {wait_time:.1f} seconds for capacity to free up.",
+        )
+
+    def _wait(self, wait_time: float) -> None:
+        time.sleep(wait_time)
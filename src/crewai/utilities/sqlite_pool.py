@@ -0,0 +1,118 @@
+"""Shared, per-thread SQLite connections for the built-in storages."""
+
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, Sequence
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+class _ThreadConnection:
+    """Holds a thread's connection, closing it once the thread has exited."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __del__(self) -> None:
+        self.conn.close()
+
+
+class SQLitePool:
+    """
+    Hands out one long-lived connection per thread for a database file.
+
+    Connections run in WAL mode, so readers don't block the writer, and keep
+    their prepared statements cached between calls instead of reconnecting and
+    re-parsing the SQL on every save or load. A connection is closed when its
+    thread exits, so short-lived threads don't leak file descriptors.
+    """
+
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        # Only the thread-local storage holds the connections strongly, it
+        # drops a thread's holder when the thread exits.
+        self._local = threading.local()
+        self._holders: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use.
+
+        The connection can be used as a context manager to commit, or roll
+        back on error, the statements executed inside it.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            # Closed from whichever thread releases the holder last.
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.timeout,
+                cached_statements=256,
+                check_same_thread=False,
+            )
+            conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            with self._lock:
+                self._holders.add(holder)
+        return holder.conn
+
+    def migrate(self, schema: str, migrations: Sequence[str]) -> None:
+        """Apply the migrations of ``schema`` that haven't run on this database.
+
+        Args:
+            schema: Name the applied version is recorded under, so storages
+                sharing a file migrate independently.
+            migrations: SQL scripts in the order they must run. Only append to
+                this list, the position of a script is its version.
+        """
+        conn = self.connection()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS schema_migrations "
+                "(schema TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+            row = conn.execute(
+                "SELECT version FROM schema_migrations WHERE schema = ?", (schema,)
+            ).fetchone()
+            version = row[0] if row else 0
+            for script in migrations[version:]:
+                conn.execute(script)
+            if len(migrations) > version:
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_migrations (schema, version) VALUES (?, ?)",
+                    (schema, len(migrations)),
+                )
+
+    def close(self) -> None:
+        """Close every connection opened by the pool."""
+        with self._lock:
+            holders = list(self._holders)
+            self._holders = weakref.WeakSet()
+        for holder in holders:
+            holder.conn.close()
+        self._local = threading.local()
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def sqlite_pool(db_path: str) -> SQLitePool:
+    """Return the process-wide pool of ``db_path``."""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = SQLitePool(db_path)
+        return _pools[key]
@@ -5,11 +5,17 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.types.utils import Usage
 
 from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.rpm_controller import RPMController
 
 
 class TokenCalcHandler(CustomLogger):
-    def __init__(self, token_cost_process: Optional[TokenProcess]):
+    def __init__(
+        self,
+        token_cost_process: Optional[TokenProcess],
+        rpm_controller: Optional[RPMController] = None,
+    ):
         self.token_cost_process = token_cost_process
+        self.rpm_controller = rpm_controller
 
     def log_success_event(
         self,
@@ -18,6 +24,13 @@ class TokenCalcHandler(CustomLogger):
         start_time: float,
         end_time: float,
     ) -> None:
+        if self.rpm_controller is not None:
+            response_usage = (
+                response_obj.get("usage") if isinstance(response_obj, dict) else None
+            )
+            if response_usage and getattr(response_usage, "total_tokens", None):
+                self.rpm_controller.record_tokens(response_usage.total_tokens)
+
         if self.token_cost_process is None:
             return
 
@@ -285,10 +285,13 @@ def test_cache_hitting():
 
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-    }
+    assert len(cache_handler._cache) == 2
+    assert (
+        cache_handler.read("multiplier", {"first_number": 2, "second_number": 6}) == 12
+    )
+    assert (
+        cache_handler.read("multiplier", {"first_number": 3, "second_number": 3}) == 9
+    )
 
     task = Task(
         description="What is 2 times 6 times 3? Return only the number",
@@ -298,11 +301,10 @@ def test_cache_hitting():
     output = agent.execute_task(task)
     assert output == "36"
 
-    assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
-    }
+    assert len(cache_handler._cache) == 3
+    assert (
+        cache_handler.read("multiplier", {"first_number": 12, "second_number": 3}) == 36
+    )
     received_events = []
 
     @crewai_event_bus.on(ToolUsageFinishedEvent)
@@ -613,7 +615,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         allow_delegation=False,
     )
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         task = Task(
             description="Use tool logic for `get_final_answer` but fon't give you final answer yet, instead keep using it unless you're told to give your final answer",
@@ -625,7 +627,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert output == "42"
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Rate limit reached" in captured.out
         moveon.assert_called()
 
 
@@ -659,11 +661,11 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Rate limit reached" not in captured.out
         moveon.assert_not_called()
 
 
@@ -718,12 +720,12 @@ def test_agent_without_max_rpm_respects_crew_rpm(capsys):
     # Set crew's max_rpm to 1 to trigger RPM limit
     crew = Crew(agents=[agent1, agent2], tasks=tasks, max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
         assert "get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Rate limit reached" in captured.out
         moveon.assert_called_once()
 
 
@@ -1538,6 +1540,221 @@ def test_agent_execute_task_basic():
     assert "4" in result
 
 
+def test_agent_runs_several_tool_calls_from_one_response():
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        llm="gpt-4o-mini",
+    )
+
+    task = Task(
+        description="What are 2 times 6 and 3 times 3?",
+        expected_output="The results of the multiplications.",
+        agent=agent,
+    )
+
+    responses = [
+        "Thought: I need both products\n"
+        "Action 1: multiplier\n"
+        'Action Input 1: {"first_number": 2, "second_number": 6}\n'
+        "Action 2: multiplier\n"
+        'Action Input 2: {"first_number": 3, "second_number": 3}',
+        "Thought: I know the answer\nFinal Answer: 12 and 9",
+    ]
+    prompts = []
+
+    def fake_call(messages, *args, **kwargs):
+        prompts.append(messages[-1]["content"])
+        return responses[len(prompts) - 1]
+
+    with patch.object(LLM, "call", side_effect=fake_call):
+        result = agent.execute_task(task)
+
+    assert result == "12 and 9"
+    assert len(prompts) == 2
+    observation = prompts[-1]
+    assert "Action 1 (multiplier) result: 12" in observation
+    assert "Action 2 (multiplier) result: 9" in observation
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_awaits_llm():
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm="gpt-4o-mini",
+    )
+
+    task = Task(
+        description="Calculate 2 + 2",
+        expected_output="The result of the calculation",
+        agent=agent,
+    )
+
+    with (
+        patch.object(
+            LLM,
+            "acall",
+            new_callable=mock.AsyncMock,
+            return_value="Thought: I know the answer\nFinal Answer: 4",
+        ) as acall,
+        patch.object(LLM, "call") as call,
+    ):
+        result = await agent.aexecute_task(task)
+
+    assert result == "4"
+    acall.assert_awaited_once()
+    call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_agent_aexecute_task_cancels_on_timeout():
+    import asyncio
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm="gpt-4o-mini",
+        max_execution_time=1,
+    )
+
+    task = Task(
+        description="Calculate 2 + 2",
+        expected_output="The result of the calculation",
+        agent=agent,
+    )
+
+    async def slow_acall(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    with patch.object(LLM, "acall", side_effect=slow_acall):
+        with pytest.raises(TimeoutError):
+            await agent.aexecute_task(task)
+
+
+def test_agent_execute_task_timeout_stops_agent_loop():
+    import time
+
+    from crewai.utilities.execution_service import execution_service
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        llm="gpt-4o-mini",
+        max_execution_time=1,
+        max_retry_limit=0,
+    )
+
+    task = Task(
+        description="Calculate 2 + 2",
+        expected_output="The result of the calculation",
+        agent=agent,
+    )
+
+    calls = []
+
+    def slow_call(*args, **kwargs):
+        calls.append(1)
+        time.sleep(1.5)
+        return "Thought: I need to keep thinking"
+
+    with (
+        patch.object(LLM, "call", side_effect=slow_call),
+        patch.object(
+            execution_service, "submit", wraps=execution_service.submit
+        ) as submit,
+    ):
+        with pytest.raises(TimeoutError):
+            agent.execute_task(task)
+        submit.assert_called_once()
+        assert agent.agent_executor.cancellation_token.cancelled
+        # Give the worker time to observe the cancelled token
+        time.sleep(2)
+
+    assert len(calls) == 1
+
+
+def test_execution_service_runs_nested_executions_inline():
+    import threading
+
+    from crewai.utilities.execution_service import execution_service
+
+    max_workers = execution_service.max_workers
+    execution_service.configure(1)
+    try:
+        # With a single worker, waiting on the pool from it would never return
+        outer = execution_service.submit(
+            lambda: execution_service.submit(threading.current_thread).result(timeout=5)
+        )
+        assert outer.result(timeout=5).name.startswith("crewai-execution")
+    finally:
+        execution_service.configure(max_workers)
+
+
+def test_execution_timeout_covers_waiting_for_a_worker():
+    import threading
+
+    from crewai.utilities.execution_service import execution_service
+
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="Test task", expected_output="Output", agent=agent)
+    agent.create_agent_executor(task=task)
+    max_workers = execution_service.max_workers
+    execution_service.configure(1)
+    release = threading.Event()
+    try:
+        busy = execution_service.submit(release.wait, 5)
+        with (
+            patch.object(Agent, "_execute_without_timeout") as execute,
+            pytest.raises(TimeoutError),
+        ):
+            agent._execute_with_timeout("prompt", task, 0.2)
+        release.set()
+        busy.result(timeout=5)
+        execute.assert_not_called()
+    finally:
+        release.set()
+        execution_service.configure(max_workers)
+
+
+def test_tool_batches_reuse_the_executor_tool_pool():
+    import threading
+
+    from crewai.agents.parser import AgentAction
+
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    agent.create_agent_executor()
+    executor = agent.agent_executor
+    actions = [AgentAction("", "search", f'{{"q": "{i}"}}', "") for i in range(3)]
+    threads = []
+
+    def execute_tool(action):
+        threads.append(threading.current_thread().name)
+        return action.tool_input
+
+    with (
+        patch.object(executor, "_execute_tool", side_effect=execute_tool),
+        patch.object(executor, "_handle_agent_actions"),
+    ):
+        executor._execute_agent_actions(actions[0], actions)
+        pool = executor._tool_pool
+        executor._execute_agent_actions(actions[0], actions)
+
+    assert executor._tool_pool is pool
+    assert len(threads) == 6
+    assert all(name.startswith("crewai-tool") for name in threads)
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_agent_execute_task_with_context():
     agent = Agent(
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from crewai.agents.cache import CacheHandler
+
+
+def test_cache_handler_keys_ignore_argument_order():
+    cache_handler = CacheHandler()
+    cache_handler.add("multiplier", {"first_number": 2, "second_number": 6}, 12)
+
+    assert (
+        cache_handler.read("multiplier", {"second_number": 6, "first_number": 2}) == 12
+    )
+    assert (
+        cache_handler.read("multiplier", '{"second_number": 6, "first_number": 2}')
+        == 12
+    )
+    assert cache_handler.read("adder", {"first_number": 2, "second_number": 6}) is None
+
+
+def test_cache_handler_evicts_least_recently_used_entry():
+    cache_handler = CacheHandler(max_size=2)
+    cache_handler.add("tool", "a", 1)
+    cache_handler.add("tool", "b", 2)
+    cache_handler.read("tool", "a")
+    cache_handler.add("tool", "c", 3)
+
+    assert cache_handler.read("tool", "b") is None
+    assert cache_handler.read("tool", "a") == 1
+    assert cache_handler.read("tool", "c") == 3
+    assert cache_handler.evictions == 1
+    assert cache_handler.hits == 3
+    assert cache_handler.misses == 1
+
+
+def test_cache_handler_expires_entries_using_tool_ttls():
+    cache_handler = CacheHandler(ttl=100, tool_ttls={"weather": 10})
+
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=0):
+        cache_handler.add("weather", "paris", "sunny")
+        cache_handler.add("calculator", "1+1", 2)
+
+    with patch("crewai.agents.cache.cache_handler.time.time", return_value=50):
+        assert cache_handler.read("weather", "paris") is None
+        assert cache_handler.read("calculator", "1+1") == 2
+
+
+def test_cache_handler_disk_tier_survives_new_instances(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    CacheHandler(storage_path=db_path).add("multiplier", {"a": 2, "b": 6}, 12)
+
+    cache_handler = CacheHandler(storage_path=db_path)
+    assert cache_handler.read("multiplier", {"b": 6, "a": 2}) == 12
+    assert cache_handler.hits == 1
+
+
+def test_cache_handler_only_writes_json_outputs_to_disk(tmp_path):
+    db_path = str(tmp_path / "tool_cache.db")
+    cache_handler = CacheHandler(storage_path=db_path)
+    output = object()
+
+    cache_handler.add("factory", "build", output)
+    cache_handler.add("multiplier", "2*6", {"result": 12})
+
+    assert cache_handler.read("factory", "build") is output
+    fresh_handler = CacheHandler(storage_path=db_path)
+    assert fresh_handler.read("factory", "build") is None
+    assert fresh_handler.read("multiplier", "2*6") == {"result": 12}
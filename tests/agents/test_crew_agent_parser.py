@@ -5,7 +5,7 @@ from crewai.agents.crew_agent_executor import (
     AgentFinish,
     OutputParserException,
 )
-from crewai.agents.parser import CrewAgentParser
+from crewai.agents.parser import CrewAgentParser, StreamingAgentParser
 
 
 @pytest.fixture
@@ -36,6 +36,34 @@ def test_valid_action_parsing_with_json_tool_input(parser):
     assert result.tool_input == expected_tool_input
 
 
+def test_parse_actions_with_several_numbered_actions(parser):
+    text = (
+        "Thought: I need both results\n"
+        "Action 1: search\n"
+        'Action Input 1: {"query": "weather"}\n'
+        "Action 2: calculator\n"
+        'Action Input 2: {"expression": "2 + 2"}'
+    )
+    actions = parser.parse_actions(text)
+    assert [action.tool for action in actions] == ["search", "calculator"]
+    assert actions[0].tool_input == '{"query": "weather"}'
+    assert actions[1].tool_input == '{"expression": "2 + 2"}'
+    assert all(action.thought == "Thought: I need both results" for action in actions)
+
+
+def test_parse_actions_ignores_unnumbered_actions(parser):
+    text = (
+        "Thought: I need the weather\n"
+        "Action: search\n"
+        'Action Input: {"query": "weather"}\n'
+        "Observation: It is sunny\n"
+        "Action: calculator\n"
+        'Action Input: {"expression": "2 + 2"}'
+    )
+    assert parser.parse_actions(text) == []
+    assert parser.parse(text).tool == "search"
+
+
 def test_valid_action_parsing_with_quotes(parser):
     text = 'Thought: Let\'s find the temperature\nAction: search\nAction Input: "temperature in SF"'
     result = parser.parse(text)
@@ -371,3 +399,41 @@ class MockAgent:
 
 
 # TODO: ADD TEST TO MAKE SURE ** REMOVAL DOESN'T MESS UP ANYTHING
+
+
+def _stream(text, chunk_size=3):
+    parser = StreamingAgentParser()
+    for i in range(0, len(text), chunk_size):
+        if parser.feed(text[i : i + chunk_size]):
+            break
+    return parser
+
+
+def test_streaming_parser_completes_after_action_input():
+    parser = _stream(
+        'Thought: I should search\nAction: search\nAction Input: {"query": "a}\\n"}\nObservation: made up'
+    )
+    assert parser.is_complete
+    assert parser.action_text == (
+        'Thought: I should search\nAction: search\nAction Input: {"query": "a}\\n"}'
+    )
+    assert isinstance(CrewAgentParser.parse_text(parser.action_text), AgentAction)
+
+
+def test_streaming_parser_waits_for_every_action_of_a_batch():
+    parser = _stream(
+        "Thought: both\n"
+        "Action 1: search\n"
+        'Action Input 1: {"query": "a"}\n'
+        "Action 2: search\n"
+        'Action Input 2: {"query": "b"}\n'
+        "Observation: made up"
+    )
+    assert parser.is_complete
+    assert parser.action_text.endswith('Action Input 2: {"query": "b"}')
+
+
+def test_streaming_parser_never_stops_a_final_answer():
+    parser = _stream('Thought: done\nFinal Answer: Action Input: {"a": 1}\nmore text')
+    assert parser.is_final_answer
+    assert not parser.is_complete
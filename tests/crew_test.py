@@ -959,11 +959,11 @@ def test_api_calls_throttling(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=True)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Rate limit reached" in captured.out
         moveon.assert_called()
 
 
@@ -1058,6 +1058,121 @@ def test_agents_rpm_is_never_set_if_crew_max_RPM_is_not_set():
     assert agent._rpm_controller is None
 
 
+def test_dag_process_runs_independent_tasks_concurrently(researcher, writer):
+    import threading
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for an article.",
+        expected_output="Bullet point list of 5 ideas.",
+        agent=researcher,
+    )
+    list_important_history = Task(
+        description="Give me the 5 most important events that shaped AI.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=writer,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+        context=[list_ideas, list_important_history],
+    )
+
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.dag,
+        tasks=[list_ideas, list_important_history, write_article],
+    )
+
+    # Both independent tasks must be running at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    contexts = {}
+
+    def execute_sync(task, agent=None, context=None, tools=None):
+        contexts[task.description] = context
+        if task is not write_article:
+            barrier.wait()
+        task.output = TaskOutput(
+            description=task.description, raw=f"{agent.role} output", agent=agent.role
+        )
+        return task.output
+
+    with patch.object(
+        Task, "execute_sync", autospec=True, side_effect=execute_sync
+    ) as mock_execute_sync:
+        result = crew.kickoff()
+
+    assert mock_execute_sync.call_count == 3
+    assert "Researcher output" in contexts[write_article.description]
+    assert "Senior Writer output" in contexts[write_article.description]
+    assert [output.raw for output in result.tasks_output] == [
+        "Researcher output",
+        "Senior Writer output",
+        "Senior Writer output",
+    ]
+    assert result.raw == "Senior Writer output"
+
+
+def test_dag_process_does_not_run_tasks_of_the_same_agent_concurrently(researcher):
+    import threading
+
+    tasks = [
+        Task(
+            description=f"Research topic {i}.",
+            expected_output="A bullet point.",
+            agent=researcher,
+        )
+        for i in range(3)
+    ]
+    crew = Crew(agents=[researcher], process=Process.dag, tasks=tasks)
+
+    lock = threading.Lock()
+    running = []
+    overlapped = threading.Event()
+
+    def execute_sync(task, agent=None, context=None, tools=None):
+        with lock:
+            if running:
+                overlapped.set()
+            running.append(task)
+        # Leaves the other tasks time to start, as they would if not serialized
+        overlapped.wait(timeout=0.5)
+        with lock:
+            running.remove(task)
+        return TaskOutput(description=task.description, raw="done", agent=agent.role)
+
+    with patch.object(Task, "execute_sync", autospec=True, side_effect=execute_sync):
+        crew.kickoff()
+
+    assert not overlapped.is_set()
+
+
+def test_crew_usage_metrics_count_cache_hits_after_kickoff(researcher):
+    task = Task(
+        description="Research AI.", expected_output="A bullet.", agent=researcher
+    )
+    crew = Crew(agents=[researcher], tasks=[task])
+
+    def execute_sync(task, agent=None, context=None, tools=None):
+        crew._cache_handler.read(tool="search", input="AI")
+        crew._cache_handler.add(tool="search", input="AI", output="result")
+        crew._cache_handler.read(tool="search", input="AI")
+        return TaskOutput(description=task.description, raw="done", agent=agent.role)
+
+    with patch.object(Task, "execute_sync", autospec=True, side_effect=execute_sync):
+        crew.kickoff()
+
+    assert crew.usage_metrics.cache_hits == 1
+    assert crew.usage_metrics.cache_misses == 1
+
+
+def test_dag_process_requires_agent_in_tasks():
+    task = Task(description="Say hi.", expected_output="A greeting.")
+
+    with pytest.raises(pydantic_core._pydantic_core.ValidationError):
+        Crew(agents=[], process=Process.dag, tasks=[task])
+
+
 @pytest.mark.vcr(filter_headers=["authorization"])
 def test_sequential_async_task_execution_completion(researcher, writer):
     list_ideas = Task(
@@ -1433,6 +1548,45 @@ async def test_kickoff_async_basic_functionality_and_output():
         mock_kickoff.assert_called_once_with(inputs)
 
 
+@pytest.mark.asyncio
+async def test_akickoff_executes_tasks_natively(researcher, writer):
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for an article.",
+        expected_output="Bullet point list of 5 ideas.",
+        agent=researcher,
+        async_execution=True,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+    )
+    crew = Crew(agents=[researcher, writer], tasks=[list_ideas, write_article])
+
+    async def aexecute(task, agent=None, context=None, tools=None):
+        return TaskOutput(
+            description=task.description, raw=f"{agent.role} output", agent=agent.role
+        )
+
+    with (
+        patch.object(
+            Task, "aexecute", autospec=True, side_effect=aexecute
+        ) as mock_aexecute,
+        patch.object(Task, "execute_sync") as mock_execute_sync,
+        patch.object(Task, "execute_async") as mock_execute_async,
+    ):
+        result = await crew.akickoff()
+
+    assert mock_aexecute.call_count == 2
+    mock_execute_sync.assert_not_called()
+    mock_execute_async.assert_not_called()
+    assert result.raw == "Senior Writer output"
+    assert [output.raw for output in result.tasks_output] == [
+        "Researcher output",
+        "Senior Writer output",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_async_kickoff_for_each_async_basic_functionality_and_output():
     """Tests the basic functionality and output of kickoff_for_each_async."""
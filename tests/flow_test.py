@@ -1,6 +1,8 @@
 """Test Flow creation and execution basic functionality."""
 
 import asyncio
+import threading
+import time
 from datetime import datetime
 
 import pytest
@@ -132,6 +134,66 @@ def test_flow_with_and_condition():
     assert execution_order.index("step_3") > execution_order.index("step_2")
 
 
+def test_listeners_are_indexed_by_trigger():
+    class IndexedFlow(Flow):
+        @start()
+        def step_1(self):
+            pass
+
+        @start()
+        def step_2(self):
+            pass
+
+        @listen(step_1)
+        def step_3(self):
+            pass
+
+        @listen(and_(step_1, step_2))
+        def step_4(self):
+            pass
+
+        @router(step_3)
+        def route(self):
+            return "done"
+
+        @listen("done")
+        def finish(self):
+            pass
+
+    assert IndexedFlow._listener_triggers == {
+        "step_1": [("step_3", 0), ("step_4", 1)],
+        "step_2": [("step_4", 2)],
+        "done": [("finish", 0)],
+    }
+    assert IndexedFlow._router_triggers == {"step_3": [("route", 0)]}
+    assert IndexedFlow._and_masks == {"step_4": 3}
+
+
+def test_and_condition_waits_for_every_trigger_again_after_firing():
+    class RepeatedAndFlow(Flow):
+        @start()
+        def a(self):
+            pass
+
+        @listen("a")
+        def b(self):
+            pass
+
+        @listen(and_(a, b))
+        def joined(self):
+            pass
+
+    flow = RepeatedAndFlow()
+    assert flow._and_masks == {"joined": 3}
+
+    fired = [
+        flow._find_triggered_methods(trigger, router_only=False)
+        for trigger in ["a", "a", "b", "b", "a"]
+    ]
+
+    assert fired == [["b"], ["b"], ["joined"], [], ["b", "joined"]]
+
+
 def test_flow_with_or_condition():
     """Test a flow where a step is triggered when any of multiple steps complete."""
     execution_order = []
@@ -630,6 +692,178 @@ def test_stateless_flow_event_emission():
     assert isinstance(received_events[5].timestamp, datetime)
 
 
+def test_method_event_state_is_only_copied_when_used():
+    class CountingFlow(Flow):
+        copies = 0
+
+        def _copy_state(self):
+            CountingFlow.copies += 1
+            return super()._copy_state()
+
+        @start()
+        def step_1(self):
+            self.state["counter"] = 1
+
+        @listen(step_1)
+        def step_2(self):
+            self.state["counter"] = 2
+
+    kept_events = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionStartedEvent)
+        def ignore_start(source, event):
+            pass
+
+        CountingFlow().kickoff()
+        assert CountingFlow.copies == 0
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def keep_finish(source, event):
+            kept_events.append(event)
+
+        CountingFlow().kickoff()
+
+    assert CountingFlow.copies == 2
+    assert [event.state["counter"] for event in kept_events] == [1, 2]
+
+
+def test_live_event_state_is_the_flow_state():
+    class LiveFlow(Flow):
+        event_state = "live"
+
+        @start()
+        def step_1(self):
+            self.state["counter"] = 1
+
+    states = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def keep_state(source, event):
+            states.append(event.state)
+
+        flow = LiveFlow()
+        flow.kickoff()
+
+    assert states == [flow.state]
+
+
+def test_flow_max_concurrency_limits_running_methods():
+    running = []
+    peak = []
+
+    class FanOutFlow(Flow):
+        max_concurrency = 2
+
+        @start()
+        def begin(self):
+            pass
+
+        async def _work(self):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.05)
+            running.pop()
+
+        @listen(begin)
+        async def branch_1(self):
+            await self._work()
+
+        @listen(begin)
+        async def branch_2(self):
+            await self._work()
+
+        @listen(begin)
+        async def branch_3(self):
+            await self._work()
+
+        @listen(begin)
+        async def branch_4(self):
+            await self._work()
+
+    FanOutFlow().kickoff()
+
+    assert len(peak) == 4
+    assert max(peak) == 2
+
+
+def test_method_max_concurrency_limits_its_executions():
+    running = []
+    peak = []
+
+    class SharedStepFlow(Flow):
+        @start()
+        def source_1(self):
+            pass
+
+        @start()
+        def source_2(self):
+            pass
+
+        @listen(or_(source_1, source_2), max_concurrency=1)
+        async def shared_step(self):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.05)
+            running.pop()
+
+    SharedStepFlow().kickoff()
+
+    assert peak == [1, 1]
+
+
+def test_sync_methods_can_be_offloaded_to_threads():
+    threads = set()
+
+    class OffloadedFlow(Flow):
+        offload_sync_methods = True
+
+        @start()
+        def begin(self):
+            pass
+
+        @listen(begin)
+        def branch_1(self):
+            time.sleep(0.2)
+            threads.add(threading.get_ident())
+
+        @listen(begin)
+        def branch_2(self):
+            time.sleep(0.2)
+            threads.add(threading.get_ident())
+
+        @listen(begin)
+        def branch_3(self):
+            time.sleep(0.2)
+            threads.add(threading.get_ident())
+
+    started = time.monotonic()
+    OffloadedFlow().kickoff()
+
+    assert time.monotonic() - started < 0.5
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+
+
+def test_method_timeout_fails_the_flow():
+    class SlowFlow(Flow):
+        @start(timeout=0.05)
+        async def slow_step(self):
+            await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        SlowFlow().kickoff()
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+
+        @listen("step", max_concurrency=0)
+        def invalid_step(self):
+            pass
+
+
 def test_flow_plotting():
     class StatelessFlow(Flow):
         @start()
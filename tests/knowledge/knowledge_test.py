@@ -5,7 +5,9 @@ from typing import List, Union
 from unittest.mock import patch
 
 import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
 
+from crewai.knowledge.knowledge import Knowledge
 from crewai.knowledge.source.crew_docling_source import CrewDoclingSource
 from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
 from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
@@ -13,6 +15,7 @@ from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
 from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
 from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
 from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.storage.local_knowledge_storage import LocalKnowledgeStorage
 
 
 @pytest.fixture(autouse=True)
@@ -603,3 +606,225 @@ def test_file_path_validation():
         match="file_path/file_paths must be a Path, str, or a list of these types",
     ):
         PDFKnowledgeSource()
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.embedded: List[str] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [[float(len(text)), 1.0, 0.0] for text in input]
+
+
+@pytest.fixture
+def incremental_knowledge(tmp_path):
+    with (
+        patch(
+            "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+            return_value=str(tmp_path),
+        ),
+        patch(
+            "crewai.knowledge.storage.knowledge_manifest.db_storage_path",
+            return_value=str(tmp_path),
+        ),
+        patch(
+            "crewai.knowledge.storage.local_knowledge_storage.db_storage_path",
+            return_value=str(tmp_path),
+        ),
+    ):
+        embedder = CountingEmbedder()
+
+        def build(
+            paths, vector_store="chroma", purge_removed_files=False, **source_options
+        ):
+            knowledge = Knowledge(
+                collection_name="incremental",
+                sources=[TextFileKnowledgeSource(file_paths=paths, **source_options)],
+                embedder={"provider": "custom", "config": {"embedder": embedder}},
+                vector_store=vector_store,
+                purge_removed_files=purge_removed_files,
+            )
+            knowledge.add_sources()
+            return knowledge
+
+        yield build, embedder
+
+
+def test_unchanged_files_are_not_embedded_again(incremental_knowledge, tmp_path):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    second.write_text("Alice's favorite sport is tennis.")
+
+    build([first, second])
+    assert len(embedder.embedded) == 2
+
+    embedder.embedded.clear()
+    build([first, second])
+    assert embedder.embedded == []
+
+    second.write_text("Alice's favorite sport is volleyball.")
+    knowledge = build([first, second])
+    assert embedder.embedded == ["Alice's favorite sport is volleyball."]
+    assert knowledge.storage.collection.count() == 2
+
+
+def test_removed_files_are_purged(incremental_knowledge, tmp_path):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    second.write_text("Alice's favorite sport is tennis.")
+    build([first, second])
+
+    embedder.embedded.clear()
+    knowledge = build([first], purge_removed_files=True)
+
+    assert embedder.embedded == []
+    assert knowledge.storage.collection.get()["documents"] == [
+        "Brandon's favorite sport is basketball."
+    ]
+    assert knowledge.storage.manifest.paths() == [str(first.resolve())]
+
+
+def test_files_of_knowledge_sharing_the_collection_are_kept(
+    incremental_knowledge, tmp_path
+):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    second.write_text("Alice's favorite sport is tennis.")
+    build([first])
+
+    knowledge = build([second])
+
+    assert knowledge.storage.collection.count() == 2
+    assert sorted(knowledge.storage.manifest.paths()) == sorted(
+        [str(first.resolve()), str(second.resolve())]
+    )
+
+
+def test_files_are_saved_again_when_their_chunks_are_missing(
+    incremental_knowledge, tmp_path
+):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    knowledge = build([first])
+    collection = knowledge.storage.collection
+    collection.delete(ids=collection.get()["ids"])
+
+    embedder.embedded.clear()
+    knowledge = build([first])
+
+    assert embedder.embedded == ["Brandon's favorite sport is basketball."]
+    assert knowledge.storage.collection.count() == 1
+
+
+def test_files_are_saved_again_for_another_embedder(incremental_knowledge, tmp_path):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    build([first])
+
+    class OtherEmbedder(CountingEmbedder):
+        pass
+
+    other = OtherEmbedder()
+    Knowledge(
+        collection_name="incremental",
+        sources=[TextFileKnowledgeSource(file_paths=[first])],
+        embedder={"provider": "custom", "config": {"embedder": other}},
+    ).add_sources()
+
+    assert other.embedded == ["Brandon's favorite sport is basketball."]
+
+
+def test_chunk_stream_matches_chunk_text():
+    source = StringKnowledgeSource(content="unused", chunk_size=10, chunk_overlap=3)
+    text = "".join(chr(ord("a") + i % 26) for i in range(137))
+    segments = [text[i : i + 7] for i in range(0, len(text), 7)] + [""]
+
+    assert list(source._chunk_stream(segments)) == source._chunk_text(text)
+    assert list(source._chunk_stream([text])) == source._chunk_text(text)
+    assert list(source._chunk_stream([])) == []
+
+
+def test_streaming_source_saves_files_without_keeping_them(
+    incremental_knowledge, tmp_path
+):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+
+    knowledge = build([first], streaming=True)
+    source = knowledge.sources[0]
+
+    assert source.content == {}
+    assert source.chunks == []
+    assert embedder.embedded == ["Brandon's favorite sport is basketball."]
+
+    embedder.embedded.clear()
+    build([first], streaming=True)
+    assert embedder.embedded == []
+
+
+def test_files_loaded_on_a_process_pool_keep_their_order(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"data_{i}.csv"
+        path.write_text(f"Name,Index\nrow,{i}\n")
+        paths.append(path)
+
+    serial = CSVKnowledgeSource(file_paths=paths)
+    parallel = CSVKnowledgeSource(file_paths=paths, load_workers=2)
+
+    assert list(parallel.content) == paths
+    assert parallel.content == serial.content
+    assert serial.content[paths[3]] == "Name Index\nrow 3\n"
+
+
+def test_local_vector_store_knowledge(incremental_knowledge, tmp_path):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    second.write_text("Alice's favorite sport is tennis.")
+
+    knowledge = build([first, second], vector_store="local")
+    results = knowledge.query(["Brandon's favorite sport"], score_threshold=0)
+
+    assert isinstance(knowledge.storage, LocalKnowledgeStorage)
+    assert {result["context"] for result in results} == {
+        "Brandon's favorite sport is basketball.",
+        "Alice's favorite sport is tennis.",
+    }
+
+    embedder.embedded.clear()
+    knowledge = build([first], vector_store="local", purge_removed_files=True)
+    assert embedder.embedded == []
+    assert knowledge.storage.collection.get()["documents"] == [
+        "Brandon's favorite sport is basketball."
+    ]
+
+    knowledge.reset()
+    assert build([first], vector_store="local").storage.collection.count() == 1
+
+
+def test_files_saved_in_chroma_are_saved_again_in_the_local_store(
+    incremental_knowledge, tmp_path
+):
+    build, embedder = incremental_knowledge
+    first = tmp_path / "first.txt"
+    first.write_text("Brandon's favorite sport is basketball.")
+    build([first])
+
+    embedder.embedded.clear()
+    knowledge = build([first], vector_store="local")
+
+    assert embedder.embedded == ["Brandon's favorite sport is basketball."]
+    assert knowledge.storage.collection.count() == 1
+    assert str(tmp_path) in knowledge.storage._base_path()
@@ -0,0 +1,127 @@
+import pytest
+
+from crewai.knowledge.chunking import (
+    CharacterChunker,
+    MarkdownChunker,
+    RowChunker,
+    SentenceChunker,
+    Span,
+    TokenChunker,
+)
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+
+MARKDOWN = """# Setup
+
+Install the package with pip. Then create a crew.
+
+| Option | Default |
+| ------ | ------- |
+| memory | False   |
+
+# Usage
+
+Run the crew with kickoff.
+"""
+
+
+def _segments(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_character_chunker_matches_fixed_windows():
+    text = "abcdefghijklmnopqrstuvwxyz" * 3
+    chunker = CharacterChunker(chunk_size=10, chunk_overlap=3)
+
+    assert list(chunker.chunks(text)) == [
+        text[i : i + 10] for i in range(0, len(text), 7)
+    ]
+
+
+def test_spans_point_into_the_source_text():
+    text = "First sentence. Second sentence. Third sentence."
+    spans = list(SentenceChunker(chunk_size=20, chunk_overlap=0).spans(text))
+
+    assert spans == [Span(0, 16), Span(16, 17), Span(33, 15)]
+    assert [span.text(text) for span in spans] == [
+        "First sentence. ",
+        "Second sentence. ",
+        "Third sentence.",
+    ]
+
+
+def test_sentence_chunker_packs_whole_sentences_with_overlap():
+    text = "One two. Three four. Five six. Seven eight."
+    chunks = list(SentenceChunker(chunk_size=22, chunk_overlap=12).chunks(text))
+
+    assert chunks == [
+        "One two. Three four. ",
+        "Three four. Five six. ",
+        "Five six. Seven eight.",
+    ]
+
+
+def test_markdown_chunker_keeps_sections_and_tables_whole():
+    chunks = list(MarkdownChunker(chunk_size=120, chunk_overlap=0).chunks(MARKDOWN))
+
+    assert chunks == [
+        "# Setup\n\nInstall the package with pip. Then create a crew.\n\n",
+        "| Option | Default |\n| ------ | ------- |\n| memory | False   |\n\n"
+        "# Usage\n\nRun the crew with kickoff.\n",
+    ]
+
+
+def test_row_chunker_never_splits_rows():
+    rows = [f"row {i},value {i}\n" for i in range(20)]
+    chunks = list(RowChunker(chunk_size=50, chunk_overlap=0).chunks("".join(rows)))
+
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert [row for chunk in chunks for row in chunk.splitlines(True)] == rows
+
+
+def test_oversized_pieces_are_cut_to_the_chunk_size():
+    chunks = list(SentenceChunker(chunk_size=10, chunk_overlap=0).chunks("x" * 25))
+
+    assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_token_chunker_measures_chunks_in_tokens():
+    pytest.importorskip("tiktoken")
+    chunker = TokenChunker(chunk_size=12, chunk_overlap=0)
+    text = "The quick brown fox jumps over the lazy dog. " * 4
+
+    chunks = list(chunker.chunks(text))
+
+    assert chunks == ["The quick brown fox jumps over the lazy dog. "] * 4
+    assert all(chunker.length_function(chunk) <= 12 for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "chunker",
+    [
+        CharacterChunker(chunk_size=40, chunk_overlap=10),
+        SentenceChunker(chunk_size=40, chunk_overlap=10),
+        MarkdownChunker(chunk_size=40, chunk_overlap=10),
+        RowChunker(chunk_size=40, chunk_overlap=10),
+    ],
+)
+@pytest.mark.parametrize("segment_size", [1, 7, 64])
+def test_streamed_chunks_match_chunks_of_the_whole_text(chunker, segment_size):
+    stream = chunker.stream(_segments(MARKDOWN, segment_size))
+
+    assert list(stream) == list(chunker.chunks(MARKDOWN))
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    with pytest.raises(ValueError):
+        SentenceChunker(chunk_size=10, chunk_overlap=10)
+
+
+def test_knowledge_source_uses_its_chunker():
+    source = StringKnowledgeSource(
+        content="unused", chunker=SentenceChunker(chunk_size=20, chunk_overlap=0)
+    )
+
+    assert source._chunk_text("First sentence. Second sentence.") == [
+        "First sentence. ",
+        "Second sentence.",
+    ]
@@ -1,6 +1,6 @@
 import os
 from time import sleep
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import litellm
 import pytest
@@ -210,6 +210,64 @@ def test_llm_passes_additional_params():
         assert result == "Test response"
 
 
+@pytest.mark.asyncio
+async def test_llm_acall_uses_litellm_acompletion():
+    llm = LLM(model="gpt-4o-mini")
+    messages = [{"role": "user", "content": "Hello, world!"}]
+
+    mock_message = MagicMock()
+    mock_message.content = "Test async response"
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+
+    with (
+        patch("litellm.acompletion", new_callable=AsyncMock) as mocked_acompletion,
+        patch("litellm.completion") as mocked_completion,
+    ):
+        mocked_acompletion.return_value = mock_response
+
+        result = await llm.acall(messages)
+
+        mocked_acompletion.assert_awaited_once()
+        mocked_completion.assert_not_called()
+        _, kwargs = mocked_acompletion.call_args
+        assert kwargs["model"] == "gpt-4o-mini"
+        assert kwargs["messages"] == messages
+        assert result == "Test async response"
+
+
+@pytest.mark.asyncio
+async def test_suppress_warnings_restores_streams_after_overlapping_uses():
+    import asyncio
+    import sys
+
+    from crewai.llm import suppress_warnings
+
+    stdout, stderr = sys.stdout, sys.stderr
+    first_entered, second_entered = asyncio.Event(), asyncio.Event()
+    first_exited = asyncio.Event()
+
+    async def first():
+        with suppress_warnings():
+            first_entered.set()
+            await second_entered.wait()
+        first_exited.set()
+
+    async def second():
+        await first_entered.wait()
+        with suppress_warnings():
+            second_entered.set()
+            await first_exited.wait()
+
+    # The first use exits first, not in the reverse order of entering
+    await asyncio.gather(first(), second())
+
+    assert sys.stdout is stdout
+    assert sys.stderr is stderr
+
+
 def test_get_custom_llm_provider_openrouter():
     llm = LLM(model="openrouter/deepseek/deepseek-chat")
     assert llm._get_custom_llm_provider() == "openrouter"
@@ -618,3 +676,56 @@ def test_handle_streaming_tool_calls_no_tools(mock_emit):
         expected_completed_llm_call=1,
         expected_final_chunk_result=response,
     )
+
+
+def test_llm_streaming_stops_when_requested():
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    chunks = [
+        "Thought: t\n",
+        "Action: search\n",
+        'Action Input: {"q": 1}\n',
+        "Observation: made up",
+        " and more",
+    ]
+    consumed = []
+
+    def stream(**kwargs):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield {"choices": [{"delta": {"content": chunk}}]}
+
+    with patch("crewai.llm.litellm.completion", side_effect=stream):
+        response = llm.call("hello", stop_when=lambda chunk: "Observation" in chunk)
+
+    assert response == "".join(chunks[:4])
+    assert len(consumed) == 4
+
+
+def test_llm_streaming_stopped_early_is_closed_and_its_usage_estimated():
+    from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+    from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+    llm = LLM(model="gpt-4o-mini", stream=True)
+    closed = []
+
+    def stream(**kwargs):
+        try:
+            yield {"choices": [{"delta": {"content": "Action: search\n"}}]}
+            yield {"choices": [{"delta": {"content": "Observation: made up"}}]}
+            yield {"choices": [{"delta": {"content": " and more"}}]}
+        finally:
+            closed.append(True)
+
+    token_process = TokenProcess()
+    with patch("crewai.llm.litellm.completion", side_effect=stream):
+        llm.call(
+            "hello",
+            callbacks=[TokenCalcHandler(token_process)],
+            stop_when=lambda chunk: "Observation" in chunk,
+        )
+
+    assert closed == [True]
+    summary = token_process.get_summary()
+    assert summary.successful_requests == 1
+    assert summary.prompt_tokens > 0
+    assert summary.completion_tokens > 0
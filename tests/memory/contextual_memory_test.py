@@ -0,0 +1,119 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+from crewai.memory.storage.rag_storage import RAGStorage
+
+
+def _rag_storage(embedder_source=None):
+    storage = MagicMock(spec=RAGStorage)
+    storage.embedder_source = embedder_source
+    storage.embed_query.return_value = [0.1, 0.2, 0.3]
+    return storage
+
+
+@pytest.fixture
+def memories():
+    stm = MagicMock()
+    stm.storage = _rag_storage()
+    stm.search.return_value = [{"context": "recent insight"}]
+
+    ltm = MagicMock()
+    ltm.search.return_value = [{"metadata": {"suggestions": ["past suggestion"]}}]
+
+    em = MagicMock()
+    em.storage = _rag_storage()
+    em.search.return_value = [{"context": "an entity"}]
+
+    exm = MagicMock()
+    exm.search.return_value = [{"memory": "external fact"}]
+    return stm, ltm, em, exm
+
+
+def _contextual_memory(memories, **config):
+    stm, ltm, em, exm = memories
+    return ContextualMemory(config, stm, ltm, em, None, exm)
+
+
+def _task(description="Research AI agents"):
+    task = MagicMock()
+    task.description = description
+    return task
+
+
+def test_concurrent_retrieval_matches_sequential_output(memories):
+    sequential = _contextual_memory(memories).build_context_for_task(_task(), "")
+    concurrent = _contextual_memory(
+        memories, concurrent_retrieval=True
+    ).build_context_for_task(_task(), "")
+
+    assert concurrent == sequential
+    assert concurrent == (
+        "Historical Data:\n- past suggestion\n"
+        "Recent Insights:\n- recent insight\n"
+        "Entities:\n- an entity\n"
+        "External memories:\n- external fact"
+    )
+
+
+def test_concurrent_retrieval_embeds_query_once(memories):
+    stm, _, em, _ = memories
+    _contextual_memory(memories, concurrent_retrieval=True).build_context_for_task(
+        _task(), "more context"
+    )
+
+    stm.storage.embed_query.assert_called_once_with("Research AI agents more context")
+    em.storage.embed_query.assert_not_called()
+    stm.search.assert_called_once_with(
+        "Research AI agents more context", query_embedding=[0.1, 0.2, 0.3]
+    )
+    em.search.assert_called_once_with(
+        "Research AI agents more context", query_embedding=[0.1, 0.2, 0.3]
+    )
+
+
+def test_concurrent_retrieval_does_not_share_embeddings_across_embedders(memories):
+    stm, _, em, _ = memories
+    em.storage = _rag_storage(embedder_source={"provider": "ollama"})
+
+    _contextual_memory(memories, concurrent_retrieval=True).build_context_for_task(
+        _task(), ""
+    )
+
+    stm.storage.embed_query.assert_not_called()
+    stm.search.assert_called_once_with("Research AI agents")
+    em.search.assert_called_once_with("Research AI agents")
+
+
+def test_concurrent_retrieval_skips_stores_that_time_out(memories):
+    _, ltm, _, _ = memories
+
+    def slow_search(*args, **kwargs):
+        time.sleep(1)
+        return [{"metadata": {"suggestions": ["too late"]}}]
+
+    ltm.search.side_effect = slow_search
+
+    start = time.monotonic()
+    context = _contextual_memory(
+        memories, concurrent_retrieval=True, retrieval_timeout=0.2
+    ).build_context_for_task(_task(), "")
+
+    assert time.monotonic() - start < 0.9
+    assert "too late" not in context
+    assert "Recent Insights:\n- recent insight" in context
+    assert "External memories:\n- external fact" in context
+
+
+def test_concurrent_retrieval_skips_stores_that_fail(memories):
+    _, _, em, _ = memories
+    em.search.side_effect = RuntimeError("store unavailable")
+
+    context = _contextual_memory(
+        memories, concurrent_retrieval=True
+    ).build_context_for_task(_task(), "")
+
+    assert "Entities" not in context
+    assert "Recent Insights:\n- recent insight" in context
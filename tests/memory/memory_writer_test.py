@@ -0,0 +1,102 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.agent import Agent
+from crewai.agents.agent_builder.base_agent_executor_mixin import (
+    CrewAgentExecutorMixin,
+)
+from crewai.crew import Crew
+from crewai.memory.memory_writer import MemoryWriter
+from crewai.task import Task
+
+
+def test_writes_run_in_order_on_a_background_thread():
+    writer = MemoryWriter()
+    calls = []
+
+    for i in range(5):
+        writer.submit(lambda i=i: calls.append((i, threading.current_thread().name)))
+
+    assert writer.flush(timeout=5)
+    assert [i for i, _ in calls] == list(range(5))
+    assert {name for _, name in calls} == {"crewai-memory-writer"}
+    assert writer.pending == 0
+
+
+def test_flush_times_out_while_a_write_is_running():
+    writer = MemoryWriter()
+    release = threading.Event()
+    writer.submit(release.wait)
+
+    assert not writer.flush(timeout=0.1)
+    assert writer.pending == 1
+
+    release.set()
+    assert writer.flush(timeout=5)
+
+
+def test_failing_write_does_not_stop_the_queue():
+    writer = MemoryWriter()
+    calls = []
+
+    def fail():
+        raise RuntimeError("storage unavailable")
+
+    writer.submit(fail)
+    writer.submit(lambda: calls.append("saved"))
+
+    assert writer.flush(timeout=5)
+    assert calls == ["saved"]
+
+
+def test_invalid_sizes_raise():
+    with pytest.raises(ValueError):
+        MemoryWriter(max_queue_size=0)
+
+
+class _Executor(CrewAgentExecutorMixin):
+    def __init__(self, crew, agent, task):
+        self.crew = crew
+        self.agent = agent
+        self.task = task
+
+
+def test_short_term_memory_is_written_behind_the_task():
+    release = threading.Event()
+    crew = MagicMock()
+    crew._memory_writer = MemoryWriter()
+    crew._short_term_memory.save.side_effect = lambda **kwargs: release.wait(5)
+    task = MagicMock(description="Summarize the report")
+    agent = MagicMock(role="Writer")
+    executor = _Executor(crew, agent, task)
+
+    executor._create_short_term_memory(MagicMock(text="The summary"))
+    # Later changes to the executor must not leak into the queued write.
+    executor.task = MagicMock(description="Another task")
+
+    assert crew._memory_writer.pending == 1
+    release.set()
+    assert crew._memory_writer.flush(timeout=5)
+    crew._short_term_memory.save.assert_called_once_with(
+        value="The summary",
+        metadata={"observation": "Summarize the report"},
+        agent="Writer",
+    )
+
+
+def test_crew_write_behind_memory_config():
+    agent = Agent(role="Researcher", goal="Research", backstory="A researcher")
+    task = Task(description="Research", expected_output="Findings", agent=agent)
+
+    crew = Crew(agents=[agent], tasks=[task])
+    assert crew._memory_writer is None
+    assert crew.flush_memories()
+
+    crew = Crew(agents=[agent], tasks=[task], memory_config={"write_behind": True})
+    assert isinstance(crew._memory_writer, MemoryWriter)
+    calls = []
+    crew._memory_writer.submit(lambda: calls.append("saved"))
+    assert crew.flush_memories(timeout=5)
+    assert calls == ["saved"]
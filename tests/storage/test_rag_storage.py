@@ -0,0 +1,165 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.memory.entity.entity_memory import EntityMemory
+from crewai.memory.entity.entity_memory_item import EntityMemoryItem
+from crewai.memory.storage.local_rag_storage import LocalRAGStorage
+from crewai.memory.storage.rag_storage import RAGStorage, rag_storage_class
+from crewai.utilities.local_vector_store import LocalVectorCollection
+
+
+class CountingEmbedder(EmbeddingFunction):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(text)), 1.0, 0.0] for text in input]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+def _storage(tmp_path, embedder, cls=RAGStorage, **kwargs):
+    return cls(
+        type="short_term",
+        embedder_config={"provider": "custom", "config": {"embedder": embedder}},
+        path=str(tmp_path),
+        **kwargs,
+    )
+
+
+def test_save_many_embeds_items_in_one_call(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder)
+    embedder.calls.clear()
+
+    storage.save_many(["first", "second", "third"], [{"n": 1}, {"n": 2}, {"n": 3}])
+
+    assert embedder.calls == [["first", "second", "third"]]
+    assert storage.collection.count() == 3
+
+
+def test_buffered_saves_are_written_once_batch_size_is_reached(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder, batch_size=3)
+    embedder.calls.clear()
+
+    storage.save("first", {})
+    storage.save("second", {})
+    assert embedder.calls == []
+    assert storage.collection.count() == 0
+
+    storage.save("third", {})
+    assert embedder.calls == [["first", "second", "third"]]
+    assert storage.collection.count() == 3
+
+
+def test_buffered_saves_are_written_after_batch_interval(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder, batch_size=10, batch_interval=0.1)
+
+    storage.save("first", {})
+    deadline = time.monotonic() + 5
+    while storage.collection.count() == 0 and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert storage.collection.count() == 1
+
+
+def test_search_flushes_buffered_saves(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder, batch_size=10, batch_interval=60)
+
+    storage.save("buffered insight", {"task": "research"})
+    results = storage.search("buffered insight", score_threshold=0)
+
+    assert [result["context"] for result in results] == ["buffered insight"]
+
+
+def test_buffered_saves_are_written_at_exit(tmp_path, embedder):
+    from crewai.memory.storage.rag_storage import _flush_buffered_storages
+
+    storage = _storage(tmp_path, embedder, batch_size=10, batch_interval=60)
+
+    storage.save("buffered insight", {})
+    # The timer doesn't keep the interpreter alive until it fires
+    assert storage._flush_timer.daemon
+    _flush_buffered_storages()
+
+    assert storage.collection.count() == 1
+
+
+def test_entity_memory_save_many(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder)
+    memory = EntityMemory(storage=storage)
+    embedder.calls.clear()
+
+    memory.save_many(
+        [
+            EntityMemoryItem(
+                name="CrewAI",
+                type="Framework",
+                description="Multi-agent framework",
+                relationships="",
+            ),
+            EntityMemoryItem(
+                name="Python",
+                type="Language",
+                description="Programming language",
+                relationships="",
+            ),
+        ]
+    )
+
+    assert embedder.calls == [
+        [
+            "CrewAI(Framework): Multi-agent framework",
+            "Python(Language): Programming language",
+        ]
+    ]
+
+
+def test_repeated_searches_embed_the_query_once(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder)
+    storage.save("stored insight", {"task": "research"})
+    embedder.calls.clear()
+
+    storage.search("repeated query", score_threshold=0)
+    storage.search("repeated query", score_threshold=0)
+
+    assert embedder.calls == [["repeated query"]]
+
+
+def test_search_filters_on_metadata(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder)
+    storage.save_many(
+        ["first insight", "second insight"], [{"agent": "a"}, {"agent": "b"}]
+    )
+
+    results = storage.search("insight", score_threshold=0, filter={"agent": "b"})
+
+    assert [result["context"] for result in results] == ["second insight"]
+
+
+def test_local_storage_saves_and_searches_in_process(tmp_path, embedder):
+    storage = _storage(tmp_path, embedder, cls=LocalRAGStorage)
+
+    storage.save_many(["first insight", "second"], [{"task": "a"}, {}])
+    results = storage.search("first insight", score_threshold=0)
+
+    assert storage.app is None
+    assert isinstance(storage.collection, LocalVectorCollection)
+    assert [result["context"] for result in results] == ["first insight", "second"]
+    assert results[0]["metadata"] == {"task": "a"}
+
+    storage.reset()
+    assert storage.collection.count() == 0
+
+
+def test_memory_config_selects_the_vector_store():
+    crew = SimpleNamespace(memory_config={"vector_store": "local"})
+
+    assert rag_storage_class(crew) is LocalRAGStorage
+    assert rag_storage_class(SimpleNamespace(memory_config=None)) is RAGStorage
@@ -1,8 +1,10 @@
 """Test Agent creation and execution basic functionality."""
 
+import asyncio
 import hashlib
 import json
 import os
+import threading
 import time
 from functools import partial
 from typing import Tuple, Union
@@ -1493,3 +1495,31 @@ def test_task_interpolation_with_hyphens():
     assert "say hello world" in task.prompt()
 
     assert result.raw == "Hello, World!"
+
+
+@pytest.mark.asyncio
+async def test_aexecute_runs_guardrail_and_callback_off_the_event_loop():
+    threads = []
+
+    def guardrail(output: TaskOutput) -> Tuple[bool, str]:
+        threads.append(threading.current_thread())
+        return (True, output.raw)
+
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(
+        description="Test task",
+        expected_output="Output",
+        agent=agent,
+        guardrail=guardrail,
+        callback=lambda output: threads.append(threading.current_thread()),
+    )
+
+    async def aexecute_task(task, context=None, tools=None):
+        return "result"
+
+    with patch.object(Agent, "aexecute_task", side_effect=aexecute_task):
+        output = await task.aexecute()
+
+    assert output.raw == "result"
+    assert len(threads) == 2
+    assert threading.current_thread() not in threads
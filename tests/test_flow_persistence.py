@@ -1,7 +1,9 @@
 """Test flow state persistence functionality."""
 
+import asyncio
 import os
-from typing import Dict
+import sqlite3
+from typing import Dict, List
 
 import pytest
 from pydantic import BaseModel
@@ -208,3 +210,112 @@ def test_persist_decorator_verbose_logging(tmp_path, caplog):
     flow = VerboseFlow(persistence=persistence)
     flow.kickoff()
     assert "Saving flow state" in caplog.text
+
+
+def _stored_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT method_name, is_delta FROM flow_states ORDER BY id"
+        ).fetchall()
+
+
+class DocumentState(FlowState):
+    documents: List[str] = []
+
+
+def test_delta_persistence_restores_the_state(tmp_path):
+    """Test that delta mode stores changes and replays them on load."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+
+    @persist(persistence)
+    class DocumentFlow(Flow[DocumentState]):
+        @start()
+        def fetch(self):
+            self.state.documents.append("first")
+
+        @listen(fetch)
+        def enrich(self):
+            self.state.documents.append("second")
+
+    flow = DocumentFlow()
+    flow.kickoff()
+
+    assert _stored_rows(db_path) == [("fetch", 0), ("enrich", 1)]
+    assert persistence.load_state(flow.state.id) == flow.state.model_dump()
+
+    restored = DocumentFlow()
+    restored.kickoff(inputs={"id": flow.state.id})
+    assert restored.state.documents == ["first", "second"] * 2
+
+
+def test_delta_persistence_compacts_into_snapshots(tmp_path):
+    """Test that a snapshot replaces the deltas every snapshot_interval saves."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta", snapshot_interval=2)
+
+    for counter in range(5):
+        persistence.save_state("flow-id", f"step_{counter}", {"counter": counter})
+
+    assert _stored_rows(db_path) == [("step_0", 0), ("step_3", 0), ("step_4", 1)]
+    assert persistence.load_state("flow-id") == {"counter": 4}
+
+
+def test_delta_persistence_keeps_the_json_type_of_values(tmp_path):
+    """Test that values Python finds equal but JSON doesn't are saved as deltas."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+
+    for value in [1, True, 1.0, [0], [False]]:
+        persistence.save_state("flow-id", "step", {"x": value})
+        loaded = persistence.load_state("flow-id")["x"]
+        assert type(loaded) is type(value) and loaded == value
+
+
+def test_saves_from_the_event_loop_are_batched(tmp_path):
+    """Test that states saved in the same loop iteration are written together."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+
+    async def save_twice():
+        persistence.save_state("flow-id", "step_1", {"counter": 1})
+        persistence.save_state("flow-id", "step_2", {"counter": 2})
+        written_before = _stored_rows(db_path)
+        await asyncio.sleep(0)
+        return written_before, _stored_rows(db_path)
+
+    written_before, written_after = asyncio.run(save_twice())
+
+    assert written_before == []
+    assert written_after == [("step_1", 0), ("step_2", 1)]
+
+
+def test_full_persistence_writes_saves_from_the_event_loop_at_once(tmp_path):
+    """Test that full mode doesn't defer saves, so write errors reach them."""
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(db_path)
+
+    async def save():
+        persistence.save_state("flow-id", "step_1", {"counter": 1})
+        return _stored_rows(db_path)
+
+    assert asyncio.run(save()) == [("step_1", 0)]
+
+
+class FailingWrites(SQLiteFlowPersistence):
+    def _write(self, rows):
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+def test_deferred_write_errors_fail_the_kickoff(tmp_path):
+    """Test that a failed deferred write of a method-level @persist is raised."""
+    persistence = FailingWrites(os.path.join(tmp_path, "test_flows.db"), "delta")
+
+    class CounterFlow(Flow[TestState]):
+        @start()
+        @persist(persistence)
+        def step(self):
+            self.state.counter += 1
+
+    with pytest.raises(RuntimeError, match="State persistence failed"):
+        CounterFlow().kickoff()
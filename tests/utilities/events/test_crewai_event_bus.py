@@ -1,7 +1,9 @@
+import threading
 from unittest.mock import Mock
 
 from crewai.utilities.events.base_events import BaseEvent
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
 
 
 class TestEvent(BaseEvent):
@@ -45,3 +47,101 @@ def test_event_bus_error_handling(capfd):
     out, err = capfd.readouterr()
     assert "Simulated handler failure" in out
     assert "Handler 'broken_handler' failed" in out
+
+
+class ChildTestEvent(TestEvent):
+    pass
+
+
+def test_dispatch_table_is_rebuilt_when_handlers_change():
+    calls = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent)
+        def parent_handler(source, event):
+            calls.append("parent")
+
+        crewai_event_bus.emit("source_object", ChildTestEvent(type="child_event"))
+        assert calls == ["parent"]
+
+        @crewai_event_bus.on(ChildTestEvent)
+        def child_handler(source, event):
+            calls.append("child")
+
+        crewai_event_bus.emit("source_object", ChildTestEvent(type="child_event"))
+        assert calls == ["parent", "parent", "child"]
+
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+        assert calls == ["parent", "parent", "child", "parent"]
+
+
+def test_emit_without_handlers_skips_dispatch():
+    with crewai_event_bus.scoped_handlers():
+        crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+        assert crewai_event_bus._dispatch_table == {}
+
+
+def test_async_delivery_dispatches_on_worker_and_flushes():
+    handled = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(TestEvent)
+        def handler(source, event):
+            handled.append(threading.current_thread().name)
+
+        crewai_event_bus.enable_async_delivery(batch_size=2)
+        try:
+            for _ in range(5):
+                crewai_event_bus.emit("source_object", TestEvent(type="test_event"))
+            assert crewai_event_bus.flush(timeout=5)
+        finally:
+            crewai_event_bus.disable_async_delivery()
+
+    assert handled == ["crewai-event-bus"] * 5
+
+
+def _fill_queue_while_worker_is_blocked(events, **delivery):
+    release = threading.Event()
+    started = threading.Event()
+    handled = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(BaseEvent)
+        def handler(source, event):
+            started.set()
+            release.wait(5)
+            handled.append(event)
+
+        crewai_event_bus.enable_async_delivery(max_queue_size=2, **delivery)
+        try:
+            crewai_event_bus.emit("source_object", TestEvent(type="blocker"))
+            assert started.wait(5)
+            for event in events:
+                crewai_event_bus.emit("source_object", event)
+            release.set()
+            assert crewai_event_bus.flush(timeout=5)
+        finally:
+            release.set()
+            crewai_event_bus.disable_async_delivery()
+    return handled[1:]
+
+
+def test_async_delivery_drop_policy_discards_events_when_full():
+    dropped = crewai_event_bus.dropped_events
+    events = [TestEvent(type=f"event_{i}") for i in range(4)]
+
+    handled = _fill_queue_while_worker_is_blocked(events, overflow_policy="drop")
+
+    assert [event.type for event in handled] == ["event_0", "event_1"]
+    assert crewai_event_bus.dropped_events == dropped + 2
+
+
+def test_async_delivery_coalesce_policy_merges_stream_chunks():
+    events = [LLMStreamChunkEvent(chunk=chunk) for chunk in ["a", "b", "c", "d"]]
+
+    handled = _fill_queue_while_worker_is_blocked(events, overflow_policy="coalesce")
+
+    assert [event.chunk for event in handled] == ["a", "bcd"]
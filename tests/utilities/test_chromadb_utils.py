@@ -7,6 +7,7 @@ from crewai.utilities.chromadb import (
     MAX_COLLECTION_LENGTH,
     MIN_COLLECTION_LENGTH,
     is_ipv4_pattern,
+    query_collection,
     sanitize_collection_name,
 )
 
@@ -79,3 +80,73 @@ class TestChromadbUtils(unittest.TestCase):
             self.assertLessEqual(len(sanitized), MAX_COLLECTION_LENGTH)
             self.assertTrue(sanitized[0].isalnum())
             self.assertTrue(sanitized[-1].isalnum())
+
+
+class FakeCollection:
+    """Items sorted by distance to any query, like a ChromaDB query returns them."""
+
+    def __init__(self, distances: List[float], metadatas=None):
+        self.distances = distances
+        self.metadatas = metadatas or [{} for _ in distances]
+        self.n_results: List[int] = []
+
+    def count(self) -> int:
+        return len(self.distances)
+
+    def query(self, query_embeddings, n_results, where=None):
+        self.n_results.append(n_results)
+        rows = [
+            i
+            for i, metadata in enumerate(self.metadatas)
+            if not where or all(metadata.get(k) == v for k, v in where.items())
+        ][:n_results]
+        return {
+            "ids": [[f"id{i}" for i in rows]],
+            "documents": [[f"doc{i}" for i in rows]],
+            "metadatas": [[self.metadatas[i] for i in rows]],
+            "distances": [[self.distances[i] for i in rows]],
+        }
+
+
+def test_query_collection_fetches_once_when_results_pass():
+    collection = FakeCollection([0.5, 0.6, 0.7, 0.8])
+
+    results = query_collection(collection, [[1.0]], limit=2, score_threshold=0.35)
+
+    assert collection.n_results == [2]
+    assert results == [
+        {"id": "id0", "metadata": {}, "context": "doc0", "score": 0.5},
+        {"id": "id1", "metadata": {}, "context": "doc1", "score": 0.6},
+    ]
+
+
+def test_query_collection_over_fetches_until_the_limit_is_reached():
+    collection = FakeCollection([0.1] * 6 + [0.5] * 10)
+
+    results = query_collection(collection, [[1.0]], limit=3, score_threshold=0.35)
+
+    assert collection.n_results == [3, 9]
+    assert [result["id"] for result in results] == ["id6", "id7", "id8"]
+
+
+def test_query_collection_stops_when_the_collection_runs_out():
+    collection = FakeCollection([0.1, 0.1, 0.5])
+
+    results = query_collection(collection, [[1.0]], limit=3, score_threshold=0.35)
+
+    assert collection.n_results == [3]
+    assert [result["id"] for result in results] == ["id2"]
+    assert query_collection(FakeCollection([]), [[1.0]]) == []
+
+
+def test_query_collection_filters_on_metadata():
+    collection = FakeCollection(
+        [0.5, 0.6, 0.7], [{"agent": "a"}, {"agent": "b"}, {"agent": "a"}]
+    )
+
+    results = query_collection(
+        collection, [[1.0]], limit=3, score_threshold=0, where={"agent": "a"}
+    )
+
+    assert [result["id"] for result in results] == ["id0", "id2"]
+    assert collection.n_results == [3]
@@ -0,0 +1,128 @@
+import threading
+from unittest.mock import MagicMock
+
+from crewai.utilities.context_window_manager import ContextWindowManager
+
+
+def _llm(window: int = 100) -> MagicMock:
+    llm = MagicMock()
+    llm.model = "gpt-4o-mini"
+    llm.get_context_window_size.return_value = window
+    llm.call.side_effect = lambda messages, callbacks: "short summary"
+    return llm
+
+
+def test_summarize_keeps_system_and_recent_messages():
+    llm = _llm()
+    manager = ContextWindowManager(llm)
+    messages = [
+        {"role": "system", "content": "You are a helpful agent."},
+        {"role": "user", "content": "old " * 60},
+        {"role": "assistant", "content": "older answer " * 30},
+        {"role": "user", "content": "recent question"},
+    ]
+
+    manager.summarize(messages)
+
+    assert messages[0] == {"role": "system", "content": "You are a helpful agent."}
+    assert "short summary" in messages[1]["content"]
+    assert messages[-1] == {"role": "user", "content": "recent question"}
+    assert len(messages) == 3
+
+
+def test_summarize_splits_overflow_into_chunks_by_tokens():
+    llm = _llm(window=100)
+    manager = ContextWindowManager(llm)
+    messages = [
+        {"role": "user", "content": f"topic {i}: " + "word " * 40} for i in range(4)
+    ]
+
+    manager.summarize(messages)
+
+    # The latest message fits in half of the window and is kept. Chunks also
+    # hold at most half of the window, so the three older messages are
+    # summarized one by one.
+    assert llm.call.call_count == 3
+    assert len(messages) == 2
+    assert messages[-1] == {"role": "user", "content": "topic 3: " + "word " * 40}
+
+
+def test_summarize_runs_chunk_summaries_concurrently():
+    llm = _llm(window=100)
+    # Each call waits for the two others, so serial calls would time out.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def call(messages, callbacks):
+        barrier.wait()
+        return "short summary"
+
+    llm.call.side_effect = call
+    manager = ContextWindowManager(llm)
+    messages = [
+        {"role": "user", "content": f"topic {i}: " + "word " * 40} for i in range(4)
+    ]
+
+    manager.summarize(messages)
+
+    assert llm.call.call_count == 3
+    assert not barrier.broken
+
+
+def test_summarize_shrinks_a_summary_too_large_for_the_window():
+    llm = _llm(window=100)
+    llm.call.side_effect = lambda messages, callbacks: (
+        "short summary" if "long" in messages[1]["content"] else "long " * 80
+    )
+    manager = ContextWindowManager(llm)
+    messages = [
+        {"role": "user", "content": "first " * 40},
+        {"role": "assistant", "content": "second " * 40},
+        {"role": "user", "content": "third " * 40},
+    ]
+
+    manager.summarize(messages)
+
+    assert "long" not in messages[0]["content"]
+    assert sum(manager.count_tokens(m["content"]) for m in messages) <= 100
+
+
+def test_summarize_reuses_cached_summaries():
+    llm = _llm()
+    manager = ContextWindowManager(llm)
+    history = [
+        {"role": "user", "content": "first " * 40},
+        {"role": "assistant", "content": "second " * 40},
+        {"role": "user", "content": "third " * 40},
+    ]
+
+    manager.summarize(list(history))
+    calls = llm.call.call_count
+    manager.summarize(list(history))
+
+    assert llm.call.call_count == calls
+
+
+def test_summarize_carries_earlier_summaries_over():
+    llm = _llm()
+    manager = ContextWindowManager(llm)
+    messages = [
+        {"role": "user", "content": "first " * 40},
+        {"role": "assistant", "content": "second " * 40},
+        {"role": "user", "content": "third " * 40},
+    ]
+    manager.summarize(messages)
+    summarized = [call.args[0][1]["content"] for call in llm.call.call_args_list]
+
+    messages += [
+        {"role": "assistant", "content": "fourth " * 40},
+        {"role": "user", "content": "fifth " * 40},
+    ]
+    manager.summarize(messages)
+    new_calls = llm.call.call_args_list[len(summarized) :]
+
+    # Only the messages added since are summarized, not the earlier summary.
+    assert new_calls
+    assert all("short summary" not in call.args[0][1]["content"] for call in new_calls)
+    assert messages[0]["content"].count("short summary") == len(summarized) + len(
+        new_calls
+    )
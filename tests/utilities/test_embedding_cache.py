@@ -0,0 +1,86 @@
+from crewai.utilities.embedding_cache import EmbeddingCache, embedder_key
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_embed_computes_only_missing_texts_in_one_call():
+    cache = EmbeddingCache()
+    embedder = CountingEmbedder()
+
+    assert cache.embed("key", embedder, ["alpha"]) == [[5.0, 1.0]]
+    assert cache.embed("key", embedder, ["alpha", "be", "gamma"]) == [
+        [5.0, 1.0],
+        [2.0, 1.0],
+        [5.0, 1.0],
+    ]
+
+    assert embedder.calls == [["alpha"], ["be", "gamma"]]
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.hit_rate == 0.25
+
+
+def test_entries_are_scoped_by_embedder():
+    cache = EmbeddingCache()
+    embedder = CountingEmbedder()
+
+    cache.embed("openai", embedder, ["query"])
+    cache.embed("ollama", embedder, ["query"])
+
+    assert embedder.calls == [["query"], ["query"]]
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = EmbeddingCache(max_size=2)
+    embedder = CountingEmbedder()
+
+    cache.embed("key", embedder, ["a"])
+    cache.embed("key", embedder, ["b"])
+    cache.embed("key", embedder, ["a"])
+    cache.embed("key", embedder, ["c"])
+    cache.embed("key", embedder, ["a", "b"])
+
+    assert len(cache) == 2
+    assert embedder.calls == [["a"], ["b"], ["c"], ["b"]]
+
+
+def test_clear_resets_entries_and_counters():
+    cache = EmbeddingCache()
+    cache.embed("key", CountingEmbedder(), ["a"])
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.hit_rate) == (0, 0, 0.0)
+
+
+def test_embedder_key_depends_on_config_and_function_class():
+    class OtherEmbedder(CountingEmbedder):
+        pass
+
+    openai = {"provider": "openai", "config": {"model": "text-embedding-3-small"}}
+    assert embedder_key(openai, CountingEmbedder()) == embedder_key(
+        dict(openai), CountingEmbedder()
+    )
+    assert embedder_key(None, CountingEmbedder()) != embedder_key(None, OtherEmbedder())
+    assert embedder_key(openai, CountingEmbedder()) != embedder_key(
+        {"provider": "openai", "config": {"model": "text-embedding-3-large"}},
+        CountingEmbedder(),
+    )
+
+
+def test_persistent_embedder_key_ignores_object_identity():
+    def custom(embedder):
+        return {"provider": "custom", "config": {"embedder": embedder}}
+
+    first, second = CountingEmbedder(), CountingEmbedder()
+    assert embedder_key(custom(first), first) != embedder_key(custom(second), second)
+    assert embedder_key(custom(first), first, persistent=True) == embedder_key(
+        custom(second), second, persistent=True
+    )
@@ -1,9 +1,11 @@
+import json
 import os
+import time
 import unittest
 
 import pytest
 
-from crewai.utilities.file_handler import PickleHandler
+from crewai.utilities.file_handler import FileHandler, PickleHandler
 
 
 class TestPickleHandler(unittest.TestCase):
@@ -43,3 +45,68 @@ class TestPickleHandler(unittest.TestCase):
 
         assert str(exc.value) == "pickle data was truncated"
         assert "<class '_pickle.UnpicklingError'>" == str(exc.type)
+
+
+def test_json_log_is_extended_in_place(tmp_path):
+    path = str(tmp_path / "logs.json")
+    handler = FileHandler(path, buffer_size=2)
+
+    for step in range(5):
+        handler.log(step=step)
+    handler.flush()
+
+    with open(path, encoding="utf-8") as file:
+        content = file.read()
+    entries = json.loads(content)
+    assert [entry["step"] for entry in entries] == list(range(5))
+    assert content == json.dumps(entries, indent=4) + "\n"
+
+
+def test_jsonl_log_appends_one_line_per_entry(tmp_path):
+    path = str(tmp_path / "logs.jsonl")
+    handler = FileHandler(path, flush_interval=0.05)
+
+    handler.log(task="research", status="started")
+    handler.log(task="research", status="completed")
+    time.sleep(0.5)
+
+    with open(path, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert [json.loads(line)["status"] for line in lines] == ["started", "completed"]
+
+
+def test_read_returns_buffered_entries(tmp_path):
+    handler = FileHandler(str(tmp_path / "logs.jsonl"))
+
+    handler.log(status="started")
+
+    assert [entry["status"] for entry in handler.read()] == ["started"]
+
+
+def test_invalid_json_log_is_started_over(tmp_path):
+    path = tmp_path / "logs.json"
+    path.write_text("not json")
+    handler = FileHandler(str(path))
+
+    handler.log(status="started")
+
+    assert [entry["status"] for entry in handler.read()] == ["started"]
+
+
+def test_unserializable_json_entry_fails_to_log(tmp_path):
+    handler = FileHandler(str(tmp_path / "logs.jsonl"))
+
+    with pytest.raises(ValueError, match="Failed to log message"):
+        handler.log(status=object())
+
+    handler.log(status="started")
+    assert [entry["status"] for entry in handler.read()] == ["started"]
+
+
+def test_flush_timer_is_a_daemon_thread(tmp_path):
+    handler = FileHandler(str(tmp_path / "logs.json"), flush_interval=60)
+
+    handler.log(status="started")
+
+    assert handler._flush_timer.daemon
+    handler.flush()
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from crewai.utilities.local_vector_store import (
+    LocalVectorCollection,
+    clear_local_vectors,
+)
+
+
+def embed(documents):
+    return [[float(len(document)), 1.0, 0.0] for document in documents]
+
+
+@pytest.fixture
+def collection(tmp_path):
+    collection = LocalVectorCollection(str(tmp_path), "test", embedding_function=embed)
+    collection.add(
+        ids=["short", "medium", "long"],
+        documents=["a", "abcd", "abcdefghij"],
+        metadatas=[{"kind": "note", "rank": 1}, {"kind": "fact", "rank": 2}, None],
+    )
+    return collection
+
+
+def test_query_returns_nearest_items_first(collection):
+    response = collection.query(query_embeddings=[[4.0, 1.0, 0.0]], n_results=2)
+
+    assert response["ids"] == [["medium", "long"]]
+    assert response["documents"] == [["abcd", "abcdefghij"]]
+    assert response["metadatas"] == [[{"kind": "fact", "rank": 2}, None]]
+    assert response["distances"][0][0] == pytest.approx(0.0, abs=1e-6)
+    assert response["distances"][0][0] < response["distances"][0][1]
+
+
+@pytest.mark.parametrize(
+    "where, expected",
+    [
+        ({"kind": "note"}, ["short"]),
+        ({"rank": {"$gte": 2}}, ["medium"]),
+        ({"kind": {"$in": ["note", "fact"]}}, ["medium", "short"]),
+        ({"$or": [{"kind": "fact"}, {"rank": 1}]}, ["medium", "short"]),
+        ({"$and": [{"kind": "fact"}, {"rank": 1}]}, []),
+    ],
+)
+def test_query_applies_metadata_filters(collection, where, expected):
+    response = collection.query(
+        query_embeddings=[[4.0, 1.0, 0.0]], n_results=3, where=where
+    )
+
+    assert response["ids"] == [expected]
+
+
+def test_add_keeps_existing_items_and_upsert_replaces_them(collection):
+    collection.add(ids=["short"], documents=["changed"])
+    assert collection.get(ids=["short"])["documents"] == ["a"]
+
+    collection.upsert(ids=["short"], documents=["changed"], metadatas=[{"v": 2}])
+    assert collection.get(ids=["short"]) == {
+        "ids": ["short"],
+        "documents": ["changed"],
+        "metadatas": [{"v": 2}],
+    }
+    assert collection.count() == 3
+
+
+def test_deleted_items_are_not_returned(collection):
+    collection.delete(ids=["medium"])
+
+    response = collection.query(query_embeddings=[[4.0, 1.0, 0.0]], n_results=3)
+
+    assert response["ids"] == [["long", "short"]]
+    assert collection.count() == 2
+
+
+def test_items_persist_across_instances(collection, tmp_path):
+    reopened = LocalVectorCollection(str(tmp_path), "test")
+
+    assert reopened.count() == 3
+    assert reopened.query(query_embeddings=[[10.0, 1.0, 0.0]], n_results=1)["ids"] == [
+        ["long"]
+    ]
+
+
+def test_sparse_matrix_file_is_compacted(tmp_path):
+    collection = LocalVectorCollection(str(tmp_path), "test")
+    vectors = np.eye(4, dtype=np.float32)[np.arange(3000) % 4]
+    collection.add(ids=[str(i) for i in range(3000)], embeddings=vectors)
+
+    collection.delete(ids=[str(i) for i in range(2500)])
+
+    assert (tmp_path / "test.f32").stat().st_size == 500 * 4 * 4
+    response = collection.query(query_embeddings=[[0, 0, 1, 0]], n_results=2)
+    assert all(int(item_id) % 4 == 2 for item_id in response["ids"][0])
+
+
+def test_ivf_index_probing_every_list_matches_a_full_scan(tmp_path):
+    vectors = np.random.default_rng(0).standard_normal((400, 8)).astype(np.float32)
+    exact = LocalVectorCollection(str(tmp_path), "vectors", ivf_min_size=None)
+    exact.add(ids=[str(i) for i in range(400)], embeddings=vectors)
+    indexed = LocalVectorCollection(
+        str(tmp_path), "vectors", ivf_min_size=100, ivf_nprobe=1000
+    )
+
+    query = vectors[:3] + 0.01
+
+    assert (
+        indexed.query(query, n_results=5)["ids"]
+        == exact.query(query, n_results=5)["ids"]
+    )
+    assert indexed._centroids is not None
+
+
+def test_clear_local_vectors_deletes_every_collection(collection, tmp_path):
+    clear_local_vectors(str(tmp_path))
+
+    assert collection.count() == 0
+    assert collection.query(query_embeddings=[[1.0, 1.0, 0.0]])["ids"] == [[]]
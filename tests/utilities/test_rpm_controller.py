@@ -0,0 +1,117 @@
+import asyncio
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from crewai.utilities.rpm_controller import RPMController, SQLiteRateLimitBackend
+
+
+def test_rpm_controller_allows_requests_within_budget():
+    controller = RPMController(max_rpm=3)
+
+    with patch.object(RPMController, "_wait") as wait:
+        for _ in range(3):
+            assert controller.check_or_wait()
+        wait.assert_not_called()
+
+
+def test_rpm_controller_waits_only_for_the_missing_capacity():
+    controller = RPMController(max_rpm=60)
+
+    with patch.object(RPMController, "_wait") as wait:
+        for _ in range(62):
+            controller.check_or_wait()
+
+    waits = [call.args[0] for call in wait.call_args_list]
+    # With 60 requests per minute a new slot frees up every second, so the
+    # requests over the budget queue up one second apart instead of a minute.
+    assert len(waits) == 2
+    assert waits[0] == pytest.approx(1, abs=0.1)
+    assert waits[1] == pytest.approx(2, abs=0.1)
+
+
+def test_rpm_controller_without_limits_never_waits():
+    controller = RPMController()
+
+    with patch.object(RPMController, "_wait") as wait:
+        for _ in range(100):
+            controller.check_or_wait()
+        wait.assert_not_called()
+
+
+def test_rpm_controller_waits_while_tokens_budget_is_overdrawn():
+    controller = RPMController(max_tpm=600)
+
+    with patch.object(RPMController, "_wait") as wait:
+        controller.check_or_wait()
+        controller.record_tokens(900)
+        controller.check_or_wait()
+
+    wait.assert_called_once()
+    assert wait.call_args.args[0] == pytest.approx(30, abs=0.1)
+
+
+def test_rpm_controller_acheck_or_wait_sleeps_asynchronously():
+    controller = RPMController(max_rpm=60)
+
+    async def run():
+        with patch("asyncio.sleep") as sleep:
+            await controller.acheck_or_wait()
+            sleep.assert_not_called()
+            for _ in range(59):
+                await controller.acheck_or_wait()
+            await controller.acheck_or_wait()
+            sleep.assert_called_once()
+
+    asyncio.run(run())
+
+
+def test_rpm_controller_shares_budget_through_sqlite(tmp_path):
+    db_path = str(tmp_path / "rate_limits.db")
+    first = RPMController(max_rpm=2, storage_path=db_path)
+    second = RPMController(max_rpm=2, storage_path=db_path)
+
+    with patch.object(RPMController, "_wait") as wait:
+        first.check_or_wait()
+        second.check_or_wait()
+        wait.assert_not_called()
+        first.check_or_wait()
+        wait.assert_called_once()
+
+
+def test_sqlite_backend_raises_the_lock_error_when_it_cannot_begin(tmp_path):
+    backend = SQLiteRateLimitBackend(str(tmp_path / "rate_limits.db"))
+    with sqlite3.connect(tmp_path / "rate_limits.db", timeout=0) as other:
+        other.execute("BEGIN IMMEDIATE")
+        backend._pool.connection().execute("PRAGMA busy_timeout=0")
+
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            backend.update("default", lambda state, now: ({}, 0.0))
+        other.rollback()
+
+
+def test_crew_and_agent_share_budget_through_sqlite(tmp_path):
+    from crewai import Agent, Crew, Task
+
+    db_path = str(tmp_path / "rate_limits.db")
+    agent = Agent(
+        role="Researcher",
+        goal="Research",
+        backstory="A researcher.",
+        max_rpm=1,
+        rate_limit_storage_path=db_path,
+        rate_limit_key="shared",
+    )
+    crew = Crew(
+        agents=[agent],
+        tasks=[Task(description="Research.", expected_output="Notes.", agent=agent)],
+        max_rpm=1,
+        rate_limit_storage_path=db_path,
+        rate_limit_key="shared",
+    )
+
+    with patch.object(RPMController, "_wait") as wait:
+        agent._rpm_controller.check_or_wait()
+        crew._rpm_controller.check_or_wait()
+        wait.assert_called_once()
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+
+import pytest
+
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.utilities.sqlite_pool import SQLitePool, sqlite_pool
+
+
+def test_connection_is_reused_per_thread_and_uses_wal(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"))
+    conn = pool.connection()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert pool.connection() is conn
+    assert other[0] is not conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    pool.close()
+
+
+def test_connection_is_closed_when_its_thread_exits(tmp_path):
+    pool = SQLitePool(str(tmp_path / "pool.db"))
+    connections = []
+
+    def use_pool():
+        connections.append(pool.connection())
+
+    threads = [threading.Thread(target=use_pool) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(pool._holders) == 0
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_shared_pool_per_database_file(tmp_path):
+    path = tmp_path / "shared.db"
+    assert sqlite_pool(str(path)) is sqlite_pool(str(tmp_path / "." / "shared.db"))
+
+
+def test_migrations_run_once_and_in_order(tmp_path):
+    pool = SQLitePool(str(tmp_path / "migrations.db"))
+    migrations = ["CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"]
+    pool.migrate("items", migrations)
+    pool.migrate("items", migrations)
+
+    migrations.append("CREATE INDEX idx_items_name ON items (name)")
+    pool.migrate("items", migrations)
+
+    conn = pool.connection()
+    assert conn.execute(
+        "SELECT version FROM schema_migrations WHERE schema = 'items'"
+    ).fetchone() == (2,)
+    assert conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_items_name'"
+    ).fetchone() == ("idx_items_name",)
+    pool.close()
+
+
+def test_ltm_storage_indexes_task_description_and_saves_in_batches(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "ltm.db"))
+    storage.save_many(
+        [
+            ("Research AI", {"suggestions": ["a"]}, "1", 0.5),
+            ("Research AI", {"suggestions": ["b"]}, "2", 0.9),
+            ("Write report", {"suggestions": ["c"]}, "3", 0.7),
+        ]
+    )
+
+    results = storage.load("Research AI", latest_n=5)
+    assert [result["metadata"]["suggestions"] for result in results] == [["b"], ["a"]]
+
+    plan = (
+        storage._pool.connection()
+        .execute(
+            "EXPLAIN QUERY PLAN SELECT metadata FROM long_term_memories "
+            "WHERE task_description = ? ORDER BY datetime DESC",
+            ("Research AI",),
+        )
+        .fetchall()
+    )
+    assert "idx_long_term_memories_task_description" in str(plan)
+
+
+def test_concurrent_writers_do_not_fail(tmp_path):
+    storage = LTMSQLiteStorage(db_path=str(tmp_path / "concurrent.db"))
+
+    def write(worker):
+        for i in range(20):
+            storage.save(f"task {worker}", {"i": i}, str(i), 1.0)
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(len(storage.load(f"task {w}", latest_n=100)) == 20 for w in range(4))